@@ -0,0 +1,92 @@
+"""Compare page weight and load time of the stock and lean browser profiles.
+
+Logs in once, then loads the same issue pages with a stock Chrome and with
+the lean scraping profile (see BaseScraper._init_driver) and prints bytes
+transferred and load time for each.
+
+Usage:
+    python benchmarks/browser_profile.py [ISSUE_URL ...]
+
+Without URLs the first issues of the configured board are used. Byte counts
+come from the Resource Timing API, so cross-origin responses without
+Timing-Allow-Origin count as 0 and the totals are a lower bound for both runs.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config import settings
+from scraper.jira_scraper import JiraScraper
+from scraper.jira_utils import JiraUtils
+
+TRANSFER_SCRIPT = """
+    const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+    return {
+        bytes: entries.reduce((total, e) => total + (e.transferSize || 0), 0),
+        requests: entries.length
+    };
+"""
+
+
+def measure(driver, urls):
+    """Load every url on driver and return per-page (seconds, bytes, requests)."""
+    results = []
+    for url in urls:
+        start = time.monotonic()
+        driver.get(url)
+        seconds = time.monotonic() - start
+        transfer = driver.execute_script(TRANSFER_SCRIPT)
+        results.append((seconds, transfer["bytes"], transfer["requests"]))
+    return results
+
+
+def summarise(label, results):
+    """Print totals for one profile and return (mean seconds, total bytes)."""
+    mean = sum(r[0] for r in results) / len(results)
+    total = sum(r[1] for r in results)
+    requests = sum(r[2] for r in results)
+    print(f"{label:<8} mean load {mean:6.2f}s | {total / 1024:9.1f} KiB | {requests:5d} requests")
+    return mean, total
+
+
+def main(urls):
+    scraper = JiraScraper(description_workers=1)
+    try:
+        scraper.login()
+        if not urls:
+            jql = settings.JIRA_JQL or JiraUtils.default_jql(scraper.base_url)
+            issues, _ = next(scraper._iter_browser_pages(jql, 10), ([], None))
+            urls = [issue['url'] for issue in issues][:10]
+        cookies = scraper.driver.get_cookies()
+
+        print(f"Benchmarking {len(urls)} pages")
+        summaries = {}
+        profile_dir = settings.BROWSER_PROFILE_DIR
+        try:
+            for label, lean in (("stock", False), ("lean", True)):
+                # Both runs start from an empty profile, so neither gets a warm HTTP cache
+                with tempfile.TemporaryDirectory(prefix=f"benchmark-{label}-") as fresh_dir:
+                    settings.BROWSER_PROFILE_DIR = fresh_dir
+                    driver = scraper._init_driver(scraper.headless, profile_name="benchmark", lean=lean)
+                    try:
+                        JiraUtils.apply_cookies(driver, cookies, scraper.base_url)
+                        summaries[label] = summarise(label, measure(driver, urls))
+                    finally:
+                        driver.quit()
+        finally:
+            settings.BROWSER_PROFILE_DIR = profile_dir
+
+        (stock_time, stock_bytes), (lean_time, lean_bytes) = summaries["stock"], summaries["lean"]
+        print(f"Load time reduced by {100 * (1 - lean_time / stock_time):.0f}%, "
+              f"bytes by {100 * (1 - lean_bytes / max(stock_bytes, 1)):.0f}%")
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
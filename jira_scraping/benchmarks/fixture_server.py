@@ -0,0 +1,288 @@
+"""Local HTTP server that imitates the Jira pages and REST endpoints the scraper reads.
+
+Serves a synthetic project of any size: the issue navigator (/issues/),
+issue pages (/browse/KEY) and the REST search and issue endpoints, all
+generated from the issue number so every run sees identical data. The
+markup copies the data-testid attributes of Jira Cloud that the selectors
+in JiraExtractors, JiraUtils and JiraScraper look for.
+
+latency delays every response on the server side; render_delay makes the
+pages insert their content from a script after that many seconds, like
+Jira's client-side rendering, so the wait logic is exercised too.
+
+Usage:
+    python benchmarks/fixture_server.py [--issues 1000] [--latency 0.05] [--port 8123]
+"""
+
+import argparse
+import html
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+PROJECT = "BENCH"
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+PEOPLE = ["Ada Lovelace", "Grace Hopper", "Alan Turing", "Edsger Dijkstra", "Barbara Liskov"]
+EPOCH = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+class FixtureIssue:
+    """Deterministic fake issue number n (1-based, newest first in listings)."""
+
+    def __init__(self, number):
+        self.number = number
+        self.key = f"{PROJECT}-{number}"
+        self.summary = f"Synthetic issue {number}: {'slow ' if number % 3 == 0 else ''}page under load"
+        self.reporter = PEOPLE[number % len(PEOPLE)]
+        self.priority = PRIORITIES[number % len(PRIORITIES)]
+        self.status = STATUSES[number % len(STATUSES)]
+        self.created = EPOCH + timedelta(hours=number)
+        self.updated = self.created + timedelta(minutes=37 * (number % 11))
+        self.paragraphs = [f"Paragraph {i + 1} of issue {number}. " + "Lorem ipsum dolor sit amet. " * (2 + number % 5)
+                           for i in range(1 + number % 4)]
+        self.code = f"retry(issue={number}, attempts={number % 7})" if number % 2 else None
+        self.comments = [(PEOPLE[(number + i) % len(PEOPLE)], self.updated - timedelta(minutes=5 * i),
+                          f"Comment {i + 1} on {self.key}.") for i in range(number % 6)]
+        self.labels = ["backend", "perf"][:number % 3]
+        self.components = ["scraper"] if number % 2 else []
+        self.links = [("blocks", f"{PROJECT}-{number - 1}")] if number > 1 and number % 4 == 0 else []
+        self.attachments = [f"trace-{number}.log"] if number % 5 == 0 else []
+
+    @staticmethod
+    def display_date(value):
+        """Date as the issue list shows it (e.g. 'Oct 3, 2025, 4:15 PM')."""
+        return f"{value:%b} {value.day}, {value.year}, {value.hour % 12 or 12}:{value:%M} {value:%p}"
+
+    @staticmethod
+    def api_date(value):
+        return value.strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Routes the navigator, issue pages and REST endpoints."""
+
+    server_version = "JiraFixture/1.0"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        self.server.count_request(parts.path)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        path = parts.path.rstrip("/")
+        if path in ("", "/issues"):
+            self._send(200, "text/html", self.server.list_page(int(query.get("startIndex", 0))))
+        elif path.startswith("/browse/"):
+            issue = self.server.issue(path[len("/browse/"):])
+            if issue is None:
+                self._send(404, "text/html", "<html><body>Issue does not exist</body></html>")
+            else:
+                self._send(200, "text/html", self.server.issue_page(issue))
+        elif path == "/rest/api/3/search":
+            start_at = int(query.get("startAt", 0))
+            max_results = int(query.get("maxResults", 50))
+            self._send(200, "application/json", json.dumps(self.server.search_json(start_at, max_results)))
+        elif path.startswith("/rest/api/3/issue/"):
+            issue = self.server.issue(path[len("/rest/api/3/issue/"):])
+            if issue is None:
+                self._send(404, "application/json", json.dumps({"errorMessages": ["Issue does not exist"]}))
+            else:
+                self._send(200, "application/json", json.dumps(self.server.issue_json(issue)))
+        elif path == "/rest/api/3/myself":
+            self._send(200, "application/json", json.dumps({"displayName": "Benchmark"}))
+        else:
+            self._send(404, "text/plain", "not found")
+
+    def _send(self, status, content_type, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would dominate the benchmark output
+
+
+class JiraFixtureServer(ThreadingHTTPServer):
+    """Serves issue_count synthetic issues, page_size per navigator page.
+
+    Use as a context manager; the server runs on a daemon thread and
+    base_url points at it.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, issue_count=1000, page_size=50, latency=0.0, render_delay=0.0, port=0):
+        super().__init__(("127.0.0.1", port), FixtureHandler)
+        self.issue_count = issue_count
+        self.page_size = page_size
+        self.latency = latency
+        self.render_delay = render_delay
+        self.requests = {}
+        self.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count_request(self, path):
+        """Tally requests by kind (issues, browse, rest/search, ...)."""
+        kind = "rest/" + path.split("/")[4] if path.startswith("/rest/api/3/") else path.strip("/").split("/")[0]
+        with self.lock:
+            self.requests[kind or "root"] = self.requests.get(kind or "root", 0) + 1
+
+    def issue(self, key):
+        """The FixtureIssue for key, or None when it is not part of the project."""
+        prefix, _, number = key.partition("-")
+        if prefix != PROJECT or not number.isdigit() or not 1 <= int(number) <= self.issue_count:
+            return None
+        return FixtureIssue(int(number))
+
+    def listed(self, start, count):
+        """Issues in navigator order (created DESC) from offset start."""
+        first = self.issue_count - start
+        return [FixtureIssue(n) for n in range(first, max(first - count, 0), -1)]
+
+    def _page(self, title, body):
+        if self.render_delay:
+            # Insert the content from a script, the way Jira renders on the client
+            body = (f"<div id='app'></div><script>setTimeout(function() {{"
+                    f"document.getElementById('app').innerHTML = {json.dumps(body)};"
+                    f"}}, {int(self.render_delay * 1000)});</script>")
+        return f"<!DOCTYPE html><html><head><title>{html.escape(title)}</title></head><body>{body}</body></html>"
+
+    def list_page(self, start):
+        # Like the real navigator, an offset past the end shows the last page again
+        if start >= self.issue_count:
+            start = max(0, (self.issue_count - 1) // self.page_size * self.page_size)
+        rows = []
+        for issue in self.listed(start, self.page_size):
+            rows.append(
+                f"<div data-testid='issue-list.ui.list-item'>"
+                f"<a href='/browse/{issue.key}'>{issue.key}</a>"
+                f"<span data-testid='issue-list.summary'>{html.escape(issue.summary)}</span>"
+                f"<button aria-label='{issue.reporter} - edit Reporter'></button>"
+                f"<span data-testid='issue-list.priority'>{issue.priority}</span>"
+                f"<div data-testid='issue-list.status'><span>{issue.status}</span></div>"
+                f"<div data-testid='issue-field-inline-edit-read-view-container.ui.container'>"
+                f"<button aria-label='Edit Created'></button>{FixtureIssue.display_date(issue.created)}</div>"
+                f"<div data-testid='issue-field-inline-edit-read-view-container.ui.container'>"
+                f"<button aria-label='Edit Updated'></button>{FixtureIssue.display_date(issue.updated)}</div>"
+                f"</div>"
+            )
+        return self._page(f"Issues - {PROJECT}", "".join(rows))
+
+    def issue_page(self, issue):
+        description = "".join(
+            f"<p data-renderer-start-pos='{1 if i == 0 else 100 * i}'>{html.escape(p)}</p>"
+            for i, p in enumerate(issue.paragraphs)
+        )
+        if issue.code:
+            description += f"<pre><code>{html.escape(issue.code)}</code></pre>"
+        comments = "".join(
+            f"<div data-testid='issue-comment-base.ui.comment.comment-base-item' id='comment-{i + 1}'>"
+            f"<span data-testid='issue-comment-base.ui.comment.author'>{author}</span>"
+            f"<time datetime='{FixtureIssue.api_date(created)}'>{FixtureIssue.display_date(created)}</time>"
+            f"<div class='ak-renderer-document'><p>{html.escape(body)}</p></div></div>"
+            for i, (author, created, body) in enumerate(issue.comments)
+        )
+        labels = "".join(f"<a href='/issues/?jql=labels%3D{label}'>{label}</a>" for label in issue.labels)
+        components = "".join(f"<span title='{c}'>{c}</span>" for c in issue.components)
+        links = "".join(f"<div data-testid='issue-links.group'><h3>{relation}</h3>"
+                        f"<a href='/browse/{key}'>{key}</a></div>" for relation, key in issue.links)
+        attachments = "".join(f"<a href='/rest/api/3/attachment/content/{issue.number}' download='{name}'>{name}</a>"
+                              for name in issue.attachments)
+        body = (
+            f"<h1 data-testid='issue.views.issue-base.foundation.summary.heading'>{html.escape(issue.summary)}</h1>"
+            f"<div data-testid='issue.views.issue-base.foundation.description.description-content'>{description}</div>"
+            f"<div data-testid='issue.views.field.labels'>{labels}</div>"
+            f"<div data-testid='issue.views.field.components'>{components}</div>"
+            f"<div data-testid='issue.views.issue-base.content.issue-links'>{links}</div>"
+            f"<div data-testid='issue.views.issue-base.content.attachments'>{attachments}</div>"
+            f"<div data-testid='issue.activity.comments-list'>{comments}</div>"
+        )
+        return self._page(f"[{issue.key}] {issue.summary}", body)
+
+    def search_json(self, start_at, max_results):
+        return {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": self.issue_count,
+            "issues": [{
+                "key": issue.key,
+                "fields": {
+                    "summary": issue.summary,
+                    "reporter": {"displayName": issue.reporter},
+                    "priority": {"name": issue.priority},
+                    "status": {"name": issue.status},
+                    "created": FixtureIssue.api_date(issue.created),
+                    "updated": FixtureIssue.api_date(issue.updated),
+                },
+            } for issue in self.listed(start_at, max_results)],
+        }
+
+    def issue_json(self, issue):
+        def doc(*blocks):
+            return {"type": "doc", "version": 1, "content": list(blocks)}
+
+        def paragraph(text):
+            return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+        blocks = [paragraph(p) for p in issue.paragraphs]
+        if issue.code:
+            blocks.append({"type": "codeBlock", "content": [{"type": "text", "text": issue.code}]})
+        return {
+            "key": issue.key,
+            "fields": {
+                "description": doc(*blocks),
+                "comment": {"comments": [{
+                    "author": {"displayName": author},
+                    "created": FixtureIssue.api_date(created),
+                    "body": doc(paragraph(body)),
+                } for author, created, body in issue.comments]},
+                "labels": issue.labels,
+                "components": [{"name": c} for c in issue.components],
+                "issuelinks": [{"type": {"outward": relation, "inward": f"is {relation} by"}, "outwardIssue": {"key": key}}
+                               for relation, key in issue.links],
+                "attachment": [{"filename": name, "content": f"{self.base_url}/rest/api/3/attachment/content/{issue.number}"}
+                               for name in issue.attachments],
+            },
+        }
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic Jira project for benchmarks.")
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--render-delay", type=float, default=0.0, help="seconds before pages render their content")
+    parser.add_argument("--port", type=int, default=8123)
+    args = parser.parse_args()
+    with JiraFixtureServer(args.issues, args.page_size, args.latency, args.render_delay, args.port) as server:
+        print(f"Serving {args.issues} issues at {server.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
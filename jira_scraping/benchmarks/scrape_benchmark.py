@@ -0,0 +1,257 @@
+"""End-to-end scrape benchmark against the local Jira fixture server.
+
+Starts benchmarks/fixture_server.py with the requested number of issues and
+latency, runs JiraScraper over the whole project and reports issues/sec,
+time spent listing and fetching details, WebDriver commands sent and peak
+memory. Results can be saved as a baseline and later runs compared to it,
+so a change to the extractors, row discovery or waits shows up as a number.
+
+Usage:
+    python benchmarks/scrape_benchmark.py [--issues 500] [--latency 0.02] [--mode browser|rest]
+                                          [--workers 1] [--save-baseline] [--tolerance 0.15]
+
+Baselines live in benchmarks/baselines/<mode>-<issues>.json. They are only
+comparable on the machine that recorded them. The run exits with status 1
+when throughput drops or the command count grows beyond the tolerance.
+No Jira account is needed: login is skipped and the cache, checkpoints,
+incremental state and rate limiting are turned off so every run does the
+full work at full speed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config import settings
+from scraper.jira_scraper import JiraScraper
+from scraper.rate_limit import rate_limiters
+from fixture_server import PROJECT, JiraFixtureServer
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+class CommandCounter:
+    """Counts every WebDriver command (find_element, get, execute_script...) of every driver."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        self.original = None
+
+    def __enter__(self):
+        self.original = WebDriver.execute
+        counter = self
+
+        def execute(driver, driver_command, params=None):
+            with counter.lock:
+                counter.counts[driver_command] += 1
+            return counter.original(driver, driver_command, params)
+
+        WebDriver.execute = execute
+        return self
+
+    def __exit__(self, *exc):
+        WebDriver.execute = self.original
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+
+class BrowserMemorySampler:
+    """Samples the resident memory of the chromedriver/Chrome process tree (needs psutil)."""
+
+    def __init__(self, interval=0.5):
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        self.psutil = psutil
+        self.interval = interval
+        self.peak = None
+        self.stop = threading.Event()
+        self.thread = None
+
+    def __enter__(self):
+        if self.psutil is not None:
+            self.peak = 0
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self
+
+    def _run(self):
+        me = self.psutil.Process()
+        while not self.stop.wait(self.interval):
+            total = 0
+            for child in me.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except self.psutil.Error:
+                    continue
+            self.peak = max(self.peak, total)
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        if self.thread is not None:
+            self.thread.join()
+
+
+def timed(function, phases, name):
+    """Wrap a generator function so the time spent producing its items adds to phases[name]."""
+    def wrapper(*args, **kwargs):
+        iterator = function(*args, **kwargs)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                phases[name] += time.perf_counter() - start
+            yield item
+    return wrapper
+
+
+def run(args):
+    """Scrape the fixture project once and return the measurements."""
+    # Cold, repeatable runs: nothing may be skipped because of earlier runs
+    settings.RESPONSE_CACHE = False
+    settings.BROWSER_PROFILE_DIR = ""
+    rate_limiters.enabled = False  # measure the scraper, not the politeness limits
+
+    with JiraFixtureServer(args.issues, args.page_size, args.latency, args.render_delay) as server:
+        settings.JIRA_URL = server.base_url
+
+        with CommandCounter() as commands, BrowserMemorySampler() as browser_memory:
+            started = time.perf_counter()
+            scraper = JiraScraper(headless=True, description_workers=args.workers,
+                                  use_rest_api=args.mode == "rest", incremental=False, checkpointing=False)
+            startup = time.perf_counter() - started
+            phases = Counter()
+            scraper.login_handler.login_done = True  # the fixture server needs no session
+            scraper._iter_browser_pages = timed(scraper._iter_browser_pages, phases, "listing")
+            scraper._iter_api_pages = timed(scraper._iter_api_pages, phases, "listing")
+            scraper._complete_issues = timed(scraper._complete_issues, phases, "details")
+            try:
+                crawl_started = time.perf_counter()
+                scraped = sum(1 for _ in scraper.iter_issues(f'project = "{PROJECT}" ORDER BY created DESC',
+                                                             args.page_size))
+                crawl = time.perf_counter() - crawl_started
+                error = scraper.last_error
+            finally:
+                scraper.close()
+
+    if error is not None:
+        raise RuntimeError(f"Benchmark crawl failed: {error}")
+    if scraped != args.issues:
+        print(f"WARNING: scraped {scraped} of {args.issues} issues")
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "mode": args.mode,
+        "issues": scraped,
+        "workers": args.workers,
+        "latency": args.latency,
+        "render_delay": args.render_delay,
+        "issues_per_sec": scraped / crawl if crawl else 0.0,
+        "seconds": {"startup": startup, "crawl": crawl, **phases},
+        "webdriver_commands": commands.total,
+        "commands_per_issue": commands.total / max(scraped, 1),
+        "top_commands": dict(commands.counts.most_common(8)),
+        "http_requests": dict(server.requests),
+        "peak_rss_mb": rss / 2**20,
+        "peak_browser_rss_mb": browser_memory.peak / 2**20 if browser_memory.peak is not None else None,
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def report(result):
+    seconds = result["seconds"]
+    print(f"\n=== Scrape benchmark: {result['mode']}, {result['issues']} issues, {result['workers']} worker(s) ===")
+    print(f"Throughput:        {result['issues_per_sec']:8.2f} issues/sec")
+    print(f"Browser startup:   {seconds['startup']:8.2f}s")
+    print(f"Crawl:             {seconds['crawl']:8.2f}s "
+          f"(listing {seconds.get('listing', 0):.2f}s, details {seconds.get('details', 0):.2f}s)")
+    print(f"WebDriver commands:{result['webdriver_commands']:8d} ({result['commands_per_issue']:.1f} per issue)")
+    print(f"  top: {', '.join(f'{name}={count}' for name, count in result['top_commands'].items())}")
+    print(f"HTTP requests:     {sum(result['http_requests'].values()):8d} {result['http_requests']}")
+    browser = result["peak_browser_rss_mb"]
+    print(f"Peak RSS:          {result['peak_rss_mb']:8.1f} MiB python"
+          + (f", {browser:.1f} MiB browser" if browser is not None else " (install psutil for browser RSS)"))
+
+
+def compare(result, baseline, tolerance):
+    """Print the change against a baseline; returns False on a regression beyond tolerance."""
+    ok = True
+    print(f"\n=== Against baseline from {baseline['recorded_at']} on {baseline['machine']} ===")
+    checks = [
+        # (label, current, baseline, higher is better)
+        ("issues/sec", result["issues_per_sec"], baseline["issues_per_sec"], True),
+        ("WebDriver commands", result["webdriver_commands"], baseline["webdriver_commands"], False),
+        ("crawl seconds", result["seconds"]["crawl"], baseline["seconds"]["crawl"], False),
+        ("peak RSS MiB", result["peak_rss_mb"], baseline["peak_rss_mb"], False),
+    ]
+    for label, current, previous, higher_is_better in checks:
+        change = (current - previous) / previous if previous else 0.0
+        regressed = (-change if higher_is_better else change) > tolerance
+        # Memory and wall time are noisy; only throughput and command count fail the run
+        gating = label in ("issues/sec", "WebDriver commands")
+        if regressed and gating:
+            ok = False
+        flag = "REGRESSION" if regressed and gating else ("worse" if regressed else "")
+        print(f"{label:<20} {previous:10.2f} -> {current:10.2f} ({change:+.1%}) {flag}")
+    return ok
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark a full scrape against the local Jira fixture server.")
+    parser.add_argument("--issues", type=int, default=500, help="issues in the fixture project (100 to 10000)")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the server waits before every response")
+    parser.add_argument("--render-delay", type=float, default=0.0,
+                        help="seconds before pages render their content client-side")
+    parser.add_argument("--mode", choices=["browser", "rest"], default="browser")
+    parser.add_argument("--workers", type=int, default=1, help="description workers")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed relative regression")
+    parser.add_argument("--json", action="store_true", help="print the raw result as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    result = run(args)
+    report(result)
+    if args.json:
+        print(json.dumps(result, indent=2))
+
+    baseline_path = os.path.join(BASELINE_DIR, f"{args.mode}-{args.issues}.json")
+    if args.save_baseline:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"\nSaved baseline to {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, encoding="utf-8") as f:
+            if not compare(result, json.load(f), args.tolerance):
+                sys.exit(1)
+    else:
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline to record one")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,3 +13,106 @@ JIRA_USERNAME = os.getenv("JIRA_USERNAME")
 JIRA_PASSWORD = os.getenv("JIRA_PASSWORD")
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 
+# Number of extra browser sessions used to fetch issue descriptions in parallel
+DESCRIPTION_WORKERS = int(os.getenv("DESCRIPTION_WORKERS", "1"))
+# How many times a worker retries a description before giving up on it
+DESCRIPTION_RETRIES = int(os.getenv("DESCRIPTION_RETRIES", "2"))
+# Use the REST API for issue lists and descriptions; the browser is then only used to log in
+USE_REST_API = os.getenv("USE_REST_API", "false").lower() == "true"
+# JQL for the issues to scrape; defaults to every issue of the board's project
+JIRA_JQL = os.getenv("JIRA_JQL")
+# Issues per REST API result page (the browser issue list pages at whatever length Jira picks)
+PAGE_SIZE = int(os.getenv("PAGE_SIZE", "50"))
+# Only re-fetch issues updated since the previous run, tracked in a local SQLite file
+INCREMENTAL = os.getenv("INCREMENTAL", "false").lower() == "true"
+STATE_DB = os.getenv("STATE_DB", os.path.join(BASE_DIR, "data", "jira_state.sqlite3"))
+# Encrypted cache of the logged-in session; set SESSION_CACHE_KEY (a Fernet key) to enable it
+SESSION_CACHE = os.getenv("SESSION_CACHE", os.path.join(BASE_DIR, "data", "session.bin"))
+SESSION_CACHE_KEY = os.getenv("SESSION_CACHE_KEY")
+# Scraping browser profile: eager page loads and no images, fonts, media or analytics
+LEAN_BROWSER = os.getenv("LEAN_BROWSER", "true").lower() == "true"
+# Reused Chrome user data directories (keeps the HTTP cache between runs); off by default because
+# Chrome also keeps the session cookies there, readable by anyone who can read the directory
+BROWSER_PROFILE_DIR = os.getenv("BROWSER_PROFILE_DIR", "")
+# URL patterns the lean browser never downloads (comma separated extras via BLOCKED_URLS)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*/secure/useravatar*", "*avatar-management*", "*/gateway/api/gasv3/*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*segment.io*", "*segment.com*",
+    "*sentry.io*", "*nr-data.net*", "*newrelic.com*", "*doubleclick.net*", "*optimizely.com*",
+] + [p.strip() for p in os.getenv("BLOCKED_URLS", "").split(",") if p.strip()]
+# Where scraped issues go: comma separated console, jsonl, parquet, sqlite (optionally "name:path")
+OUTPUT_SINKS = os.getenv("OUTPUT_SINKS", "console")
+OUTPUT_DIR = os.getenv("OUTPUT_DIR", os.path.join(BASE_DIR, "data", "output"))
+# Sinks flush after this many issues or seconds, whichever comes first
+SINK_FLUSH_EVERY = int(os.getenv("SINK_FLUSH_EVERY", "100"))
+SINK_FLUSH_SECONDS = float(os.getenv("SINK_FLUSH_SECONDS", "5"))
+# Checkpoint listed and finished issues so an interrupted crawl resumes where it stopped
+CHECKPOINT = os.getenv("CHECKPOINT", "true").lower() == "true"
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", os.path.join(BASE_DIR, "data", "checkpoints"))
+# Seconds after which an untouched checkpoint is discarded and its crawl starts over (0 keeps them forever)
+CHECKPOINT_MAX_AGE = int(os.getenv("CHECKPOINT_MAX_AGE", "604800"))
+# Use the asyncio/Playwright engine: one browser, many tabs, ASYNC_CONCURRENCY pages in flight
+ASYNC_ENGINE = os.getenv("ASYNC_ENGINE", "false").lower() == "true"
+ASYNC_CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "8"))
+# Sharded crawls (coordinator.py): local worker processes, shared queue file, progress interval
+SHARD_PROCESSES = int(os.getenv("SHARD_PROCESSES", "4"))
+SHARD_QUEUE = os.getenv("SHARD_QUEUE", os.path.join(BASE_DIR, "data", "shards.sqlite3"))
+SHARD_PROGRESS_SECONDS = float(os.getenv("SHARD_PROGRESS_SECONDS", "30"))
+# Cache of fetched descriptions keyed by issue key + updated time, with TTL and LRU size cap
+RESPONSE_CACHE = os.getenv("RESPONSE_CACHE", "true").lower() == "true"
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(BASE_DIR, "data", "cache"))
+CACHE_TTL = float(os.getenv("CACHE_TTL", str(24 * 3600)))
+CACHE_MAX_MB = int(os.getenv("CACHE_MAX_MB", "512"))
+# Also keep the raw page HTML / API JSON next to each cached description
+CACHE_RAW = os.getenv("CACHE_RAW", "true").lower() == "true"
+# Log verbosity: DEBUG shows every row and issue, INFO the progress, WARNING only problems
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Timers and counters around login, navigation, extraction and fetches; METRICS_FORMAT is json, prometheus or none
+METRICS = os.getenv("METRICS", "true").lower() == "true"
+METRICS_FORMAT = os.getenv("METRICS_FORMAT", "json").lower()
+METRICS_FILE = os.getenv("METRICS_FILE", os.path.join(
+    OUTPUT_DIR, "metrics.prom" if METRICS_FORMAT == "prometheus" else "metrics.json"))
+# Learn which fallback selector wins per field and site and try it first next time
+SELECTOR_LEARNING = os.getenv("SELECTOR_LEARNING", "true").lower() == "true"
+SELECTOR_STATS = os.getenv("SELECTOR_STATS", os.path.join(BASE_DIR, "data", "selector_stats.json"))
+# Also crawl Confluence after Jira, reusing Jira's login and browsers; pages go to CONFLUENCE_FILE
+CONFLUENCE = os.getenv("CONFLUENCE", "false").lower() == "true"
+# Confluence base URL; defaults to /wiki on the Jira site
+CONFLUENCE_URL = os.getenv("CONFLUENCE_URL")
+# Comma-separated space keys to crawl; empty crawls every space in the directory
+CONFLUENCE_SPACES = [key.strip() for key in os.getenv("CONFLUENCE_SPACES", "").split(",") if key.strip()]
+# Browsers reading pages in parallel (the same pool workers Jira uses)
+CONFLUENCE_WORKERS = int(os.getenv("CONFLUENCE_WORKERS", str(DESCRIPTION_WORKERS)))
+# Stop after this many pages; 0 = no limit
+CONFLUENCE_MAX_PAGES = int(os.getenv("CONFLUENCE_MAX_PAGES", "0"))
+CONFLUENCE_FILE = os.getenv("CONFLUENCE_FILE", os.path.join(OUTPUT_DIR, "confluence.jsonl"))
+# Chunking for embeddings (the "chunks" output sink): tokens per chunk, tokens shared by neighbouring chunks
+CHUNK_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", "512"))
+CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "64"))
+# Processes chunking in parallel; 1 chunks in the scraper process
+CHUNK_WORKERS = int(os.getenv("CHUNK_WORKERS", "2"))
+# Estimated similarity above which a description counts as a near duplicate; 0 disables deduplication
+CHUNK_DEDUP_THRESHOLD = float(os.getenv("CHUNK_DEDUP_THRESHOLD", "0.9"))
+# tiktoken encoding used to count tokens when tiktoken is installed (words and punctuation otherwise)
+CHUNK_ENCODING = os.getenv("CHUNK_ENCODING", "cl100k_base")
+# Per-host rate limiting shared by every fetch path; rate and concurrency adapt (AIMD) between these bounds
+RATE_LIMIT = os.getenv("RATE_LIMIT", "true").lower() == "true"
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "5"))
+RATE_LIMIT_MAX_RPS = float(os.getenv("RATE_LIMIT_MAX_RPS", "50"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "5"))
+RATE_LIMIT_CONCURRENCY = int(os.getenv("RATE_LIMIT_CONCURRENCY", "4"))
+RATE_LIMIT_MAX_CONCURRENCY = int(os.getenv("RATE_LIMIT_MAX_CONCURRENCY", "16"))
+# How often a throttled (429/503) REST call is retried after backing off
+RATE_LIMIT_RETRIES = int(os.getenv("RATE_LIMIT_RETRIES", "3"))
+# Recycle each browser after this many pages or once it uses DRIVER_MAX_RSS_MB (needs psutil), and replace
+# crashed or hung browsers, restoring their cookies instead of logging in again
+DRIVER_RECYCLING = os.getenv("DRIVER_RECYCLING", "true").lower() == "true"
+DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", "500"))
+DRIVER_MAX_RSS_MB = int(os.getenv("DRIVER_MAX_RSS_MB", "1500"))
+# Pages between memory checks and cookie snapshots
+DRIVER_HEALTH_EVERY = int(os.getenv("DRIVER_HEALTH_EVERY", "25"))
+# Seconds before a page load counts as hung
+DRIVER_PAGE_TIMEOUT = int(os.getenv("DRIVER_PAGE_TIMEOUT", "60"))
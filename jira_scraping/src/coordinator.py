@@ -0,0 +1,93 @@
+#  Add the parent directory to sys.path so imports work
+import argparse
+import multiprocessing
+import socket
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.jira_utils import JiraUtils
+from scraper.sharding import ShardQueue, merge_shard_outputs, rotate_shard_outputs, run_shard_worker
+from config import settings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Crawl many Jira projects or JQL shards in parallel.")
+    parser.add_argument("--projects", default="", help="comma separated project keys, one shard each")
+    parser.add_argument("--jql", action="append", default=[], help="extra JQL shard (repeatable)")
+    parser.add_argument("--processes", type=int, default=settings.SHARD_PROCESSES, help="local worker processes")
+    parser.add_argument("--queue", default=settings.SHARD_QUEUE, help="SQLite work queue shared by all workers")
+    parser.add_argument("--output", default=settings.OUTPUT_DIR, help="directory for shard and merged output")
+    parser.add_argument("--worker", action="store_true",
+                        help="only run workers against an existing queue (e.g. on another host)")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the previous run: keep its finished shards and their output")
+    parser.add_argument("--stale-after", type=float, default=1800,
+                        help="seconds without progress before a running shard is handed out again")
+    return parser.parse_args()
+
+
+def print_progress(queue):
+    """Print one status line per shard."""
+    print(f"\n=== Shards ({time.strftime('%H:%M:%S')}) ===")
+    for shard in queue.shards():
+        elapsed = ""
+        if shard["started_at"]:
+            end = shard["finished_at"] if shard["status"] in ("done", "failed") else time.time()
+            elapsed = f"{end - shard['started_at']:.0f}s"
+        print(f"{shard['name']:<24} {shard['status']:<8} {shard['issues']:>6} issues {elapsed:>7} "
+              f"{shard['worker'] or ''}{' | ' + shard['error'] if shard['error'] else ''}")
+
+
+def start_worker(args, name):
+    """Start one local worker process draining the queue."""
+    worker = multiprocessing.Process(target=run_shard_worker, args=(args.queue, args.output, name))
+    worker.start()
+    return worker
+
+
+def run_coordinator(args):
+    queue = ShardQueue(args.queue)
+    try:
+        if not args.worker:
+            # A new run starts from an empty queue; the previous run's shard files are set aside
+            if not args.resume:
+                queue.reset()
+                rotate_shard_outputs(args.output)
+            for key in filter(None, (k.strip() for k in args.projects.split(","))):
+                queue.add(key, JiraUtils.project_jql(key))
+            for jql in args.jql:
+                queue.add(jql[:24], jql)
+
+        names = [f"{socket.gethostname()}-{i+1}" for i in range(args.processes)]
+        workers = {name: start_worker(args, name) for name in names}
+
+        while workers:
+            time.sleep(settings.SHARD_PROGRESS_SECONDS)
+            requeued = queue.requeue_stale(args.stale_after)
+            if requeued:
+                print(f"Re-queued {requeued} stalled shard(s)")
+            for name, worker in list(workers.items()):
+                if worker.is_alive():
+                    continue
+                worker.join()
+                del workers[name]
+                # A worker that crashed leaves its shard 'running': put it back in the queue
+                if worker.exitcode:
+                    requeued = queue.requeue_worker(name)
+                    print(f"Worker {name} died (exit code {worker.exitcode}); re-queued {requeued} shard(s)")
+                if queue.pending():
+                    workers[name] = start_worker(args, name)
+            print_progress(queue)
+
+        if not args.worker:
+            if queue.remaining():
+                print(f"{queue.remaining()} shard(s) still pending or running elsewhere; merge again once they finish")
+            total = merge_shard_outputs(args.output)
+            print(f"Merged {total} unique issues into {os.path.join(args.output, 'merged.jsonl')}")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    run_coordinator(parse_args())
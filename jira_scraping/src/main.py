@@ -1,21 +1,80 @@
 #  Add the parent directory to sys.path so imports work
+import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scraper.jira_scraper import JiraScraper
+from scraper.async_jira_scraper import AsyncJiraScraper
+from scraper.browser_pool import BrowserPool
+from scraper.confluence_scraper import ConfluenceScraper
+from scraper.instrumentation import export_metrics
+from scraper.sinks import JsonlSink, build_sinks
 from config import settings
-# from scraper.confluence_scraper import ConfluenceScraper
 
 def run_all():
-    jira = JiraScraper()  
+    # Jira and Confluence share one login and one set of browsers
+    pool = BrowserPool()
+    try:
+        run_jira(pool)
+        if settings.CONFLUENCE:
+            run_confluence(pool)
+    finally:
+        pool.close()
+        export_metrics()
+
+
+def run_jira(pool):
+    jira = JiraScraper(pool=pool)
+    sinks = build_sinks(settings.OUTPUT_SINKS, settings.OUTPUT_DIR,
+                        settings.SINK_FLUSH_EVERY, settings.SINK_FLUSH_SECONDS)
     
+    def flush():
+        for sink in sinks:
+            sink.flush()
+
     try:
-        issues = jira.scrape()
-        jira.print_issues(issues)
+        # Issues are written as they are scraped, never collected in memory; the checkpoint only
+        # counts an issue as done once the sinks have flushed it
+        for issue in jira.iter_issues(flush=flush):
+            for sink in sinks:
+                sink.write(issue)
     finally:
+        for sink in sinks:
+            sink.close()
         jira.close()
+
+
+def run_confluence(pool):
+    confluence = ConfluenceScraper(pool=pool)
+    sink = JsonlSink(settings.CONFLUENCE_FILE, flush_every=settings.SINK_FLUSH_EVERY,
+                     flush_interval=settings.SINK_FLUSH_SECONDS)
+    try:
+        for page in confluence.iter_pages():
+            sink.write(page)
+    finally:
+        sink.close()
+        confluence.close()
+
+
+async def run_all_async():
+    jira = AsyncJiraScraper()
+    sinks = build_sinks(settings.OUTPUT_SINKS, settings.OUTPUT_DIR,
+                        settings.SINK_FLUSH_EVERY, settings.SINK_FLUSH_SECONDS)
+
+    try:
+        async for issue in jira.iter_issues():
+            for sink in sinks:
+                sink.write(issue)
+    finally:
+        for sink in sinks:
+            sink.close()
+        await jira.close()
+        export_metrics()
  
 
 
 if __name__ == "__main__":
-    run_all()
+    if settings.ASYNC_ENGINE:
+        asyncio.run(run_all_async())
+    else:
+        run_all()
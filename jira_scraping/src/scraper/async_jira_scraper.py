@@ -0,0 +1,250 @@
+"""Asyncio Jira scraper driving many tabs of one browser over CDP (Playwright)."""
+
+import asyncio
+from urllib.parse import quote
+
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+except ImportError:  # optional dependency
+    async_playwright = None
+    PlaywrightTimeout = Exception
+
+from config import settings
+from scraper.instrumentation import log, metrics
+from scraper.jira_extractors import JiraExtractors
+from scraper.jira_login import JiraLogin
+from scraper.jira_scraper import JiraScraper
+from scraper.jira_utils import JiraUtils
+from scraper.page_waits import PageWaiter
+from scraper.rate_limit import THROTTLE_STATUSES, rate_limiters, retry_after_seconds
+from scraper.selector_stats import selector_stats
+from scraper.session_cache import SessionCache
+
+
+class AsyncJiraScraper:
+    """Scrapes Jira with asyncio: one Chromium process, one tab per in-flight issue.
+
+    Tabs share the browser context, so they share the login. A semaphore
+    caps how many issue pages load at once; network waits of all open
+    tabs overlap. Row fields and descriptions are read with the same
+    selectors and scripts as the Selenium scraper.
+    """
+
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+    # Selenium-engine options this engine does not implement
+    UNSUPPORTED_SETTINGS = ("CHECKPOINT", "INCREMENTAL", "RESPONSE_CACHE", "USE_REST_API")
+
+    def __init__(self, headless: bool = settings.HEADLESS, concurrency: int = settings.ASYNC_CONCURRENCY):
+        if async_playwright is None:
+            raise ImportError("AsyncJiraScraper needs the 'playwright' package (pip install playwright)")
+        self.base_url = settings.JIRA_URL
+        self.headless = headless
+        self.concurrency = max(1, concurrency)
+        self.session_cache = SessionCache(settings.SESSION_CACHE, settings.SESSION_CACHE_KEY, self.base_url)
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.login_done = False
+        selector_stats.set_site(self.base_url)
+        ignored = [name for name in self.UNSUPPORTED_SETTINGS if getattr(settings, name)]
+        if ignored:
+            log.warning(f"[WARN] The async engine ignores {', '.join(ignored)}: every run fetches every "
+                        f"issue in the browser and cannot resume. Unset ASYNC_ENGINE to use them.")
+
+    async def start(self):
+        """Launch the browser and a context that skips images, fonts and media."""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self.context = await self.browser.new_context()
+        if settings.LEAN_BROWSER:
+            await self.context.route("**/*", self._route)
+
+    async def _route(self, route):
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def login(self):
+        """Restore a cached session if still valid, otherwise run the login flow in a tab."""
+        # The cache check is a blocking file read and REST call: keep it off the event loop
+        session = await asyncio.to_thread(self.session_cache.load)
+        if session and await asyncio.to_thread(self.session_cache.is_valid, session):
+            await self.context.add_cookies([self._to_playwright_cookie(c) for c in session["cookies"]])
+            log.info("[INFO] Restored cached session")
+            self.login_done = True
+            return
+
+        page = await self.context.new_page()
+        try:
+            await page.goto(settings.LOGIN_URL)
+            log.info("Step 1: waiting for email field...")
+            await page.fill(JiraLogin.EMAIL_SELECTOR, settings.JIRA_USERNAME, timeout=40000)
+            await page.click(JiraLogin.SUBMIT_SELECTOR)
+            log.info("Step 2: waiting for password field...")
+            await page.fill(JiraLogin.PASSWORD_SELECTOR, settings.JIRA_PASSWORD, timeout=40000)
+            await page.click(JiraLogin.SUBMIT_SELECTOR)
+            try:
+                log.info("Step 3: checking for extra verification...")
+                await page.click(f"xpath={JiraLogin.VERIFY_XPATH}", timeout=5000)
+            except PlaywrightTimeout:
+                log.info("No extra verification step detected.")
+            log.info("Step 4: waiting for Jira dashboard...")
+            await page.wait_for_url("**atlassian.net**", timeout=40000)
+            self.login_done = True
+            await self._save_session(page)
+        finally:
+            await page.close()
+
+    async def _save_session(self, page):
+        """Persist the fresh session; a failure here must not fail the login."""
+        if not self.session_cache.enabled:
+            return
+        try:
+            cookies = await self.context.cookies(self.session_cache.site_url)
+            local_storage = await page.evaluate(SessionCache.LOCAL_STORAGE_SCRIPT)
+            await asyncio.to_thread(self.session_cache.store,
+                                    [self._to_webdriver_cookie(c) for c in cookies], local_storage)
+        except Exception as e:
+            log.warning(f"[WARN] Could not save session: {type(e).__name__} - {e}")
+
+    async def scrape(self, jql: str = None, page_size: int = settings.PAGE_SIZE):
+        """Scrape every issue matching jql and return them as a list."""
+        return [issue async for issue in self.iter_issues(jql, page_size)]
+
+    async def iter_issues(self, jql: str = None, page_size: int = settings.PAGE_SIZE):
+        """Yield issues as their descriptions arrive, fetching up to `concurrency` at once."""
+        if self.context is None:
+            await self.start()
+        if not self.login_done:
+            await self.login()
+
+        jql = jql or settings.JIRA_JQL or JiraUtils.default_jql(self.base_url)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async for issues in self._iter_pages(jql, page_size):
+            tasks = [asyncio.create_task(self._complete_issue(issue, semaphore)) for issue in issues]
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+    async def _iter_pages(self, jql, page_size):
+        """Yield pages of issues (without descriptions) from the issue navigator; page_size is not used."""
+        page = await self.context.new_page()
+        try:
+            start_index, seen_keys = 0, set()
+            while True:
+                url = f"{self.base_url}/issues/?jql={quote(jql)}"
+                if start_index:
+                    url += f"&startIndex={start_index}"
+                async with rate_limiters.for_url(url).request_async() as ticket:
+                    response = await page.goto(url, wait_until="domcontentloaded")
+                    self._check_throttled(response, ticket)
+                    await page.wait_for_selector("a[href*='/browse/']", timeout=15000)
+
+                # The navigator picks its own page length and repeats the last page past the end
+                issues, row_count = await self._extract_rows(page)
+                new_issues = []
+                for issue in issues:
+                    if issue['key'] not in seen_keys:
+                        seen_keys.add(issue['key'])
+                        new_issues.append(issue)
+                if not new_issues:
+                    return
+                log.info(f"Listed {len(new_issues)} issues at offset {start_index}")
+                yield new_issues
+                start_index += row_count
+        finally:
+            await page.close()
+
+    async def _extract_rows(self, page):
+        """Serialise all rows of the list page with JiraExtractors.ROWS_SCRIPT."""
+        for selector in JiraUtils.ROW_SELECTORS:
+            if await page.locator(selector).count():
+                cfg = JiraExtractors.rows_script_config()
+                raw_rows = await page.eval_on_selector_all(
+                    selector,
+                    f"(rows, cfg) => (function() {{ {JiraExtractors.ROWS_SCRIPT} }}).apply(null, [rows, cfg])",
+                    cfg,
+                )
+                issues = JiraExtractors.issues_from_raw_rows(raw_rows, cfg)
+                return [issue for issue in issues if issue], len(raw_rows)
+        return [], 0
+
+    async def _complete_issue(self, issue, semaphore):
+        """Open the issue in its own tab and read the description and detail fields."""
+        async with semaphore:
+            page = await self.context.new_page()
+            try:
+                with metrics.timer("description_fetch", source="async"):
+                    issue.update(await self._read_details(page, issue['url']))
+            except Exception as e:
+                metrics.count("description_errors", source="async")
+                log.error("ERROR fetching description for %s: %s - %s", issue['key'], type(e).__name__, e)
+                issue.update(JiraExtractors.empty_details(JiraExtractors.FETCH_ERROR))
+            finally:
+                await page.close()
+        return issue
+
+    async def _read_details(self, page, url):
+        """Race the description selectors the same way PageWaiter does, then run DETAILS_SCRIPT once."""
+        outcome, text = "timeout", ""
+        selectors = selector_stats.ordered("description", JiraScraper.DESCRIPTION_SELECTORS)
+        async with rate_limiters.for_url(url).request_async() as ticket:
+            response = await page.goto(url, wait_until="domcontentloaded")
+            try:
+                handle = await page.wait_for_function(
+                    "(args) => { const r = (function() { " + PageWaiter.RACE_SCRIPT + " }).apply(null, args);"
+                    " return r && [r[0], r[1], r[2] ? (r[2].innerText || r[2].textContent || '').trim() : '']; }",
+                    arg=[selectors, JiraScraper.EMPTY_DESCRIPTION_SELECTORS],
+                    timeout=JiraScraper.DESCRIPTION_TIMEOUT * 1000,
+                )
+                outcome, selector, text = await handle.json_value()
+                if outcome == "match":
+                    selector_stats.record("description", selector, selectors)
+            except PlaywrightTimeout:
+                pass  # neither a description nor the empty marker rendered: not a throttling signal
+            self._check_throttled(response, ticket)
+        details = JiraExtractors._details_from_raw(await page.evaluate(
+            f"(cfg) => (function() {{ {JiraExtractors.DETAILS_SCRIPT} }}).apply(null, [cfg])",
+            JiraExtractors.details_script_config(),
+        ))
+        if outcome == "match":
+            details['description'] = details['description'] or text or "No description available"
+        elif outcome == "empty":
+            details['description'] = "No description available"
+        else:
+            details['description'] = JiraExtractors.FETCH_ERROR  # fetched again on the next run
+        return details
+
+    @staticmethod
+    def _check_throttled(response, ticket):
+        """Report a 429/503 navigation to the rate limiter, with its Retry-After."""
+        if response is not None and response.status in THROTTLE_STATUSES:
+            ticket.throttled(retry_after_seconds(response.headers.get("retry-after")))
+
+    @staticmethod
+    def _to_playwright_cookie(cookie):
+        """Convert a WebDriver cookie dict into Playwright's format."""
+        converted = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly") if k in cookie}
+        if "expiry" in cookie:
+            converted["expires"] = cookie["expiry"]
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            converted["sameSite"] = cookie["sameSite"]
+        return converted
+
+    @staticmethod
+    def _to_webdriver_cookie(cookie):
+        """Convert a Playwright cookie dict into WebDriver's format, as the session cache stores it."""
+        converted = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly") if k in cookie}
+        if cookie.get("expires", -1) >= 0:
+            converted["expiry"] = int(cookie["expires"])
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            converted["sameSite"] = cookie["sameSite"]
+        return converted
+
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        selector_stats.save()
+        if self.browser is not None:
+            await self.browser.close()
+        if self.playwright is not None:
+            await self.playwright.stop()
@@ -1,33 +1,88 @@
+import os
 from abc import ABC, abstractmethod
+from functools import partial
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-import time
 from config import settings
+from scraper.driver_manager import ManagedDriver
+from scraper.instrumentation import count_webdriver_commands, metrics
+from scraper.page_waits import PageWaiter
+from scraper.rate_limit import rate_limiters
+
+
+def create_driver(headless: bool, profile_name: str = "main", lean: bool = settings.LEAN_BROWSER):
+    """Initialize Chrome WebDriver.
+
+    With lean=True the browser uses the scraping profile: eager page loads,
+    no extensions or GPU, and images, fonts, media and analytics blocked.
+    When BROWSER_PROFILE_DIR is set, each profile_name gets its own reused
+    user data directory so the HTTP cache survives between runs; the login
+    cookies are stored there too, outside the encrypted session cache.
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if lean:
+        options.page_load_strategy = "eager"  # return at DOMContentLoaded, not after every subresource
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-gpu")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+    if settings.BROWSER_PROFILE_DIR:
+        options.add_argument(f"--user-data-dir={os.path.join(settings.BROWSER_PROFILE_DIR, profile_name)}")
+
+    driver = webdriver.Chrome(options=options)
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": settings.BLOCKED_URL_PATTERNS})
+    driver.maximize_window()
+    return count_webdriver_commands(driver)
+
+
+def create_managed_driver(headless: bool, base_url: str, profile_name: str = "main",
+                          lean: bool = settings.LEAN_BROWSER):
+    """create_driver wrapped in a ManagedDriver that recycles and heals it (plain driver if DRIVER_RECYCLING is off)."""
+    if not settings.DRIVER_RECYCLING:
+        return create_driver(headless, profile_name, lean)
+    return ManagedDriver(
+        partial(create_driver, headless, lean=lean), base_url, name=profile_name,
+        max_pages=settings.DRIVER_MAX_PAGES, max_rss=settings.DRIVER_MAX_RSS_MB * 2**20,
+        health_every=settings.DRIVER_HEALTH_EVERY, page_timeout=settings.DRIVER_PAGE_TIMEOUT,
+    )
 
 
 class BaseScraper(ABC):
-    """Abstract base class for Selenium-based scrapers."""
+    """Abstract base class for Selenium-based scrapers.
 
-    def __init__(self, base_url: str, headless: bool = settings.HEADLESS):
+    With a BrowserPool the scraper borrows the pool's logged-in browser and
+    waiter instead of launching its own, and close() leaves them open.
+    """
+
+    def __init__(self, base_url: str, headless: bool = settings.HEADLESS, pool=None):
         self.base_url = base_url
-        self.driver = self._init_driver(headless)
+        self.headless = headless
+        self.pool = pool
+        if pool is not None:
+            self.waiter = pool.waiter
+            self.driver = pool.driver
+        else:
+            self.waiter = PageWaiter()
+            self.driver = self._init_driver(headless)
         self.login_done = False
 
-    def _init_driver(self, headless: bool):
-        """Initialize Chrome WebDriver."""
-        options = Options()
-        if headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        driver = webdriver.Chrome(options=options)
-        driver.maximize_window()
-        return driver
-
-    def open_page(self, url: str):
-        """Open a given page."""
-        self.driver.get(url)
-        time.sleep(2)  # Small delay for page to load
+    def _init_driver(self, headless: bool, profile_name: str = "main", lean: bool = settings.LEAN_BROWSER):
+        """Initialize Chrome WebDriver (see create_driver and create_managed_driver)."""
+        return create_managed_driver(headless, self.base_url, profile_name, lean)
+
+    def open_page(self, url: str, page: str = "page"):
+        """Open a given page; page labels its navigation timer."""
+        with rate_limiters.for_url(url).request(), metrics.timer("navigation", page=page):
+            self.driver.get(url)
+            self.waiter.wait_for_document(self.driver)
 
     @abstractmethod
     def login(self):
@@ -40,8 +95,9 @@ class BaseScraper(ABC):
         pass
 
     def close(self):
-        """Close the browser."""
-        self.driver.quit()
+        """Close the browser, unless it belongs to a shared pool."""
+        if self.pool is None:
+            self.driver.quit()
 
 
 
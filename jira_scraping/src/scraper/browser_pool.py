@@ -0,0 +1,73 @@
+"""One authenticated Atlassian session and its browsers, shared by the scrapers."""
+
+import threading
+
+from config import settings
+from scraper.base_scraper import create_managed_driver
+from scraper.instrumentation import log
+from scraper.jira_login import JiraLogin
+from scraper.jira_utils import JiraUtils
+from scraper.page_waits import PageWaiter
+from scraper.session_cache import SessionCache
+
+
+class BrowserPool:
+    """A logged-in main browser plus worker browsers, shared by several scrapers.
+
+    Jira and Confluence Cloud live on the same Atlassian site and accept the
+    same session cookies, so JiraScraper and ConfluenceScraper built on one
+    pool log in once and reuse the same set of Chrome processes. Workers are
+    started on demand and signed in by copying the main browser's cookies.
+    The browsers are handed out as they are, so scrapers sharing a pool
+    should run one after the other, not at the same time.
+    """
+
+    def __init__(self, base_url=settings.JIRA_URL, headless=settings.HEADLESS):
+        self.base_url = base_url
+        self.headless = headless
+        self.waiter = PageWaiter()
+        self.driver = create_managed_driver(headless, base_url)
+        session_cache = SessionCache(settings.SESSION_CACHE, settings.SESSION_CACHE_KEY, base_url)
+        self.login_handler = JiraLogin(self.driver, self.waiter, session_cache)
+        self.workers = []
+        self.lock = threading.Lock()
+
+    @property
+    def login_done(self):
+        return self.login_handler.login_done
+
+    def login(self, max_attempts=2):
+        """Log in once; later calls from other scrapers return immediately."""
+        with self.lock:
+            if not self.login_handler.login_done:
+                self.login_handler.login(max_attempts)
+
+    def acquire_workers(self, count):
+        """The first count worker browsers, launching and signing in any that are missing."""
+        with self.lock:
+            missing = count - len(self.workers)
+            if missing > 0:
+                cookies = self.driver.get_cookies()
+                for _ in range(missing):
+                    number = len(self.workers) + 1
+                    driver = create_managed_driver(self.headless, self.base_url, profile_name=f"worker-{number}")
+                    added = JiraUtils.apply_cookies(driver, cookies, self.base_url)
+                    log.info(f"Worker {number} ready ({added} cookies shared)")
+                    self.workers.append(driver)
+            return self.workers[:max(0, count)]
+
+    def close(self):
+        """Quit every browser of the pool."""
+        with self.lock:
+            for driver in self.workers + [self.driver]:
+                try:
+                    driver.quit()
+                except Exception:
+                    continue
+            self.workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,152 @@
+"""On-disk checkpoints that let an interrupted crawl resume where it stopped."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+
+class CrawlCheckpoint:
+    """Records the listed issues and every finished issue of one JQL crawl.
+
+    Files live in a directory named after a hash of the base JQL (before any
+    incremental narrowing, so a moved watermark reuses the same directory):
+      crawl.json       the query actually crawled, and whether it finished
+      pages.jsonl      one line per listed page: its issues and the offset of the
+                       next page (null after the last page)
+      completed.jsonl  one line per issue whose details were fetched and written out
+    A restarted crawl fetches only discovered-but-unfinished issues and
+    continues listing from the saved offset. Issues whose fetch failed are
+    never marked completed: when the crawl ends with failures the checkpoint
+    is kept and marked finished, and the next run retries those issues
+    before listing again. Otherwise the directory is removed at the end.
+    Checkpoints untouched for longer than max_age are pruned (see prune).
+    """
+
+    def __init__(self, root, jql):
+        self.jql = jql
+        self.directory = os.path.join(root, hashlib.sha1(jql.encode("utf-8")).hexdigest()[:16])
+        self.crawl_path = os.path.join(self.directory, "crawl.json")
+        self.pages_path = os.path.join(self.directory, "pages.jsonl")
+        self.completed_path = os.path.join(self.directory, "completed.jsonl")
+        self._completed_file = None
+
+    @property
+    def exists(self):
+        """True when an earlier crawl of this JQL left a checkpoint behind."""
+        return os.path.exists(self.pages_path)
+
+    @property
+    def query(self):
+        """The (possibly narrowed) JQL the checkpointed crawl listed, or None."""
+        return self._crawl().get("query")
+
+    @property
+    def finished(self):
+        """True when the checkpointed crawl listed everything and only failed issues are left."""
+        return self._crawl().get("finished", False)
+
+    def begin(self, query):
+        """Start a new checkpoint for a crawl of query, dropping any previous one."""
+        self.clear()
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_crawl({"jql": self.jql, "query": query, "finished": False})
+
+    def finish(self):
+        """Keep the checkpoint after a crawl that listed everything but has failed issues."""
+        self._write_crawl(dict(self._crawl(), finished=True))
+
+    def discovered(self):
+        """Return (issues listed so far, offset of the next page or None once listing is complete)."""
+        issues, next_offset = [], 0
+        for record in self._read_lines(self.pages_path):
+            issues.extend(record["issues"])
+            next_offset = record["next_offset"]
+        return issues, next_offset
+
+    def completed_keys(self):
+        """Keys of issues already finished by a previous run."""
+        return {record["key"] for record in self._read_lines(self.completed_path)}
+
+    def pending(self):
+        """Discovered issues that were not finished yet, in listing order."""
+        done = self.completed_keys()
+        issues, _ = self.discovered()
+        return [issue for issue in issues if issue["key"] not in done]
+
+    def record_page(self, issues, next_offset):
+        """Append a listed page so it is never listed again."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.pages_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"jql": self.jql, "next_offset": next_offset, "issues": issues}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record_completed(self, issues):
+        """Append issues that are written out; they survive a crash right after this call."""
+        if not issues:
+            return
+        if self._completed_file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._completed_file = open(self.completed_path, "a", encoding="utf-8")
+        self._completed_file.writelines(json.dumps(issue, ensure_ascii=False) + "\n" for issue in issues)
+        self._completed_file.flush()
+        os.fsync(self._completed_file.fileno())
+
+    def clear(self):
+        """Remove the checkpoint after a successful crawl."""
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def close(self):
+        if self._completed_file is not None:
+            self._completed_file.close()
+            self._completed_file = None
+
+    @staticmethod
+    def prune(root, max_age):
+        """Remove checkpoints under root that nothing wrote to for max_age seconds; returns how many."""
+        if not max_age or not os.path.isdir(root):
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        for name in os.listdir(root):
+            directory = os.path.join(root, name)
+            try:
+                paths = [directory] + [os.path.join(directory, entry) for entry in os.listdir(directory)]
+                touched = max(os.path.getmtime(path) for path in paths)
+            except OSError:
+                continue  # not a directory, or removed meanwhile by another worker
+            if touched < cutoff:
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def _crawl(self):
+        try:
+            with open(self.crawl_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_crawl(self, crawl):
+        """Replace crawl.json atomically."""
+        temporary = f"{self.crawl_path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(crawl, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.crawl_path)
+
+    @staticmethod
+    def _read_lines(path):
+        """Yield JSON records, ignoring a torn last line left by a crash."""
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
@@ -0,0 +1,265 @@
+"""Embedding-ready chunks: normalised, deduplicated, token-bounded issue text."""
+
+import hashlib
+import multiprocessing
+import re
+import unicodedata
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from scraper.instrumentation import log, metrics
+from scraper.sinks import IssueSink, JsonlSink
+
+_INVISIBLE = re.compile(r"[\u200b-\u200d\u2060\ufeff\u00ad]")
+_SPACES = re.compile(r"[^\S\n]+")
+_BLANK_LINES = re.compile(r"\n\s*\n\s*")
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_WORD = re.compile(r"\w+")
+
+# Issue fields copied onto every chunk
+CHUNK_METADATA = ["key", "url", "summary", "status", "priority", "reporter", "created", "updated",
+                  "labels", "components"]
+# Descriptions shorter than this are placeholders ("N/A", errors...) and never count as duplicates
+MIN_DEDUP_WORDS = 8
+
+_tokenizers = {}
+
+
+def normalize_text(text):
+    """NFKC-normalise text, drop invisible characters and collapse runs of spaces and blank lines."""
+    if not text:
+        return ""
+    text = _INVISIBLE.sub("", unicodedata.normalize("NFKC", text)).replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def token_spans(text, encoding=None):
+    """(start, end) character span of every token of text.
+
+    Uses the tiktoken encoding when the optional tiktoken package is
+    installed, otherwise words and punctuation marks, which gives slightly
+    fewer tokens than a BPE tokenizer.
+    """
+    tokenizer = _tokenizer(encoding)
+    if tokenizer is None:
+        return [match.span() for match in _TOKEN.finditer(text)]
+    _, starts = tokenizer.decode_with_offsets(tokenizer.encode(text, disallowed_special=()))
+    return list(zip(starts, starts[1:] + [len(text)]))
+
+
+def _tokenizer(encoding):
+    if not encoding:
+        return None
+    if encoding not in _tokenizers:
+        try:
+            import tiktoken
+            _tokenizers[encoding] = tiktoken.get_encoding(encoding)
+        except ImportError:
+            _tokenizers[encoding] = None
+    return _tokenizers[encoding]
+
+
+def split_text(text, max_tokens=512, overlap=64, encoding=None):
+    """Split text into windows of at most max_tokens tokens, consecutive windows sharing overlap tokens.
+
+    Returns (chunk_text, token_count) pairs; each chunk is a slice of text.
+    """
+    spans = token_spans(text, encoding)
+    if not spans:
+        return []
+    step = max(1, max_tokens - overlap)
+    chunks = []
+    start = 0
+    while True:
+        end = min(start + max_tokens, len(spans))
+        chunks.append((text[spans[start][0]:spans[end - 1][1]], end - start))
+        if end == len(spans):
+            return chunks
+        start += step
+
+
+def minhash_signature(text, num_perm=128, shingle_size=3):
+    """MinHash signature of the word shingles of text, or None when text is too short to compare.
+
+    One-permutation MinHash: every shingle is hashed once, the hash picks
+    one of num_perm bins and each bin keeps its smallest value. Empty bins
+    copy the next filled bin, so short texts still get full signatures.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < MIN_DEDUP_WORDS:
+        return None
+    signature = [None] * num_perm
+    for i in range(len(words) - shingle_size + 1):
+        shingle = " ".join(words[i:i + shingle_size]).encode("utf-8")
+        h = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "little")
+        slot, value = h % num_perm, h // num_perm
+        if signature[slot] is None or value < signature[slot]:
+            signature[slot] = value
+    for slot in range(num_perm):
+        step = 1
+        while signature[slot] is None:
+            signature[slot] = signature[(slot + step) % num_perm]
+            step += 1
+    return array("Q", signature)
+
+
+class NearDuplicateIndex:
+    """Finds texts whose MinHash signatures agree on at least threshold of their positions.
+
+    Signatures are split into bands; two texts become candidates when one
+    band matches exactly (locality-sensitive hashing), and candidates are
+    then checked on the full signature. Only the signatures and band hashes
+    are kept, not the texts.
+    """
+
+    def __init__(self, threshold=0.9, bands=16):
+        self.threshold = threshold
+        self.bands = bands
+        self.buckets = {}
+        self.signatures = {}
+
+    def _band_keys(self, signature):
+        rows = len(signature) // self.bands
+        return [(band, hash(tuple(signature[band * rows:(band + 1) * rows]))) for band in range(self.bands)]
+
+    def add(self, key, signature):
+        """Index signature under key; returns the key of an earlier near duplicate instead, if any.
+
+        A key seen before is never its own duplicate: its new signature
+        replaces the old one.
+        """
+        band_keys = self._band_keys(signature)
+        seen = {key}
+        for band_key in band_keys:
+            for candidate in self.buckets.get(band_key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if self.similarity(signature, self.signatures[candidate]) >= self.threshold:
+                    return candidate
+        if key in self.signatures:
+            for band_key in self._band_keys(self.signatures[key]):
+                self.buckets[band_key].remove(key)
+        self.signatures[key] = signature
+        for band_key in band_keys:
+            self.buckets.setdefault(band_key, []).append(key)
+        return None
+
+    @staticmethod
+    def similarity(a, b):
+        """Estimated Jaccard similarity of the two shingle sets."""
+        return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def document_sections(issue, include_description=True):
+    """The text of an issue in reading order: title line, description, then comments."""
+    sections = [f"{issue.get('key', '')}: {normalize_text(issue.get('summary'))}"]
+    if include_description:
+        description = normalize_text(issue.get("description"))
+        if description and description != "N/A":
+            sections.append(description)
+    for comment in issue.get("comments") or []:
+        body = normalize_text(comment.get("body"))
+        if body:
+            sections.append(f"{comment.get('author') or 'Comment'}: {body}")
+    return sections
+
+
+def chunk_issue(issue, max_tokens=512, overlap=64, encoding=None, include_description=True):
+    """Chunk records of one issue, each carrying the issue metadata."""
+    text = "\n\n".join(document_sections(issue, include_description))
+    pieces = split_text(text, max_tokens, overlap, encoding)
+    metadata = {name: issue.get(name) for name in CHUNK_METADATA if name in issue}
+    return [
+        dict(metadata, chunk_id=f"{issue.get('key')}#{index}", chunk_index=index, chunk_count=len(pieces),
+             token_count=tokens, text=piece)
+        for index, (piece, tokens) in enumerate(pieces)
+    ]
+
+
+def prepare_batch(issues, max_tokens, overlap, encoding, num_perm):
+    """Worker task: (issue key, description signature, chunks) for every issue of a batch."""
+    return [
+        (issue.get("key"),
+         minhash_signature(normalize_text(issue.get("description")), num_perm),
+         chunk_issue(issue, max_tokens, overlap, encoding))
+        for issue in issues
+    ]
+
+
+class ChunkSink(IssueSink):
+    """Turns scraped issues into embedding-ready chunks, written as JSON lines.
+
+    Every buffered batch of issues goes to a process pool, where the text is
+    normalised, signed with MinHash and split into overlapping token-bounded
+    chunks, so chunking keeps up with a parallel crawl. Results are taken
+    back in submission order; an issue whose description nearly duplicates
+    an earlier one (dedup_threshold, 0 turns it off) keeps only its title
+    and comments and is marked with duplicate_of. With workers <= 1 the work
+    runs in this process.
+    """
+
+    def __init__(self, path, workers=2, max_tokens=512, overlap=64, dedup_threshold=0.9,
+                 encoding="cl100k_base", num_perm=128, **kwargs):
+        super().__init__(**kwargs)
+        if not 0 <= overlap < max_tokens:
+            raise ValueError("Chunk overlap must be smaller than the chunk size")
+        self.output = JsonlSink(path, flush_every=self.flush_every, flush_interval=self.flush_interval)
+        self.workers = workers
+        self.options = (max_tokens, overlap, encoding, num_perm)
+        self.index = NearDuplicateIndex(dedup_threshold) if dedup_threshold > 0 else None
+        self.duplicates = {}  # issue key -> key of the issue it duplicates
+        self.executor = None
+        self.pending = deque()
+
+    def _write_batch(self, issues):
+        if self.workers <= 1:
+            self._emit(issues, prepare_batch(issues, *self.options))
+            return
+        if self.executor is None:
+            # spawn: the crawler's browser threads must not be forked into the workers
+            self.executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        self.pending.append((list(issues), self.executor.submit(prepare_batch, list(issues), *self.options)))
+        # Keep at most two batches per worker in flight so memory stays bounded
+        while self.pending and (self.pending[0][1].done() or len(self.pending) > 2 * self.workers):
+            self._collect()
+
+    def _collect(self):
+        issues, future = self.pending.popleft()
+        try:
+            self._emit(issues, future.result())
+        except Exception as e:
+            metrics.count("chunk_errors")
+            log.error(f"ERROR chunking {len(issues)} issues: {type(e).__name__} - {e}")
+
+    @metrics.timed("chunk_emit")
+    def _emit(self, issues, prepared):
+        max_tokens, overlap, encoding, _ = self.options
+        for issue, (key, signature, chunks) in zip(issues, prepared):
+            original = self.index.add(key, signature) if self.index is not None and signature else None
+            if original is not None:
+                self.duplicates[key] = original
+                metrics.count("chunk_duplicates")
+                log.debug("Description of %s duplicates %s", key, original)
+                chunks = chunk_issue(issue, max_tokens, overlap, encoding, include_description=False)
+                for chunk in chunks:
+                    chunk["duplicate_of"] = original
+            else:
+                self.duplicates.pop(key, None)  # a re-crawled issue may no longer be a duplicate
+            for chunk in chunks:
+                self.output.write(chunk)
+            metrics.count("chunks_written", len(chunks))
+
+    def close(self):
+        """Chunk what is still buffered, wait for the workers and close the output."""
+        try:
+            super().close()
+            while self.pending:
+                self._collect()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+            self.output.close()
+        log.info(f"Chunks: {self.output.written} written, {len(self.duplicates)} duplicate descriptions")
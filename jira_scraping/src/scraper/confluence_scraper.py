@@ -0,0 +1,289 @@
+"""Confluence space and page crawler."""
+
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urljoin, urlsplit
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import settings
+from scraper.base_scraper import BaseScraper
+from scraper.browser_pool import BrowserPool
+from scraper.instrumentation import log, metrics
+from scraper.rate_limit import looks_throttled, rate_limiters
+from scraper.selector_stats import selector_stats
+
+
+class ConfluenceScraper(BaseScraper):
+    """Crawls Confluence spaces and streams every page with its attachment metadata.
+
+    Pages are found from each space's overview and then from the links on
+    every page read, staying inside the space. Built on the BrowserPool of
+    a JiraScraper it reuses that login and those browsers; without one it
+    starts a pool of its own. With workers > 1 pages are read in parallel on
+    the pool's worker browsers.
+    """
+
+    SPACE_LINK_XPATH = "//a[contains(@href, '/spaces/') and contains(@href, '/overview')]"
+    SPACE_LINK_SELECTOR = "a[href*='/spaces/'][href*='/overview']"  # SPACE_LINK_XPATH for PageWaiter
+    PAGE_LINK_SELECTOR = "a[href*='/pages/']"
+    NEXT_LINK_XPATH = "//a[normalize-space(.)='Next'] | //button[normalize-space(.)='Next']"
+
+    CONTENT_SELECTORS = [
+        "#main-content",
+        "[data-testid='page-content-only']",
+        ".ak-renderer-document",
+        "#content",
+    ]
+    TITLE_SELECTORS = [
+        "[data-testid='title-text']",
+        "#title-text",
+        "h1",
+    ]
+    ATTACHMENT_SELECTORS = [
+        "a[href*='/download/attachments/']",
+        "img[src*='/download/attachments/']",
+    ]
+
+    # Reads the open page in one round trip: title, body text, attachment
+    # links and the page links to follow.
+    PAGE_SCRIPT = """
+        const cfg = arguments[0];
+        const first = (selectors) => {
+            for (const selector of selectors) {
+                try {
+                    const el = document.querySelector(selector);
+                    if (el && (el.innerText || '').trim()) return [el, selector];
+                } catch (e) {}
+            }
+            return [null, null];
+        };
+        const [content, contentSelector] = first(cfg.content);
+        const [title] = first(cfg.title);
+        const attachments = [];
+        for (const selector of cfg.attachments) {
+            for (const el of document.querySelectorAll(selector)) {
+                attachments.push({url: el.href || el.src, text: (el.innerText || el.alt || '').trim()});
+            }
+        }
+        const links = Array.from(document.querySelectorAll("a[href*='/pages/']"), a => a.href);
+        return {
+            title: title ? title.innerText.trim() : document.title,
+            body: content ? content.innerText.trim() : '',
+            contentSelector: contentSelector,
+            attachments: attachments,
+            links: links,
+        };
+    """
+
+    PAGE_URL_PATTERN = re.compile(r"/spaces/([^/]+)/pages/(\d+)")
+    SPACE_URL_PATTERN = re.compile(r"/spaces/([^/]+)")
+
+    def __init__(self, base_url: str = settings.CONFLUENCE_URL, headless: bool = settings.HEADLESS, pool=None,
+                 workers: int = settings.CONFLUENCE_WORKERS, spaces=settings.CONFLUENCE_SPACES,
+                 max_pages: int = settings.CONFLUENCE_MAX_PAGES):
+        self.owns_pool = pool is None
+        pool = pool or BrowserPool(settings.JIRA_URL, headless)
+        super().__init__(base_url or self.default_url(pool.base_url), headless, pool)
+        self.workers = workers
+        self.spaces = list(spaces or [])
+        self.max_pages = max_pages
+        self.visited = set()
+        selector_stats.set_site(self.base_url)
+
+    @staticmethod
+    def default_url(site_url):
+        """Confluence Cloud lives under /wiki of the Atlassian site."""
+        parts = urlsplit(site_url or "")
+        return f"{parts.scheme}://{parts.netloc}/wiki"
+
+    def login(self, max_attempts=2):
+        """Log in through the shared pool (a no-op when Jira already did)."""
+        self.pool.login(max_attempts)
+
+    def scrape(self):
+        """Crawl every configured space and return the pages as a list."""
+        return list(self.iter_pages())
+
+    def iter_pages(self):
+        """Yield each page as soon as it is read: url, page_id, space, title, body and attachments."""
+        self.login()
+        space_urls = [f"{self.base_url.rstrip('/')}/spaces/{key}/overview" for key in self.spaces]
+        if not space_urls:
+            try:
+                space_urls = self._get_space_links()
+            except Exception as e:
+                metrics.count("confluence_errors", stage="directory")
+                log.error(f"ERROR reading the spaces directory: {type(e).__name__} - {e}")
+                return
+        for space_url in space_urls:
+            if self._budget_left() == 0:
+                return
+            try:
+                yield from self._scrape_space(space_url)
+            except Exception as e:
+                metrics.count("confluence_errors", stage="space")
+                log.error(f"ERROR crawling space {space_url}: {type(e).__name__} - {e}")
+
+    def _get_space_links(self):
+        """Overview URLs of every space in the spaces directory, following its "Next" pages."""
+        directory = self.base_url.rstrip('/') + '/spaces'
+        log.info(f"Scraping spaces directory: {directory}")
+        self.open_page(directory, page="confluence_spaces")
+        links = []
+        while True:
+            # The directory is rendered client-side, after the document itself is ready
+            self.waiter.wait_for_any(self.driver, [self.SPACE_LINK_SELECTOR], name="confluence_spaces")
+            found = 0
+            elements = self.driver.find_elements(By.XPATH, self.SPACE_LINK_XPATH)
+            for element in elements:
+                href = element.get_attribute("href")
+                if href and href not in links:
+                    links.append(href)
+                    found += 1
+            next_buttons = self.driver.find_elements(By.XPATH, self.NEXT_LINK_XPATH)
+            if not found or not next_buttons or not next_buttons[0].is_enabled():
+                break
+            next_buttons[0].click()
+            try:
+                # The next page replaces the links in place; wait until the old ones are gone
+                WebDriverWait(self.driver, self.waiter.timeout("confluence_spaces")).until(
+                    EC.staleness_of(elements[0]))
+            except TimeoutException:
+                log.debug("Spaces directory did not change after clicking Next")
+        log.info(f"Found {len(links)} spaces.")
+        return links
+
+    def _scrape_space(self, space_url):
+        """Breadth-first crawl of one space, one round of linked pages at a time."""
+        space = self._space_key(space_url)
+        log.info(f"Scraping space {space}: {space_url}")
+        self.open_page(space_url, page="confluence_space")
+        self.waiter.wait_for_any(self.driver, [self.PAGE_LINK_SELECTOR], name="confluence_space")
+        links = [element.get_attribute("href") for element in
+                 self.driver.find_elements(By.CSS_SELECTOR, self.PAGE_LINK_SELECTOR)]
+        frontier = self._unvisited(links, space)
+        while frontier:
+            links = []
+            for page in self._read_pages(frontier):
+                if page is None:
+                    continue
+                links.extend(page.pop("links"))
+                yield page
+            frontier = self._unvisited(links, space)
+
+    def _unvisited(self, links, space):
+        """Page URLs of space that were not read yet, marked as visited; stops at max_pages."""
+        pages = []
+        for link in links:
+            if self._budget_left() == 0:
+                break
+            match = self.PAGE_URL_PATTERN.search(link or "")
+            if not match or match.group(1) != space or match.group(2) in self.visited:
+                continue
+            self.visited.add(match.group(2))
+            parts = urlsplit(link)
+            pages.append(f"{parts.scheme}://{parts.netloc}{parts.path}")
+        return pages
+
+    def _budget_left(self):
+        """Pages still allowed by max_pages, or None when unlimited."""
+        if not self.max_pages:
+            return None
+        return max(0, self.max_pages - len(self.visited))
+
+    def _read_pages(self, urls):
+        """Read urls in order, in parallel on the pool's workers when workers > 1."""
+        if self.workers <= 1 or len(urls) == 1:
+            for url in urls:
+                yield self._scrape_page(url, self.driver)
+            return
+
+        free = queue.Queue()
+        for driver in self.pool.acquire_workers(self.workers):
+            free.put(driver)
+
+        def read(url):
+            driver = free.get()
+            try:
+                return self._scrape_page(url, driver)
+            finally:
+                free.put(driver)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            yield from executor.map(read, urls)
+
+    @metrics.timed("confluence_page")
+    def _scrape_page(self, url, driver):
+        """Open one page and read it; returns None when the page could not be read."""
+        log.debug("Scraping page %s", url)
+        content_selectors = selector_stats.ordered("confluence_content", self.CONTENT_SELECTORS)
+        try:
+            with rate_limiters.for_url(url).request() as ticket:
+                with metrics.timer("navigation", page="confluence_page"):
+                    driver.get(url)
+                result = self.waiter.wait_for_any(driver, content_selectors, name="confluence_content")
+                # Content that never appeared is only throttling when the server said so; a page
+                # load that timed out is reported by the limiter itself
+                if result.outcome == "timeout" and looks_throttled(driver.title):
+                    ticket.throttled()
+            raw = driver.execute_script(self.PAGE_SCRIPT, {
+                "content": content_selectors,
+                "title": self.TITLE_SELECTORS,
+                "attachments": self.ATTACHMENT_SELECTORS,
+            })
+        except Exception as e:
+            metrics.count("confluence_errors", stage="page")
+            log.warning("    Error reading page %s: %s - %s", url, type(e).__name__, e)
+            return None
+
+        winner = raw.get("contentSelector")
+        tried = content_selectors[:content_selectors.index(winner) + 1] if winner else content_selectors
+        selector_stats.record("confluence_content", winner, tried)
+        match = self.PAGE_URL_PATTERN.search(url)
+        return {
+            "url": url,
+            "page_id": match.group(2) if match else None,
+            "space": match.group(1) if match else None,
+            "title": raw.get("title") or "N/A",
+            "body": raw.get("body") or "",
+            "attachments": self._attachments(raw.get("attachments"), url),
+            "links": raw.get("links") or [],
+        }
+
+    @staticmethod
+    def _attachments(raw_attachments, page_url):
+        """Attachment metadata (name, url, extension), one entry per file."""
+        attachments, seen = [], set()
+        for item in raw_attachments or []:
+            href = item.get("url")
+            if not href:
+                continue
+            url = urljoin(page_url, href).split("?")[0]
+            if url in seen:
+                continue
+            seen.add(url)
+            name = unquote(url.rsplit("/", 1)[-1])
+            attachments.append({
+                "name": name,
+                "url": url,
+                "extension": name.rsplit(".", 1)[-1].lower() if "." in name else "",
+                "text": item.get("text") or "",
+            })
+        return attachments
+
+    @classmethod
+    def _space_key(cls, url):
+        match = cls.SPACE_URL_PATTERN.search(url)
+        return match.group(1) if match else None
+
+    def close(self):
+        """Save the learned selector order and close the pool if this scraper started it."""
+        selector_stats.save()
+        super().close()
+        if self.owns_pool:
+            self.pool.close()
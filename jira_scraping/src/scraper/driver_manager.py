@@ -0,0 +1,178 @@
+"""Self-healing WebDriver: recycles long-lived browsers and replaces dead ones."""
+
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, TimeoutException
+from urllib3.exceptions import HTTPError as Urllib3Error
+
+from scraper.instrumentation import log, metrics
+from scraper.jira_utils import JiraUtils
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Messages of errors that mean the browser or its tab is gone for good
+DEAD_SESSION_MARKERS = ("chrome not reachable", "disconnected", "session deleted", "tab crashed",
+                        "target window already closed", "no such session", "invalid session id")
+
+
+def browser_rss(driver):
+    """Resident memory in bytes of a driver's chromedriver and browser processes, or None without psutil."""
+    if psutil is None:
+        return None
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        return sum(p.memory_info().rss for p in [process] + process.children(recursive=True))
+    except (AttributeError, psutil.Error):
+        return None
+
+
+def kill_browser(driver):
+    """Kill a driver's chromedriver and, with psutil installed, every browser process it started."""
+    try:
+        process = driver.service.process
+    except AttributeError:
+        return
+    if psutil is not None:
+        try:
+            parent = psutil.Process(process.pid)
+            for child in parent.children(recursive=True):
+                child.kill()
+        except psutil.Error:
+            pass
+    try:
+        process.kill()
+    except Exception:
+        pass
+
+
+def is_dead_session_error(error):
+    """True when error means the browser crashed, hung up or lost its session."""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError, Urllib3Error)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in DEAD_SESSION_MARKERS)
+
+
+class ManagedDriver:
+    """Wraps a WebDriver and swaps in a fresh browser when the current one wears out or dies.
+
+    Everything else is passed through to the current driver, so code that
+    holds a ManagedDriver (scrapers, worker pools, the login handler) never
+    notices a swap. The driver is recycled after max_pages navigations or,
+    with psutil installed, once its processes use more than max_rss bytes.
+    A get() that fails on a crashed session, or times out on a browser that
+    no longer answers, replaces the browser and is tried once more. The new
+    browser is signed in with the last cookies remembered on the site, so no
+    login is needed; call remember_cookies() right after signing a browser
+    in. factory is called with the Chrome profile name to launch.
+    """
+
+    def __init__(self, factory, base_url, name="main", max_pages=500, max_rss=None, health_every=25,
+                 page_timeout=60):
+        self._factory = factory
+        self._site = urlsplit(base_url).netloc if base_url else None
+        self._base_url = base_url
+        self.name = name
+        self.max_pages = max_pages
+        self.max_rss = max_rss
+        self.health_every = max(1, health_every)
+        self.page_timeout = page_timeout
+        self.pages = 0
+        self.recycles = 0
+        self.rss = None
+        self._cookies = None
+        self._driver = self._launch(name)
+
+    def __getattr__(self, name):
+        if name == "_driver":
+            raise AttributeError(name)  # not launched yet
+        return getattr(self._driver, name)
+
+    def _launch(self, profile_name):
+        driver = self._factory(profile_name)
+        if self.page_timeout:
+            driver.set_page_load_timeout(self.page_timeout)  # a hung page raises instead of blocking forever
+        return driver
+
+    def get(self, url):
+        """Navigate, recycling the browser first when it is due and replacing it if it died."""
+        self._check_limits()
+        try:
+            self._driver.get(url)
+        except TimeoutException:
+            if self.is_alive():
+                raise  # just a slow page
+            self._replace("hung")
+            self._driver.get(url)
+        except Exception as e:
+            if not is_dead_session_error(e):
+                raise
+            self._replace("crash")
+            self._driver.get(url)
+        self.pages += 1
+        metrics.gauge("driver_pages", self.pages, driver=self.name)
+        if not self._cookies or self.pages % self.health_every == 0:
+            self.remember_cookies()
+
+    def is_alive(self):
+        """Whether the browser still answers a trivial script."""
+        try:
+            self._driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def recover(self):
+        """Replace the browser if it stopped answering; returns True when it was replaced."""
+        if self.is_alive():
+            return False
+        self._replace("crash")
+        return True
+
+    def _check_limits(self):
+        if self.max_pages and self.pages >= self.max_pages:
+            self._replace("pages")
+        elif self.max_rss and self.pages and self.pages % self.health_every == 0:
+            self.rss = browser_rss(self._driver)
+            if self.rss is not None:
+                metrics.gauge("driver_rss_mb", round(self.rss / 2**20, 1), driver=self.name)
+                if self.rss > self.max_rss:
+                    self._replace("memory")
+
+    def remember_cookies(self):
+        """Remember the session cookies (when the browser is on the site) for a replacement browser."""
+        try:
+            if self._site and urlsplit(self._driver.current_url).netloc == self._site:
+                self._cookies = self._driver.get_cookies()
+        except Exception:
+            pass
+
+    def _replace(self, reason):
+        """Quit the current browser and start a signed-in one in its place."""
+        if reason in ("pages", "memory"):
+            self.remember_cookies()  # the old browser is still healthy: take its latest cookies
+        log.info(f"Replacing browser {self.name} after {self.pages} pages ({reason})")
+        metrics.count("driver_recycles", driver=self.name, reason=reason)
+        try:
+            self._driver.quit()
+        except Exception:
+            kill_browser(self._driver)  # chromedriver itself no longer answers
+        try:
+            self._driver = self._launch(self.name)
+        except Exception as e:
+            # A browser process that outlived the kill still locks the profile: use a fresh one
+            log.warning(f"Relaunching browser {self.name} failed ({type(e).__name__}); using a new profile")
+            self._driver = self._launch(f"{self.name}-{self.recycles + 1}")
+        if self._cookies and self._base_url:
+            JiraUtils.apply_cookies(self._driver, self._cookies, self._base_url)
+        self.pages = 0
+        self.recycles += 1
+        self.rss = None
+
+    def stats(self):
+        """Pages on the current browser, browsers replaced so far and the last measured RSS."""
+        return {"driver": self.name, "pages": self.pages, "recycles": self.recycles,
+                "rss_mb": round(self.rss / 2**20, 1) if self.rss is not None else None}
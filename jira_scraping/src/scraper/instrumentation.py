@@ -0,0 +1,208 @@
+"""Scraper logging and in-process metrics (timers and counters)."""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from itertools import groupby
+
+from config import settings
+
+# Every module logs through this logger; messages look like the old prints
+log = logging.getLogger("scraper")
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.propagate = False
+log.setLevel(settings.LOG_LEVEL)
+
+
+class Metrics:
+    """Thread-safe counters and timers, exported as Prometheus text or JSON.
+
+    A metric is a name plus optional labels, e.g.
+    count("webdriver_commands", command="findElements"). Timers keep the
+    call count, total and maximum seconds; gauges keep the last value set
+    (e.g. the current request rate). When disabled every call returns
+    at once, so instrumented hot paths cost next to nothing.
+    """
+
+    PREFIX = "jira_scraper_"
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.timers = {}
+        self.gauges = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def count(self, name, amount=1, **labels):
+        """Add amount to a counter."""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def gauge(self, name, value, **labels):
+        """Set a gauge to value."""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            self.gauges[key] = value
+
+    def observe(self, name, seconds, **labels):
+        """Record one timed call."""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            calls, total, longest = self.timers.get(key, (0, 0.0, 0.0))
+            self.timers[key] = (calls + 1, total + seconds, max(longest, seconds))
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the with-block (also when it raises)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name, **labels):
+        """Decorator form of timer(); leaves the function untouched when metrics are off."""
+        def decorate(function):
+            if not self.enabled:
+                return function
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.timers.clear()
+            self.gauges.clear()
+
+    def summary(self):
+        """All metrics as a JSON-serialisable dict."""
+        with self.lock:
+            counters = dict(self.counters)
+            timers = dict(self.timers)
+            gauges = dict(self.gauges)
+        return {
+            "counters": [{"name": name, "labels": dict(labels), "value": value}
+                         for (name, labels), value in sorted(counters.items())],
+            "gauges": [{"name": name, "labels": dict(labels), "value": value}
+                       for (name, labels), value in sorted(gauges.items())],
+            "timers": [{"name": name, "labels": dict(labels), "calls": calls, "seconds": total,
+                        "mean_seconds": total / calls if calls else 0.0, "max_seconds": longest}
+                       for (name, labels), (calls, total, longest) in sorted(timers.items())],
+        }
+
+    def to_prometheus(self):
+        """Metrics in the Prometheus text exposition format."""
+        def series(name, labels, suffix=""):
+            label_text = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+            return f"{self.PREFIX}{name}{suffix}{{{label_text}}}" if label_text else f"{self.PREFIX}{name}{suffix}"
+
+        with self.lock:
+            counters = sorted(self.counters.items())
+            timers = sorted(self.timers.items())
+            gauges = sorted(self.gauges.items())
+        lines = []
+
+        def family(name, kind, description, samples):
+            # Every sample of one metric family goes under a single HELP/TYPE header
+            lines.append(f"# HELP {self.PREFIX}{name} {description}")
+            lines.append(f"# TYPE {self.PREFIX}{name} {kind}")
+            lines.extend(samples)
+
+        for name, group in groupby(counters, key=lambda item: item[0][0]):
+            family(f"{name}_total", "counter", f"Total {name}.",
+                   [f"{series(name, labels, '_total')} {value}" for (_, labels), value in group])
+        for name, group in groupby(gauges, key=lambda item: item[0][0]):
+            family(name, "gauge", f"Current {name}.",
+                   [f"{series(name, labels)} {value}" for (_, labels), value in group])
+        for name, group in groupby(timers, key=lambda item: item[0][0]):
+            group = list(group)
+            family(f"{name}_seconds", "summary", f"Seconds spent in {name}.",
+                   [line for (_, labels), (calls, total, _) in group
+                    for line in (f"{series(name, labels, '_seconds_count')} {calls}",
+                                 f"{series(name, labels, '_seconds_sum')} {total:.6f}")])
+            family(f"{name}_seconds_max", "gauge", f"Longest single {name}, in seconds.",
+                   [f"{series(name, labels, '_seconds_max')} {longest:.6f}"
+                    for (_, labels), (_, _, longest) in group])
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, fmt="json"):
+        """Write all metrics to path as "json" or "prometheus"."""
+        text = self.to_prometheus() if fmt == "prometheus" else json.dumps(self.summary(), indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def log_summary(self):
+        """Log the timers, slowest total first, at info level."""
+        if not self.enabled:
+            return
+        with self.lock:
+            timers = sorted(self.timers.items(), key=lambda item: -item[1][1])
+        log.info("=== Timings ===")
+        for (name, labels), (calls, total, longest) in timers:
+            label_text = ",".join(f"{k}={v}" for k, v in labels)
+            log.info(f"{name}{'[' + label_text + ']' if label_text else ''}: {calls} calls, "
+                     f"{total:.2f}s total, {total / calls * 1000:.1f}ms mean, {longest * 1000:.1f}ms max")
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics(settings.METRICS)
+
+
+def export_metrics(path=None):
+    """Log the timing summary and write the metrics file (settings.METRICS_FILE unless path is given)."""
+    if not metrics.enabled:
+        return None
+    metrics.log_summary()
+    if settings.METRICS_FORMAT not in ("json", "prometheus"):
+        return None
+    path = path or settings.METRICS_FILE
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    metrics.write(path, settings.METRICS_FORMAT)
+    log.info(f"Metrics written to {path}")
+    return path
+
+
+def count_webdriver_commands(driver):
+    """Count every command driver sends, per command name."""
+    if not metrics.enabled:
+        return driver
+    execute = driver.execute
+
+    def counted_execute(driver_command, params=None):
+        metrics.count("webdriver_commands", command=driver_command)
+        return execute(driver_command, params)
+
+    driver.execute = counted_execute
+    return driver
@@ -0,0 +1,238 @@
+"""Compact issue representations: a slotted record and a column-oriented batch."""
+
+import sys
+from array import array
+from datetime import datetime
+
+from scraper.jira_extractors import JiraExtractors
+
+NOT_AVAILABLE = "N/A"
+_NO_DATE = -(2 ** 63)  # stands for a missing date in the int64 date columns
+
+
+def _interned(value):
+    """None for empty/"N/A" values, else the interned string (one copy per distinct status, name...)."""
+    if not value or value == NOT_AVAILABLE:
+        return None
+    return sys.intern(value)
+
+
+class IssueRecord:
+    """One issue with typed fields.
+
+    status, priority and reporter are interned strings, created/updated are
+    epoch seconds (see JiraExtractors.parse_epoch) and "N/A" becomes None.
+    The detail lists (comments, labels...) are kept only when they were
+    scraped. Records are equal when every field is, hash by key and sort by
+    key in natural order (ABC-9 before ABC-10); sort on a field with e.g.
+    sorted(records, key=lambda r: r.updated or 0).
+    """
+
+    __slots__ = ("key", "url", "summary", "reporter", "priority", "status", "created", "updated",
+                 "description", "details")
+
+    def __init__(self, key, url, summary=None, reporter=None, priority=None, status=None,
+                 created=None, updated=None, description=None, details=None):
+        self.key = key
+        self.url = url
+        self.summary = summary
+        self.reporter = _interned(reporter)
+        self.priority = _interned(priority)
+        self.status = _interned(status)
+        self.created = created
+        self.updated = updated
+        self.description = description
+        self.details = details
+
+    @classmethod
+    def from_dict(cls, issue):
+        """Build a record from the scraper's issue dict, parsing the dates once."""
+        details = {field: issue[field] for field in JiraExtractors.DETAIL_FIELDS if field in issue} or None
+        summary = issue.get("summary")
+        return cls(
+            issue["key"],
+            issue.get("url"),
+            None if summary == NOT_AVAILABLE else summary,
+            issue.get("reporter"),
+            issue.get("priority"),
+            issue.get("status"),
+            JiraExtractors.parse_epoch(issue.get("created")),
+            JiraExtractors.parse_epoch(issue.get("updated")),
+            issue.get("description"),
+            details,
+        )
+
+    def to_dict(self):
+        """The issue dict schema used by the sinks, with display dates and "N/A" placeholders."""
+        issue = {
+            "key": self.key,
+            "url": self.url,
+            "summary": self.summary or NOT_AVAILABLE,
+            "reporter": self.reporter or NOT_AVAILABLE,
+            "priority": self.priority or NOT_AVAILABLE,
+            "status": self.status or NOT_AVAILABLE,
+            "created": JiraExtractors.format_epoch(self.created),
+            "updated": JiraExtractors.format_epoch(self.updated),
+        }
+        if self.description is not None:
+            issue["description"] = self.description
+        if self.details:
+            issue.update(self.details)
+        return issue
+
+    @property
+    def created_at(self):
+        return datetime.fromtimestamp(self.created) if self.created is not None else None
+
+    @property
+    def updated_at(self):
+        return datetime.fromtimestamp(self.updated) if self.updated is not None else None
+
+    def __eq__(self, other):
+        if not isinstance(other, IssueRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __lt__(self, other):
+        if not isinstance(other, IssueRecord):
+            return NotImplemented
+        return self._key_order() < other._key_order()
+
+    def _key_order(self):
+        """("ABC", 10) for "ABC-10", so issue numbers compare as numbers."""
+        project, _, number = self.key.rpartition("-")
+        return (project, int(number)) if number.isdigit() else (self.key, -1)
+
+    def __repr__(self):
+        return f"IssueRecord({self.key!r}, status={self.status!r}, priority={self.priority!r}, updated={self.updated!r})"
+
+
+class _Codes:
+    """Dictionary encoding for a low-cardinality column: one 32-bit int per row."""
+
+    def __init__(self):
+        self.values = [None]  # code 0 is "missing"
+        self.index = {None: 0}
+        self.codes = array("I")
+
+    def append(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def take(self, positions):
+        taken = _Codes()
+        taken.values, taken.index = self.values, self.index
+        taken.codes = array("I", (self.codes[i] for i in positions))
+        return taken
+
+    def __getitem__(self, position):
+        return self.values[self.codes[position]]
+
+
+class IssueBatch:
+    """Column-oriented container for large result sets.
+
+    Each field is stored as its own column: status, priority and reporter
+    as dictionary-encoded int arrays, created/updated as int64 arrays and
+    the remaining fields as plain lists. That is far smaller than one dict
+    per issue. sort_by() and filter() return new batches without building
+    per-issue objects; iterate or index to get IssueRecords back.
+    """
+
+    TEXT_COLUMNS = ("key", "url", "summary", "description", "details")
+    CODED_COLUMNS = ("reporter", "priority", "status")
+    DATE_COLUMNS = ("created", "updated")
+
+    def __init__(self, issues=()):
+        self.columns = {name: [] for name in self.TEXT_COLUMNS}
+        self.columns.update({name: _Codes() for name in self.CODED_COLUMNS})
+        self.columns.update({name: array("q") for name in self.DATE_COLUMNS})
+        self.extend(issues)
+
+    def append(self, issue):
+        """Add an issue dict or IssueRecord."""
+        record = issue if isinstance(issue, IssueRecord) else IssueRecord.from_dict(issue)
+        for name in self.TEXT_COLUMNS + self.CODED_COLUMNS:
+            self.columns[name].append(getattr(record, name))
+        for name in self.DATE_COLUMNS:
+            value = getattr(record, name)
+            self.columns[name].append(_NO_DATE if value is None else value)
+
+    def extend(self, issues):
+        for issue in issues:
+            self.append(issue)
+
+    def __len__(self):
+        return len(self.columns["key"])
+
+    def value(self, name, position):
+        """One cell, decoded (None for missing values)."""
+        column = self.columns[name]
+        if name in self.DATE_COLUMNS:
+            return None if column[position] == _NO_DATE else column[position]
+        return column[position]
+
+    def column(self, name):
+        """A whole column as a list of decoded values."""
+        return [self.value(name, i) for i in range(len(self))]
+
+    def __getitem__(self, position):
+        return IssueRecord(**{name: self.value(name, position) for name in IssueRecord.__slots__})
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def take(self, positions):
+        """A new batch with the rows at positions, in that order."""
+        positions = list(positions)
+        taken = IssueBatch()
+        for name, column in self.columns.items():
+            if name in self.CODED_COLUMNS:
+                taken.columns[name] = column.take(positions)
+            elif name in self.DATE_COLUMNS:
+                taken.columns[name] = array("q", (column[i] for i in positions))
+            else:
+                taken.columns[name] = [column[i] for i in positions]
+        return taken
+
+    def sort_by(self, name, reverse=False):
+        """A new batch ordered by one column; missing values sort last."""
+        values = self.column(name)
+        present = [i for i in range(len(self)) if values[i] is not None]
+        missing = [i for i in range(len(self)) if values[i] is None]
+        present.sort(key=values.__getitem__, reverse=reverse)
+        return self.take(present + missing)
+
+    def filter(self, predicate=None, **equals):
+        """A new batch of the rows where every column in equals has that value and predicate(record) holds.
+
+        Example: batch.filter(status="In Progress", priority="High").
+        Equality filters are checked on the columns directly; predicate builds a record per remaining row.
+        """
+        positions = range(len(self))
+        for name, wanted in equals.items():
+            column = self.columns[name]
+            if name in self.CODED_COLUMNS:
+                code = column.index.get(_interned(wanted) if isinstance(wanted, str) else wanted)
+                positions = [i for i in positions if code is not None and column.codes[i] == code]
+            else:
+                positions = [i for i in positions if self.value(name, i) == wanted]
+        if predicate is not None:
+            positions = [i for i in positions if predicate(self[i])]
+        return self.take(positions)
+
+    def updated_since(self, epoch):
+        """Rows updated at or after epoch seconds."""
+        dates = self.columns["updated"]
+        return self.take(i for i in range(len(self)) if dates[i] != _NO_DATE and dates[i] >= epoch)
+
+    def to_dicts(self):
+        """Issue dicts in the scraper's usual schema, e.g. to feed a sink."""
+        return [record.to_dict() for record in self]
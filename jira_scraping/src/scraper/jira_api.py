@@ -0,0 +1,183 @@
+"""Jira REST API client that reuses the browser's authenticated session."""
+
+import json
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import urllib3
+
+from config import settings
+from scraper.instrumentation import metrics
+from scraper.jira_extractors import JiraExtractors
+from scraper.rate_limit import THROTTLE_STATUSES, rate_limiters, retry_after_seconds
+
+
+class JiraApiError(Exception):
+    """Raised when the Jira REST API answers with a non-success status."""
+
+    def __init__(self, status, url, body=""):
+        super().__init__(f"HTTP {status} for {url}: {body[:200]}")
+        self.status = status
+        self.url = url
+
+
+class JiraApiClient:
+    """Fetches issues as JSON over a pooled keep-alive HTTP connection.
+
+    Selenium is only needed to log in: the client copies the driver's cookies
+    and sends them with every request, so the REST calls run as the same user.
+    Requests go through the host's rate limiter; a 429/503 answer makes it
+    back off and the request is retried up to throttle_retries times.
+    """
+
+    SEARCH_FIELDS = "summary,reporter,priority,status,created,updated"
+
+    def __init__(self, base_url, cookies=None, pool_size=10, timeout=30,
+                 throttle_retries=settings.RATE_LIMIT_RETRIES):
+        parts = urlsplit(base_url)
+        self.site_url = f"{parts.scheme}://{parts.netloc}"
+        self.limiter = rate_limiters.for_url(self.site_url)
+        self.throttle_retries = throttle_retries
+        self.http = urllib3.PoolManager(
+            maxsize=pool_size,
+            block=False,
+            retries=False,
+            timeout=urllib3.Timeout(connect=5, read=timeout),
+        )
+        self.headers = {"Accept": "application/json"}
+        if cookies:
+            self.set_cookies(cookies)
+
+    @classmethod
+    def from_driver(cls, driver, base_url, **kwargs):
+        """Create a client authenticated with the cookies of a logged-in driver."""
+        client = cls(base_url, **kwargs)
+        # WebDriver only exposes cookies of the current domain
+        if urlsplit(driver.current_url).netloc != urlsplit(client.site_url).netloc:
+            driver.get(client.site_url)
+        client.set_cookies(driver.get_cookies())
+        return client
+
+    def set_cookies(self, cookies):
+        """Send the given WebDriver cookies with every request."""
+        self.headers["Cookie"] = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+
+    def get_json(self, path, params=None):
+        """GET a REST resource and decode the JSON body."""
+        url = f"{self.site_url}{path}"
+        endpoint = path.split("/")[4] if path.startswith("/rest/api/") else path
+        for _ in range(self.throttle_retries + 1):
+            with self.limiter.request() as ticket, metrics.timer("api_request", endpoint=endpoint):
+                response = self.http.request("GET", url, fields=params, headers=self.headers)
+                if response.status in THROTTLE_STATUSES:
+                    ticket.throttled(retry_after_seconds(response.headers.get("Retry-After")))
+            if response.status not in THROTTLE_STATUSES:
+                break
+        if response.status != 200:
+            raise JiraApiError(response.status, url, response.data.decode("utf-8", "replace"))
+        return json.loads(response.data)
+
+    def search(self, jql, start_at=0, max_results=50):
+        """Run a JQL search and return (issues, total) for one page of results."""
+        data = self.get_json("/rest/api/3/search", {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results,
+            "fields": self.SEARCH_FIELDS,
+        })
+        issues = [self.to_issue(raw) for raw in data.get("issues", [])]
+        return issues, data.get("total", len(issues))
+
+    DETAIL_FIELDS = "description,comment,labels,components,issuelinks,attachment"
+
+    def fetch_details(self, issue_key, with_raw=False):
+        """Fetch the description, comments, labels, components, links and attachments of one issue.
+
+        With with_raw=True returns (details, raw JSON text of the response).
+        """
+        data = self.get_json(f"/rest/api/3/issue/{issue_key}", {"fields": self.DETAIL_FIELDS})
+        details = self.to_details(data)
+        return (details, json.dumps(data)) if with_raw else details
+
+    def to_details(self, raw):
+        """Map a REST issue into the detail fields produced by JiraExtractors.extract_issue_details."""
+        fields = raw.get("fields") or {}
+        comments = [{
+            "author": (comment.get("author") or {}).get("displayName"),
+            "created": self.format_date(comment.get("created")),
+            "body": self.adf_to_text(comment.get("body")),
+        } for comment in (fields.get("comment") or {}).get("comments", [])]
+        links = []
+        for link in fields.get("issuelinks") or []:
+            link_type = link.get("type") or {}
+            if link.get("outwardIssue"):
+                other, relation = link["outwardIssue"], link_type.get("outward")
+            elif link.get("inwardIssue"):
+                other, relation = link["inwardIssue"], link_type.get("inward")
+            else:
+                continue
+            links.append({"relation": relation, "key": other["key"], "url": f"{self.site_url}/browse/{other['key']}"})
+        return {
+            "description": self.adf_to_text(fields.get("description")) or "No description available",
+            "comments": comments,
+            "labels": list(fields.get("labels") or []),
+            "components": [c.get("name") for c in fields.get("components") or [] if c.get("name")],
+            "links": links,
+            "attachments": [{"name": a.get("filename"), "url": a.get("content")} for a in fields.get("attachment") or []],
+        }
+
+    def to_issue(self, raw):
+        """Map a REST issue into the dict schema produced by the row extractors."""
+        fields = raw.get("fields") or {}
+        reporter = fields.get("reporter") or {}
+        priority = fields.get("priority") or {}
+        status = fields.get("status") or {}
+        return {
+            "key": raw["key"],
+            "url": f"{self.site_url}/browse/{raw['key']}",
+            "summary": fields.get("summary") or "N/A",
+            "reporter": reporter.get("displayName") or "N/A",
+            "priority": priority.get("name") or "N/A",
+            "status": status.get("name") or "N/A",
+            "created": self.format_date(fields.get("created")),
+            "updated": self.format_date(fields.get("updated")),
+        }
+
+    @staticmethod
+    def format_date(value):
+        """Render an API timestamp the way the issue list displays it (e.g. 'Oct 3, 2025, 4:15 PM')."""
+        if not value:
+            return "N/A"
+        try:
+            d = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+        except ValueError:
+            return value
+        return JiraExtractors.format_date(d)
+
+    @staticmethod
+    def adf_to_text(node):
+        """Flatten an Atlassian Document Format tree into plain text."""
+        if not node:
+            return ""
+        if isinstance(node, str):
+            return node
+        node_type = node.get("type")
+        if node_type == "text":
+            return node.get("text", "")
+        if node_type == "hardBreak":
+            return "\n"
+        if node_type in ("mention", "emoji", "status", "date", "inlineCard"):
+            attrs = node.get("attrs") or {}
+            return attrs.get("text") or attrs.get("url") or ""
+
+        children = [JiraApiClient.adf_to_text(child) for child in node.get("content", [])]
+        if node_type in ("doc", "bulletList", "orderedList", "listItem", "blockquote",
+                         "panel", "table", "tableRow", "expand", "mediaGroup"):
+            return "\n".join(part for part in children if part).strip()
+        if node_type in ("paragraph", "heading", "codeBlock", "tableCell", "tableHeader"):
+            return "".join(children).strip()
+        return "".join(children)
+
+    def close(self):
+        """Drop all pooled connections."""
+        self.http.clear()
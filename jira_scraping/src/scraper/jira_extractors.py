@@ -1,106 +1,432 @@
 """Jira field extraction utilities - compact version."""
 
 from selenium.webdriver.common.by import By
+from datetime import datetime
+from functools import lru_cache
 import re
 
+from scraper.instrumentation import metrics
+from scraper.selector_stats import selector_stats
+
 
 class JiraExtractors:
     """Handles extraction of various fields from Jira issue rows."""
-    
+
+    DATE_FORMAT = "%b %d, %Y, %I:%M %p"  # e.g. "Oct 3, 2025, 4:15 PM"
+    DATE_PATTERN = re.compile(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{2}\s+[AP]M')
+
+    # Selector fallbacks per field, tried in order
+    KEY_SELECTORS = ["a[href*='/browse/']", ".issue-link", "[data-testid*='issue-key']"]
+    SUMMARY_SELECTORS = ["[data-testid*='summary']", ".summary", ".issue-summary"]
+    REPORTER_LABEL_SELECTORS = [("button[aria-label*='edit Reporter']", "aria-label"),
+                                ("span[aria-label*='More information about']", "aria-label")]
+    REPORTER_TEXT_SELECTORS = ["span[hidden]", "span._1reo15vq span", "[data-vc='profilecard-wrapper-ssr'] span"]
+    PRIORITY_SELECTORS = ["span._1reo15vq._18m915vq._18u0u2gc", ".priority", "[data-testid*='priority']"]
+    STATUS_SELECTORS = ["span._1reo15vq div._4cvr1h6o", ".status span", "[data-testid*='status'] span"]
+    DATE_CONTAINER_SELECTOR = "[data-testid='issue-field-inline-edit-read-view-container.ui.container']"
+    CREATED_BUTTON_SELECTOR = "button[aria-label='Edit Created']"
+    UPDATED_BUTTON_SELECTOR = "button[aria-label='Edit Updated']"
+
+    # Reads every field of every row in a single WebDriver round trip. It mirrors
+    # the selector fallbacks above and returns raw text plus the selector that
+    # matched each field (hits); cleaning stays in Python.
+    ROWS_SCRIPT = """
+        const rows = arguments[0], cfg = arguments[1];
+        const find = (root, selector) => { try { return root.querySelector(selector); } catch (e) { return null; } };
+        const text = (el) => (el.innerText || el.textContent || '').trim();
+        const firstText = (row, selectors, hits, field) => {
+            for (const selector of selectors) {
+                const el = find(row, selector);
+                if (el) {
+                    hits[field] = selector;
+                    return text(el);
+                }
+            }
+            return null;
+        };
+        const key = (row, hits) => {
+            for (const selector of cfg.key) {
+                const el = find(row, selector);
+                if (!el) continue;
+                const k = text(el), href = el.href || el.getAttribute('href');
+                if (k && href) {
+                    hits.key = selector;
+                    return [k, href];
+                }
+            }
+            return null;
+        };
+        const dateTexts = (row, button) => {
+            const found = [];
+            for (const container of row.querySelectorAll(cfg.dateContainer)) {
+                if (find(container, button)) found.push(text(container));
+            }
+            return found;
+        };
+        return rows.map((row) => {
+            const hits = {};
+            return {
+                key: key(row, hits),
+                summary: firstText(row, cfg.summary, hits, 'summary'),
+                reporterLabels: cfg.reporterLabels.map(([selector, attr]) => {
+                    const el = find(row, selector);
+                    return el ? el.getAttribute(attr) : null;
+                }),
+                reporterText: firstText(row, cfg.reporterText, hits, 'reporter'),
+                priority: firstText(row, cfg.priority, hits, 'priority'),
+                status: firstText(row, cfg.status, hits, 'status'),
+                created: dateTexts(row, cfg.createdButton),
+                updated: dateTexts(row, cfg.updatedButton),
+                rowText: row.innerText || '',
+                hits: hits
+            };
+        });
+    """
+
+    # Fields read from an opened issue page, besides the summary fields of the list
+    DETAIL_FIELDS = ["comments", "labels", "components", "links", "attachments"]
+    # Description placeholder of an issue whose details could not be fetched
+    FETCH_ERROR = "Error fetching description"
+    DESCRIPTION_CONTAINER_SELECTORS = [
+        "[data-testid='issue.views.field.rich-text.description']",
+        "[data-testid='issue.views.issue-base.foundation.description.description-content']",
+        ".user-content-block",
+        "[data-test-id='issue-description']",
+    ]
+    COMMENT_SELECTORS = ["[data-testid*='comment-base-item'][id^='comment-']", "[id^='comment-']", ".activity-comment"]
+    COMMENT_AUTHOR_SELECTORS = ["[data-testid*='author']", "a[href*='/people/']", ".user-hover"]
+    COMMENT_TIME_SELECTORS = ["time", "[data-testid*='timestamp']", ".livestamp"]
+    COMMENT_BODY_SELECTORS = [".ak-renderer-document", "[data-testid*='comment-base-item-body']", ".action-body"]
+    LABEL_SELECTORS = ["[data-testid='issue.views.field.labels'] a", "[data-testid*='labels'] a", ".labels a"]
+    COMPONENT_SELECTORS = ["[data-testid*='components'] a", "[data-testid*='components'] span[title]", ".components a"]
+    LINK_GROUP_SELECTORS = ["[data-testid*='issue-links'] [data-testid*='group']", "[data-testid*='issue-links']", "#linkingmodule"]
+    LINK_SELECTORS = ["a[href*='/browse/']"]
+    ATTACHMENT_SELECTORS = ["a[href*='/attachment/content/']", "a[href*='/secure/attachment/']",
+                            "[data-testid*='attachment'] a[download]"]
+
+    # Reads the description body and every secondary field of an issue page in
+    # one round trip, after the description wait has settled.
+    DETAILS_SCRIPT = """
+        const cfg = arguments[0];
+        const all = (root, selector) => { try { return Array.from(root.querySelectorAll(selector)); } catch (e) { return []; } };
+        const text = (el) => (el ? (el.innerText || el.textContent || '') : '').trim();
+        const firstAll = (root, selectors) => {
+            for (const selector of selectors) {
+                const found = all(root, selector);
+                if (found.length) return found;
+            }
+            return [];
+        };
+        const firstText = (root, selectors) => {
+            for (const selector of selectors) {
+                const el = all(root, selector)[0];
+                if (el && text(el)) return text(el);
+            }
+            return null;
+        };
+        const description = firstAll(document, cfg.description)[0];
+        const links = [];
+        for (const group of firstAll(document, cfg.linkGroups)) {
+            const heading = group.querySelector('h2, h3, h4, [data-testid*="heading"]');
+            for (const a of firstAll(group, cfg.links)) {
+                links.push({relation: text(heading) || null, key: text(a), url: a.href});
+            }
+        }
+        return {
+            description: text(description),
+            comments: firstAll(document, cfg.comments).map((c) => ({
+                author: firstText(c, cfg.commentAuthor),
+                created: (c.querySelector('time') || {}).dateTime || firstText(c, cfg.commentTime),
+                body: firstText(c, cfg.commentBody) || ''
+            })),
+            labels: firstAll(document, cfg.labels).map(text),
+            components: firstAll(document, cfg.components).map((el) => el.getAttribute('title') || text(el)),
+            links: links,
+            attachments: firstAll(document, cfg.attachments).map((a) => ({
+                name: a.getAttribute('download') || a.getAttribute('title') || text(a), url: a.href
+            }))
+        };
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def parse_date(text):
+        """Parse a displayed date such as 'Oct 3, 2025, 4:15 PM'; None if it is not one.
+
+        Display dates have minute resolution and repeat a lot across a crawl,
+        so results are cached instead of running strptime for every sink.
+        """
+        try:
+            return datetime.strptime(text, JiraExtractors.DATE_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def parse_epoch(text):
+        """A displayed date as epoch seconds (read in the local time zone, like SqliteSink's *_ts); None if unparseable."""
+        date = JiraExtractors.parse_date(text)
+        return int(date.timestamp()) if date else None
+
+    @staticmethod
+    def format_date(date):
+        """Render a datetime the way the issue list displays it (e.g. 'Oct 3, 2025, 4:15 PM')."""
+        return f"{date:%b} {date.day}, {date.year}, {date.hour % 12 or 12}:{date:%M} {date:%p}"
+
     @staticmethod
-    def _try_selectors(row, selectors):
-        """Try multiple selectors, return first match."""
-        for selector in selectors:
+    def format_epoch(epoch):
+        """Inverse of parse_epoch; "N/A" for None."""
+        return "N/A" if epoch is None else JiraExtractors.format_date(datetime.fromtimestamp(epoch))
+
+    @staticmethod
+    def _try_selectors(row, selectors, field="unknown"):
+        """Try multiple selectors, best performing first, and return the first match."""
+        selectors = selector_stats.ordered(field, selectors)
+        for position, selector in enumerate(selectors):
             try:
-                return row.find_element(By.CSS_SELECTOR, selector).text.strip()
+                text = row.find_element(By.CSS_SELECTOR, selector).text.strip()
             except:
+                metrics.count("selector_misses", field=field)
                 continue
+            if position:
+                metrics.count("selector_fallbacks", field=field)
+            selector_stats.record(field, selector, selectors[:position + 1])
+            return text
+        selector_stats.record(field, None, selectors)
         return None
-    
+
     @staticmethod
+    @metrics.timed("extract_field", field="key")
     def extract_issue_key(row, row_number):
         """Extract issue key and URL from row."""
-        for selector in ["a[href*='/browse/']", ".issue-link", "[data-testid*='issue-key']"]:
+        selectors = selector_stats.ordered("key", JiraExtractors.KEY_SELECTORS)
+        for position, selector in enumerate(selectors):
             try:
                 el = row.find_element(By.CSS_SELECTOR, selector)
                 key, url = el.text.strip(), el.get_attribute("href")
                 if key and url:
+                    selector_stats.record("key", selector, selectors[:position + 1])
                     return key, url
             except:
+                metrics.count("selector_misses", field="key")
                 continue
+        selector_stats.record("key", None, selectors)
         return None
 
     @staticmethod
+    @metrics.timed("extract_field", field="summary")
     def extract_summary(row):
         """Extract issue summary from row."""
-        selectors = ["[data-testid*='summary']", ".summary", ".issue-summary"]
-        return JiraExtractors._try_selectors(row, selectors) or "N/A"
+        return JiraExtractors._try_selectors(row, JiraExtractors.SUMMARY_SELECTORS, "summary") or "N/A"
 
     @staticmethod
+    @metrics.timed("extract_field", field="reporter")
     def extract_reporter(row, row_number):
         """Extract reporter name from row."""
         # Try aria-label first
-        for selector, attr in [("button[aria-label*='edit Reporter']", "aria-label"), 
-                               ("span[aria-label*='More information about']", "aria-label")]:
+        labels = selector_stats.ordered("reporter_label", JiraExtractors.REPORTER_LABEL_SELECTORS, key=lambda c: c[0])
+        for position, (selector, attr) in enumerate(labels):
             try:
-                text = row.find_element(By.CSS_SELECTOR, selector).get_attribute(attr)
-                clean = text.replace('- edit Reporter', '').replace('More information about', '').strip()
-                if clean and clean.lower() != "unassigned":
+                clean = JiraExtractors._clean_reporter_label(row.find_element(By.CSS_SELECTOR, selector).get_attribute(attr))
+                if clean:
+                    selector_stats.record("reporter_label", selector, [s for s, _ in labels[:position + 1]])
                     return clean
             except:
+                metrics.count("selector_misses", field="reporter_label")
                 continue
-        
+
         # Try text selectors
-        result = JiraExtractors._try_selectors(row, ["span[hidden]", "span._1reo15vq span", "[data-vc='profilecard-wrapper-ssr'] span"])
+        result = JiraExtractors._try_selectors(row, JiraExtractors.REPORTER_TEXT_SELECTORS, "reporter")
+        return JiraExtractors._clean_reporter_text(result)
+
+    @staticmethod
+    def _clean_reporter_label(text):
+        """Strip the aria-label wording around a reporter name; None if unusable."""
+        if not text:
+            return None
+        clean = text.replace('- edit Reporter', '').replace('More information about', '').strip()
+        return clean if clean and clean.lower() != "unassigned" else None
+
+    @staticmethod
+    def _clean_reporter_text(result):
+        """Normalise a reporter name read from visible text."""
         return result if result and result.lower() != "unassigned" else "N/A"
 
     @staticmethod
+    @metrics.timed("extract_field", field="priority")
     def extract_priority(row):
         """Extract priority from row."""
-        return JiraExtractors._try_selectors(row, ["span._1reo15vq._18m915vq._18u0u2gc", ".priority", "[data-testid*='priority']"]) or "N/A"
+        return JiraExtractors._try_selectors(row, JiraExtractors.PRIORITY_SELECTORS, "priority") or "N/A"
 
     @staticmethod
+    @metrics.timed("extract_field", field="status")
     def extract_status(row):
         """Extract status from row."""
-        result = JiraExtractors._try_selectors(row, ["span._1reo15vq div._4cvr1h6o", ".status span", "[data-testid*='status'] span"])
+        result = JiraExtractors._try_selectors(row, JiraExtractors.STATUS_SELECTORS, "status")
+        return JiraExtractors._clean_status(result)
+
+    @staticmethod
+    def _clean_status(result):
+        """Keep only the first line of a status cell."""
         return result.split('\n')[0] if result else "N/A"
 
     @staticmethod
+    @metrics.timed("extract_field", field="created")
     def extract_created(row):
         """Extract creation date from row."""
-        # Try Edit Created containers
-        try:
-            for container in row.find_elements(By.CSS_SELECTOR, "[data-testid='issue-field-inline-edit-read-view-container.ui.container']"):
-                try:
-                    container.find_element(By.CSS_SELECTOR, "button[aria-label='Edit Created']")
-                    date = re.search(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{2}\s+[AP]M', container.text)
-                    if date:
-                        return date.group(0)
-                except:
-                    continue
-        except:
-            pass
-        
-        # Fallback: first date in row
-        dates = re.findall(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{2}\s+[AP]M', row.text)
-        return dates[0] if dates else "N/A"
+        texts = JiraExtractors._date_container_texts(row, JiraExtractors.CREATED_BUTTON_SELECTOR)
+        return JiraExtractors._pick_date(texts, lambda: row.text, 0)
 
     @staticmethod
+    @metrics.timed("extract_field", field="updated")
     def extract_updated(row):
         """Extract last updated date from row."""
-        # Try Edit Updated containers
+        texts = JiraExtractors._date_container_texts(row, JiraExtractors.UPDATED_BUTTON_SELECTOR)
+        return JiraExtractors._pick_date(texts, lambda: row.text, 1)
+
+    @staticmethod
+    def _date_container_texts(row, button_selector):
+        """Texts of the inline-edit containers holding the given Edit button."""
+        texts = []
         try:
-            for container in row.find_elements(By.CSS_SELECTOR, "[data-testid='issue-field-inline-edit-read-view-container.ui.container']"):
+            for container in row.find_elements(By.CSS_SELECTOR, JiraExtractors.DATE_CONTAINER_SELECTOR):
                 try:
-                    container.find_element(By.CSS_SELECTOR, "button[aria-label='Edit Updated']")
-                    date = re.search(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{2}\s+[AP]M', container.text)
-                    if date:
-                        return date.group(0)
+                    container.find_element(By.CSS_SELECTOR, button_selector)
+                    texts.append(container.text)
                 except:
                     continue
         except:
             pass
-        
-        # Fallback: second date or first date in row
-        dates = re.findall(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4},\s+\d{1,2}:\d{2}\s+[AP]M', row.text)
-        return dates[1] if len(dates) > 1 else (dates[0] if dates else "N/A")
+        return texts
+
+    @staticmethod
+    def _pick_date(container_texts, row_text, position):
+        """First date found in the field containers, else the date at position in the row text.
+
+        row_text is a callable so the row is only read when the containers hold no date.
+        """
+        for text in container_texts:
+            date = JiraExtractors.DATE_PATTERN.search(text)
+            if date:
+                return date.group(0)
+
+        # Fallback: nth date in row (or the first if there are fewer)
+        dates = JiraExtractors.DATE_PATTERN.findall(row_text())
+        if len(dates) > position:
+            return dates[position]
+        return dates[0] if dates else "N/A"
+
+    @staticmethod
+    @metrics.timed("extract_rows_batch")
+    def extract_rows_batch(driver, rows):
+        """Extract the list fields of many rows with one execute_script call.
+
+        Returns one dict per row (same schema as the per-row extractors) or
+        None for rows without an issue key.
+        """
+        cfg = JiraExtractors.rows_script_config()
+        return JiraExtractors.issues_from_raw_rows(driver.execute_script(JiraExtractors.ROWS_SCRIPT, list(rows), cfg), cfg)
+
+    @staticmethod
+    def rows_script_config():
+        """Selector configuration passed to ROWS_SCRIPT, each list in learned order."""
+        return {
+            "key": selector_stats.ordered("key", JiraExtractors.KEY_SELECTORS),
+            "summary": selector_stats.ordered("summary", JiraExtractors.SUMMARY_SELECTORS),
+            "reporterLabels": JiraExtractors.REPORTER_LABEL_SELECTORS,
+            "reporterText": selector_stats.ordered("reporter", JiraExtractors.REPORTER_TEXT_SELECTORS),
+            "priority": selector_stats.ordered("priority", JiraExtractors.PRIORITY_SELECTORS),
+            "status": selector_stats.ordered("status", JiraExtractors.STATUS_SELECTORS),
+            "dateContainer": JiraExtractors.DATE_CONTAINER_SELECTOR,
+            "createdButton": JiraExtractors.CREATED_BUTTON_SELECTOR,
+            "updatedButton": JiraExtractors.UPDATED_BUTTON_SELECTOR,
+        }
+
+    @staticmethod
+    def issues_from_raw_rows(raw_rows, cfg):
+        """Turn ROWS_SCRIPT output into issue dicts and learn which selectors matched."""
+        fields = {"key": "key", "summary": "summary", "reporter": "reporterText", "priority": "priority", "status": "status"}
+        for raw in raw_rows:
+            hits = raw.get("hits") or {}
+            for field, cfg_name in fields.items():
+                selectors = cfg[cfg_name]
+                winner = hits.get(field)
+                selector_stats.record(field, winner, selectors[:selectors.index(winner) + 1] if winner in selectors else selectors)
+        return [JiraExtractors._issue_from_raw(raw) for raw in raw_rows]
+
+    @staticmethod
+    def _issue_from_raw(raw):
+        """Turn one row serialised by ROWS_SCRIPT into an issue dict."""
+        if not raw.get("key"):
+            return None
+        key, url = raw["key"]
+        row_text = raw.get("rowText") or ""
+        return {
+            "key": key,
+            "url": url,
+            "summary": raw.get("summary") or "N/A",
+            "reporter": (next(filter(None, map(JiraExtractors._clean_reporter_label, raw.get("reporterLabels") or [])), None)
+                         or JiraExtractors._clean_reporter_text(raw.get("reporterText"))),
+            "priority": raw.get("priority") or "N/A",
+            "status": JiraExtractors._clean_status(raw.get("status")),
+            "created": JiraExtractors._pick_date(raw.get("created") or [], lambda: row_text, 0),
+            "updated": JiraExtractors._pick_date(raw.get("updated") or [], lambda: row_text, 1),
+        }
+
+    @staticmethod
+    def extract_issue_details(driver):
+        """Read the full description, comments, labels, components, links and attachments of the open issue page."""
+        return JiraExtractors._details_from_raw(
+            driver.execute_script(JiraExtractors.DETAILS_SCRIPT, JiraExtractors.details_script_config())
+        )
+
+    @staticmethod
+    def details_script_config():
+        """Selector configuration passed to DETAILS_SCRIPT."""
+        return {
+            "description": JiraExtractors.DESCRIPTION_CONTAINER_SELECTORS,
+            "comments": JiraExtractors.COMMENT_SELECTORS,
+            "commentAuthor": JiraExtractors.COMMENT_AUTHOR_SELECTORS,
+            "commentTime": JiraExtractors.COMMENT_TIME_SELECTORS,
+            "commentBody": JiraExtractors.COMMENT_BODY_SELECTORS,
+            "labels": JiraExtractors.LABEL_SELECTORS,
+            "components": JiraExtractors.COMPONENT_SELECTORS,
+            "linkGroups": JiraExtractors.LINK_GROUP_SELECTORS,
+            "links": JiraExtractors.LINK_SELECTORS,
+            "attachments": JiraExtractors.ATTACHMENT_SELECTORS,
+        }
+
+    @staticmethod
+    def _details_from_raw(raw):
+        """Clean the dict returned by DETAILS_SCRIPT, dropping blanks and duplicates."""
+        raw = raw or {}
+        comments = [c for c in raw.get("comments") or [] if c.get("body") or c.get("author")]
+        links, seen = [], set()
+        for link in raw.get("links") or []:
+            if link.get("key") and link["key"] not in seen:
+                seen.add(link["key"])
+                links.append(link)
+        attachments, seen = [], set()
+        for attachment in raw.get("attachments") or []:
+            if attachment.get("url") and attachment["url"] not in seen:
+                seen.add(attachment["url"])
+                attachments.append(attachment)
+        return {
+            "description": (raw.get("description") or "").strip(),
+            "comments": comments,
+            "labels": list(dict.fromkeys(filter(None, raw.get("labels") or []))),
+            "components": list(dict.fromkeys(filter(None, raw.get("components") or []))),
+            "links": links,
+            "attachments": attachments,
+        }
+
+    @staticmethod
+    def empty_details(description):
+        """Detail fields for an issue whose page could not be read."""
+        details = {field: [] for field in JiraExtractors.DETAIL_FIELDS}
+        details["description"] = description
+        return details
+
+    @staticmethod
+    def fetch_failed(issue):
+        """True when the issue's details could not be fetched and it only holds the error placeholder."""
+        return issue.get("description") == JiraExtractors.FETCH_ERROR
@@ -5,24 +5,42 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from config import settings
+from scraper.instrumentation import log, metrics
 import time
 
 
 class JiraLogin:
     """Handles Jira authentication flow."""
+
+    EMAIL_SELECTOR = 'input[data-testid="username"]'
+    PASSWORD_SELECTOR = "#password"
+    SUBMIT_SELECTOR = 'button[type="submit"]'
+    VERIFY_XPATH = "//button[contains(., 'Verify') or contains(., 'Continue')]"
     
-    def __init__(self, driver):
+    def __init__(self, driver, waiter=None, session_cache=None):
         self.driver = driver
+        self.waiter = waiter
+        self.session_cache = session_cache
         self.login_done = False
     
+    @metrics.timed("login")
     def login(self, max_attempts=2):
-        """Perform Jira login with retry logic."""
+        """Perform Jira login with retry logic, reusing a cached session when it is still valid."""
+        if self.session_cache is not None and self.session_cache.enabled:
+            if self.session_cache.restore(self.driver):
+                self.login_done = True
+                self._remember_cookies()
+                return
+            log.info("[INFO] No valid cached session, logging in")
+
         attempt = 1
         while attempt <= max_attempts:
-            print(f"[INFO] Login attempt {attempt} of {max_attempts}")
+            log.info(f"[INFO] Login attempt {attempt} of {max_attempts}")
             try:
                 self._perform_login_attempt()
                 self.login_done = True
+                self._save_session()
+                self._remember_cookies()
                 return
 
             except Exception as e:
@@ -36,53 +54,69 @@ class JiraLogin:
         self.driver.get(LOGIN_URL)
 
         # Step 1: Enter email
-        print("Step 1: waiting for email field...")
-        email_input = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'input[data-testid="username"]')))
+        log.info("Step 1: waiting for email field...")
+        email_input = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, self.EMAIL_SELECTOR)))
         email_input.clear()
         email_input.send_keys(settings.JIRA_USERNAME)
 
-        continue_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[type="submit"]')))
+        continue_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, self.SUBMIT_SELECTOR)))
         continue_btn.click()
 
         # Step 2: Enter password
-        print("Step 2: waiting for password field...")
-        password_input = wait.until(EC.element_to_be_clickable((By.ID, "password")))
+        log.info("Step 2: waiting for password field...")
+        password_input = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, self.PASSWORD_SELECTOR)))
         password_input.clear()
         password_input.send_keys(settings.JIRA_PASSWORD)
 
-        login_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[type="submit"]')))
+        login_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, self.SUBMIT_SELECTOR)))
         login_btn.click()
 
         # Step 3: Handle optional verification
         self._handle_optional_verification()
 
         # Step 4: Wait for successful login
-        print("Step 4: waiting for Jira dashboard...")
+        log.info("Step 4: waiting for Jira dashboard...")
         wait.until(lambda d: "atlassian.net" in d.current_url)
-        print("After login, current URL is:", self.driver.current_url)
+        log.info(f"After login, current URL is: {self.driver.current_url}")
     
+    def _save_session(self):
+        """Persist the fresh session; a failure here must not fail the login."""
+        if self.session_cache is None:
+            return
+        try:
+            self.session_cache.save(self.driver)
+        except Exception as e:
+            log.warning(f"[WARN] Could not save session: {type(e).__name__} - {e}")
+
+    def _remember_cookies(self):
+        """Let a self-healing driver keep the signed-in cookies for the browsers that replace it."""
+        remember = getattr(self.driver, "remember_cookies", None)
+        if remember is not None:
+            remember()
+
     def _handle_optional_verification(self):
         """Handle optional 2FA or verification step."""
         try:
-            print("Step 3: checking for extra verification...")
+            log.info("Step 3: checking for extra verification...")
             verify_btn = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Verify') or contains(., 'Continue')]"))
+                EC.element_to_be_clickable((By.XPATH, self.VERIFY_XPATH))
             )
             verify_btn.click()
-            print("Extra verification step clicked.")
+            log.info("Extra verification step clicked.")
         except TimeoutException:
-            print("No extra verification step detected.")
+            log.info("No extra verification step detected.")
     
     def _handle_login_error(self, error, attempt, max_attempts):
         """Handle login errors with retry logic."""
-        print(f"[ERROR] Login attempt {attempt} failed: {type(error).__name__} - {error}")
+        log.error(f"[ERROR] Login attempt {attempt} failed: {type(error).__name__} - {error}")
         # screenshot_path = f"login_failed_attempt_{attempt}.png"
         # self.driver.save_screenshot(screenshot_path)
         # print(f"[DEBUG] Screenshot saved: {screenshot_path}")
 
         if attempt < max_attempts:
-            print("[INFO] Retrying in 5 seconds...")
-            time.sleep(5)
+            delay = self.waiter.backoff(attempt) if self.waiter else 5
+            log.info(f"[INFO] Retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
         else:
-            print("[FATAL] All login attempts failed.")
+            log.critical("[FATAL] All login attempts failed.")
             raise
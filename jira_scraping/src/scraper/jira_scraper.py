@@ -1,91 +1,404 @@
 """Main Jira scraper orchestrator."""
 
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
 from scraper.base_scraper import BaseScraper
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from scraper.checkpoint import CrawlCheckpoint
+from scraper.driver_manager import ManagedDriver
+from scraper.instrumentation import log, metrics
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from config import settings
 
+from scraper.jira_api import JiraApiClient
 from scraper.jira_login import JiraLogin
+from scraper.jira_state import JiraStateStore
+from scraper.issue_record import IssueBatch
 from scraper.jira_extractors import JiraExtractors
 from scraper.jira_utils import JiraUtils
+from scraper.jira_worker_pool import JiraWorkerPool
+from scraper.rate_limit import looks_throttled, rate_limiters
+from scraper.response_cache import ResponseCache
+from scraper.selector_stats import selector_stats
+from scraper.session_cache import SessionCache
 
 
 class JiraScraper(BaseScraper):
     """Main Jira scraper that orchestrates the scraping process."""
+
+    # Where an issue page renders its description, most specific first
+    DESCRIPTION_SELECTORS = [
+        "p[data-renderer-start-pos='1']",  # Your specific selector
+        "[data-testid='issue.views.issue-base.foundation.description.description-content'] p",
+        ".ak-editor-content-area p",
+        ".user-content-block p",
+        "[data-test-id='issue-description'] p"
+    ]
+    # Markers shown when an issue has no description at all
+    EMPTY_DESCRIPTION_SELECTORS = [
+        "[data-testid='issue.views.field.rich-text.description'] [data-testid*='placeholder']",
+        "[data-testid='issue.views.issue-base.foundation.description.description-content']:empty",
+    ]
+    # Longest waits, in seconds, for the issue list and for an issue's description
+    LIST_TIMEOUT = 15
+    DESCRIPTION_TIMEOUT = 10
     
-    def __init__(self, headless: bool = settings.HEADLESS):
-        super().__init__(settings.JIRA_URL, headless)  # Get base_url from settings
-        self.login_handler = JiraLogin(self.driver)
+    def __init__(self, headless: bool = settings.HEADLESS, description_workers: int = settings.DESCRIPTION_WORKERS,
+                 use_rest_api: bool = settings.USE_REST_API, incremental: bool = settings.INCREMENTAL,
+                 checkpointing: bool = settings.CHECKPOINT, pool=None):
+        super().__init__(settings.JIRA_URL, headless, pool)  # Get base_url from settings
+        if pool is not None:
+            self.login_handler = pool.login_handler  # one login for every scraper on the pool
+        else:
+            session_cache = SessionCache(settings.SESSION_CACHE, settings.SESSION_CACHE_KEY, self.base_url)
+            self.login_handler = JiraLogin(self.driver, self.waiter, session_cache)
+        self.description_workers = description_workers
+        self.worker_pool = None
+        self.use_rest_api = use_rest_api
+        self.api = None
+        self.state = JiraStateStore(settings.STATE_DB) if incremental else None
+        self.checkpointing = checkpointing
+        self.last_error = None
+        selector_stats.set_site(self.base_url)
+        self.cache = (ResponseCache(settings.CACHE_DIR, settings.CACHE_TTL, settings.CACHE_MAX_MB * 1024 * 1024)
+                      if settings.RESPONSE_CACHE else None)
 
     def login(self, max_attempts=2):
         """Perform Jira login."""
-        self.login_handler.login(max_attempts)
+        if self.pool is not None:
+            self.pool.login(max_attempts)
+        else:
+            self.login_handler.login(max_attempts)
+
+    def scrape(self, jql: str = None, page_size: int = settings.PAGE_SIZE):
+        """Scrape every issue matching jql and return them as a list."""
+        return list(self.iter_issues(jql, page_size))
+
+    def scrape_batch(self, jql: str = None, page_size: int = settings.PAGE_SIZE):
+        """Scrape every issue matching jql into a compact, sortable IssueBatch."""
+        return IssueBatch(self.iter_issues(jql, page_size))
+
+    def iter_issues(self, jql: str = None, page_size: int = settings.PAGE_SIZE, flush=None):
+        """Walk every result page of jql and yield each issue as soon as it is complete.
 
-    def scrape(self):
-        """Main scraping method that orchestrates the entire process."""
+        Only one page of issues is held at a time, so memory stays flat and
+        consumers can start working before the crawl ends. An error ends the
+        walk early and is kept in last_error.
+
+        flush, when given, must make every issue yielded so far durable (e.g.
+        flush the output sinks). Issues are checkpointed as completed and
+        recorded as synced only after it returned, once per page; without it an
+        issue counts as written as soon as the consumer has taken it.
+        """
         if not self.login_handler.login_done:
             self.login()
 
+        self.last_error = None
+        base_jql = jql or settings.JIRA_JQL or JiraUtils.default_jql(self.base_url)
+        jql = base_jql
+        watermark = None
+        if self.state is not None:
+            watermark = self.state.watermark(base_jql)
+            if watermark:
+                jql = JiraUtils.narrow_jql(base_jql, watermark)
+
+        checkpoint = None
+        if self.checkpointing:
+            pruned = CrawlCheckpoint.prune(settings.CHECKPOINT_DIR, settings.CHECKPOINT_MAX_AGE)
+            if pruned:
+                log.info(f"Removed {pruned} stale checkpoints")
+            checkpoint = CrawlCheckpoint(settings.CHECKPOINT_DIR, base_jql)
+        start, resumed_keys = 0, set()
+        failed = []  # issues whose details could not be fetched; the next run must list them again
+        written = []  # finished issues yielded but not yet flushed by the consumer
         try:
-            self._navigate_to_issues_page()
-            rows = JiraUtils.find_issue_rows(self.driver)
-            
-            if not rows:
-                return JiraUtils.fallback_extraction(self.driver)
-            
-            return self._extract_issues_from_rows(rows)
-            
+            if checkpoint is not None and checkpoint.exists and checkpoint.finished:
+                # The last run listed everything; retry its failed issues, then list afresh
+                pending = checkpoint.pending()
+                log.info(f"Retrying {len(pending)} issues that failed in the last run")
+                yield from self._finish_issues(pending, written, failed)
+                self._confirm_written(written, checkpoint, flush)
+                if self.state is not None:
+                    watermark = self._advance_watermark(pending, watermark)
+                # Issues that failed again are simply fetched once more by the new listing
+                retried_again = {issue['key'] for issue in failed}
+                resumed_keys = {issue['key'] for issue in pending} - retried_again
+                failed.clear()
+                checkpoint.begin(jql)
+            elif checkpoint is not None and checkpoint.exists:
+                # Resume the interrupted crawl with its own query, so the saved offset still applies
+                jql = checkpoint.query or jql
+                discovered, start = checkpoint.discovered()
+                pending = checkpoint.pending()
+                log.info(f"Resuming crawl: {len(discovered) - len(pending)} issues already done, "
+                         f"{len(pending)} pending")
+                resumed_keys = {issue['key'] for issue in discovered}
+                yield from self._finish_issues(pending, written, failed)
+                self._confirm_written(written, checkpoint, flush)
+                if self.state is not None:
+                    pending_keys = {issue['key'] for issue in pending}
+                    done = [issue for issue in discovered if issue['key'] not in pending_keys]
+                    watermark = self._advance_watermark(done + pending, watermark)
+            elif checkpoint is not None:
+                checkpoint.begin(jql)
+            log.info(f"Scraping issues for JQL: {jql}")
+
+            if start is not None:
+                if self.use_rest_api:
+                    pages = self._iter_api_pages(jql, page_size, start)
+                else:
+                    pages = self._iter_browser_pages(jql, page_size, start)
+
+                for issues, next_offset in pages:
+                    if resumed_keys:
+                        issues = [issue for issue in issues if issue['key'] not in resumed_keys]
+                    if checkpoint is not None:
+                        checkpoint.record_page(issues, next_offset)
+                    yield from self._finish_issues(issues, written, failed)
+                    self._confirm_written(written, checkpoint, flush)
+                    if self.state is not None:
+                        watermark = self._advance_watermark(issues, watermark)
+
+            # Only advance the watermark once the whole result set has been walked, and never past
+            # an issue that failed, so the narrowed query of the next run picks it up again
+            if self.state is not None:
+                watermark = JiraStateStore.watermark_before(failed, watermark)
+                if failed:
+                    log.info(f"{len(failed)} issues failed; the next incremental run fetches them again")
+                if watermark:
+                    self.state.set_watermark(base_jql, watermark)
+            if checkpoint is not None and failed:
+                # Failed issues are still pending in the checkpoint: the next run retries them first
+                checkpoint.finish()
+                log.info(f"Checkpoint kept in {checkpoint.directory} for {len(failed)} failed issues")
+            elif checkpoint is not None:
+                checkpoint.clear()
+
         except Exception as e:
-            return JiraUtils.handle_scraping_error(self.driver, e)
+            self.last_error = e
+            JiraUtils.handle_scraping_error(self.driver, e)
+            if checkpoint is not None:
+                try:
+                    self._confirm_written(written, checkpoint, flush)
+                except Exception as flush_error:
+                    log.warning(f"Could not checkpoint the last finished issues: {flush_error}")
+                log.info(f"Progress is checkpointed in {checkpoint.directory}; run again to resume")
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def _finish_issues(self, issues, written, failed):
+        """Fetch what is still missing for issues and yield each once it is complete.
 
-    def _navigate_to_issues_page(self):
-        """Navigate to the Jira issues page and wait for it to load."""
-        self.open_page(f"{self.base_url}/issues/?jql=ORDER%20BY%20created%20DESC")
-        print(f"Opened page: {self.driver.current_url}")
+        Issues whose fetch failed are yielded with the error placeholder and
+        appended to failed; the others are appended to written, to be
+        checkpointed and recorded as synced by _confirm_written.
+        """
+        if self.state is not None:
+            issues = self._changed_issues(issues)
+        for issue in self._complete_issues(issues):
+            # A failed issue stays pending in the checkpoint, so a resumed crawl tries it again
+            (failed if JiraExtractors.fetch_failed(issue) else written).append(issue)
+            yield issue
+
+    def _confirm_written(self, written, checkpoint, flush=None):
+        """Flush the consumer's output, then checkpoint and record every issue in written."""
+        if not written:
+            return
+        if flush is not None:
+            flush()
+        if checkpoint is not None:
+            checkpoint.record_completed(written)
+        if self.state is not None:
+            for issue in written:
+                self.state.record(issue)
+        written.clear()
+
+    @staticmethod
+    def _advance_watermark(issues, watermark):
+        """Fold the `updated` times of issues into watermark, leaving out issues whose fetch failed."""
+        return JiraStateStore.latest_update(
+            [issue for issue in issues if not JiraExtractors.fetch_failed(issue)], watermark)
+
+    def _changed_issues(self, issues):
+        """Keep only issues whose `updated` timestamp moved since the last sync."""
+        changed = [issue for issue in issues if self.state.has_changed(issue)]
+        log.info(f"Incremental sync: {len(changed)} of {len(issues)} issues changed")
+        return changed
+
+    def _iter_api_pages(self, jql, page_size, start=0):
+        """Yield (issues without descriptions, next offset or None after the last page) from REST search."""
+        api = self._api_client()
+        start_at = start
+        while True:
+            issues, total = api.search(jql, start_at, page_size)
+            if not issues:
+                return
+            log.info(f"Listed issues {start_at + 1}-{start_at + len(issues)} of {total} via REST API")
+            start_at += len(issues)
+            if start_at >= total:
+                yield issues, None
+                return
+            yield issues, start_at
+
+    def _api_client(self):
+        """The REST client, created from the browser's cookies on first use."""
+        if self.api is None:
+            self.api = JiraApiClient.from_driver(self.driver, self.base_url, pool_size=self._api_workers())
+        return self.api
+
+    def _api_workers(self):
+        """Threads fetching over the REST API, and connections kept open for them.
+
+        The rate limiter decides how many of them may call the API at once,
+        so there is one for each request it could ever admit.
+        """
+        return max(1, self.description_workers, rate_limiters.for_url(self.base_url).max_concurrency or 0)
+
+    def _iter_browser_pages(self, jql, page_size, start=0):
+        """Yield (issues without descriptions, next offset) per page of the issue navigator.
+
+        The navigator picks its own page length, so page_size is not used:
+        each page advances the offset by the rows it showed, and the walk
+        ends on an empty page or one with no issue that was not seen yet.
+        """
+        start_index = start
+        seen_keys = set()
+        while True:
+            try:
+                self._navigate_to_issues_page(jql, start_index)
+                rows = JiraUtils.find_issue_rows(self.driver)
+            except WebDriverException:
+                # A browser that died mid-page is replaced (cookies restored) and the page read again
+                if not isinstance(self.driver, ManagedDriver) or not self.driver.recover():
+                    raise
+                self._navigate_to_issues_page(jql, start_index)
+                rows = JiraUtils.find_issue_rows(self.driver)
+
+            if not rows:
+                if start_index == 0:
+                    yield JiraUtils.fallback_extraction(self.driver), None
+                return
+
+            issues = self._extract_issues_from_rows(rows)
+            # The navigator ignores out-of-range offsets and shows the last page again
+            new_issues = []
+            for issue in issues:
+                if issue['key'] not in seen_keys:
+                    seen_keys.add(issue['key'])
+                    new_issues.append(issue)
+            if not new_issues:
+                return
+            start_index += len(rows)
+            yield new_issues, start_index
+
+    def _navigate_to_issues_page(self, jql, start_index=0):
+        """Navigate to one page of the Jira issues list and wait for it to load."""
+        url = f"{self.base_url}/issues/?jql={quote(jql)}"
+        if start_index:
+            url += f"&startIndex={start_index}"
+        self.open_page(url, page="issue_list")
+        log.debug("Opened page: %s", self.driver.current_url)
         
-        wait = WebDriverWait(self.driver, 15)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/browse/']")))
+        # A fixed budget: a list page that is merely slower than usual must not end the crawl
+        result = self.waiter.wait_for_any(self.driver, ["a[href*='/browse/']"], name="issue list",
+                                          max_timeout=self.LIST_TIMEOUT, adaptive=False)
+        if result.outcome == "timeout":
+            raise TimeoutException(f"No issue links appeared within {result.seconds:.1f}s")
 
+    @metrics.timed("extract_rows")
     def _extract_issues_from_rows(self, rows):
-        """Extract issue information from found rows."""
+        """Extract issue information (without descriptions) from found rows."""
         issues = []
         total_rows = len(rows)
-        print(f"Processing all {total_rows} rows")
+        log.debug("Processing all %d rows", total_rows)
         
-        # First pass: extract all basic data (without descriptions)
-        print("Phase 1: Extracting basic issue data...")
+        log.debug("Phase 1: Extracting basic issue data...")
+        try:
+            issues = [issue for issue in JiraExtractors.extract_rows_batch(self.driver, rows) if issue]
+            log.info(f"Phase 1 complete: Found {len(issues)} issues (batched extraction)")
+            return issues
+        except Exception as e:
+            metrics.count("swallowed_exceptions", where="extract_rows_batch")
+            log.warning(f"Batched extraction failed, falling back to row by row: {type(e).__name__} - {e}")
+
         for i, row in enumerate(rows):
             try:
-                print(f"Processing row {i+1}/{total_rows}")
+                log.debug("Processing row %d/%d", i + 1, total_rows)
                 issue_data = self._extract_issue_data_from_row_without_description(row, i+1)
                 if issue_data:
                     issues.append(issue_data)
-                    print(f"  Successfully extracted: {issue_data['key']}")
+                    log.debug("  Successfully extracted: %s", issue_data['key'])
                 else:
-                    print(f"  No data extracted from row {i+1}")
+                    log.debug("  No data extracted from row %d", i + 1)
                     
             except Exception as e:
-                print(f"ERROR processing row {i+1}: {type(e).__name__} - {e}")
+                metrics.count("swallowed_exceptions", where="extract_row")
+                log.error("ERROR processing row %d: %s - %s", i + 1, type(e).__name__, e)
                 continue
 
-        print(f"Phase 1 complete: Found {len(issues)} issues")
-        
-        # Second pass: fetch descriptions
-        print("Phase 2: Fetching descriptions...")
+        log.info(f"Phase 1 complete: Found {len(issues)} issues")
+        return issues
+
+    def _complete_issues(self, issues):
+        """Fetch the issue page details of a page of issues, yielding each issue once it has them."""
+        if all('description' in issue for issue in issues):
+            yield from issues
+            return
+
+        if self.cache is not None:
+            pending = []
+            for issue in issues:
+                cached = self._cached_details(issue)
+                if cached is None:
+                    pending.append(issue)
+                else:
+                    issue.update(cached)
+                    yield issue
+            log.info(f"Response cache: {len(issues) - len(pending)} of {len(issues)} issues cached")
+            issues = pending
+            if not issues:
+                return
+
+        log.info("Phase 2: Fetching descriptions, comments and links...")
+        if self.use_rest_api:
+            self._api_client()  # created once here, before the threads share it
+            with ThreadPoolExecutor(max_workers=self._api_workers()) as executor:
+                for issue, details in zip(issues, executor.map(self._fetch_api_details, issues)):
+                    issue.update(details)
+                    yield issue
+            return
+
+        if self.description_workers > 1:
+            if self.worker_pool is None:
+                self.worker_pool = JiraWorkerPool(self, self.description_workers)
+            yield from self.worker_pool.iter_descriptions(issues)
+            return
+
         for i, issue in enumerate(issues):
+            log.debug("Fetching details for %d/%d: %s", i + 1, len(issues), issue['key'])
             try:
-                print(f"Fetching description for {i+1}/{len(issues)}: {issue['key']}")
-                description = self._fetch_issue_description(issue['url'])
-                issue['description'] = description
-                    
+                issue.update(self._load_and_cache(issue))
             except Exception as e:
-                print(f"ERROR fetching description for {issue['key']}: {type(e).__name__} - {e}")
-                issue['description'] = "Error fetching description"
-                continue
+                metrics.count("description_errors", source="browser")
+                log.warning("    Error fetching description: %s", e)
+                issue.update(JiraExtractors.empty_details(JiraExtractors.FETCH_ERROR))
+            yield issue
 
-        print(f"Found {len(issues)} issues total")
-        return issues
+    @metrics.timed("description_fetch", source="api")
+    def _fetch_api_details(self, issue):
+        """Fetch the details of one issue over the REST API."""
+        try:
+            api = self._api_client()
+            if self.cache is None:
+                return api.fetch_details(issue['key'])
+            details, raw = api.fetch_details(issue['key'], with_raw=True)
+            self._store_details(issue, details, raw, "json")
+            return details
+        except Exception as e:
+            metrics.count("description_errors", source="api")
+            log.error("ERROR fetching description for %s: %s - %s", issue['key'], type(e).__name__, e)
+            return JiraExtractors.empty_details(JiraExtractors.FETCH_ERROR)
 
     def _extract_issue_data_from_row(self, row, row_number):
         """Extract all issue data from a single row."""
@@ -153,53 +466,112 @@ class JiraScraper(BaseScraper):
 
     def close(self):
         """Close the scraper."""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+        if self.api is not None:
+            self.api.close()
+        if self.state is not None:
+            self.state.close()
+        if isinstance(self.driver, ManagedDriver):
+            log.info(f"Browser: {self.driver.stats()}")
+        for limits in rate_limiters.snapshot():
+            log.info(f"Rate limit {limits['host']}: {limits['rate']:.1f} req/s, {limits['concurrency']} at once")
+        if self.cache is not None:
+            log.info(f"Response cache: {self.cache.stats()}")
+            self.cache.close()
+        selector_stats.save()
         super().close()
 
-    def _fetch_issue_description(self, issue_url):
+    def _fetch_issue_description(self, issue_url, driver=None):
         """Fetch the description from an individual issue page."""
         try:
-            # Convert relative URL to absolute URL if needed
-            if issue_url.startswith('/browse/'):
-                full_url = f"{self.base_url}{issue_url}"
-            else:
-                full_url = issue_url
-            
-            print(f"    Fetching description from: {full_url}")
-            
-            # Navigate to the issue page
-            self.driver.get(full_url)
-            
-            # Wait for the description element to load
-            wait = WebDriverWait(self.driver, 10)
-            
-            # Try multiple selectors for the description
-            description_selectors = [
-                "p[data-renderer-start-pos='1']",  # Your specific selector
-                "[data-testid='issue.views.issue-base.foundation.description.description-content'] p",
-                ".ak-editor-content-area p",
-                ".user-content-block p",
-                "[data-test-id='issue-description'] p"
-            ]
-            
-            description_text = "No description available"
-            
-            for selector in description_selectors:
-                try:
-                    desc_element = wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    description_text = desc_element.text.strip()
-                    if description_text:
-                        print(f"    Found description: {description_text[:100]}...")
-                        break
-                except:
-                    continue
-            
-            if description_text == "No description available":
-                print("    No description found with any selector")
-            
-            return description_text
-            
+            details, _, _ = self._load_issue_details(issue_url, driver)
+            return details['description']
         except Exception as e:
-            print(f"    Error fetching description: {e}")
-            return "Error fetching description"
+            log.warning("    Error fetching description: %s", e)
+            return JiraExtractors.FETCH_ERROR
+
+    @metrics.timed("description_fetch", source="browser")
+    def _load_issue_details(self, issue_url, driver=None, with_raw=False):
+        """Open an issue page on driver and read the description and every detail field; errors propagate.
+
+        The page is visited once: after the description wait settles, one
+        script collects the full description, comments, labels, components,
+        links and attachments. Returns (details, wait outcome, page HTML): the
+        outcome is "match", "empty" or "timeout" and the HTML is only read
+        with with_raw=True (None otherwise).
+        """
+        driver = driver or self.driver
+
+        # Convert relative URL to absolute URL if needed
+        if issue_url.startswith('/browse/'):
+            full_url = f"{self.base_url}{issue_url}"
+        else:
+            full_url = issue_url
+
+        log.debug("    Fetching description from: %s", full_url)
+
+        # Navigate to the issue page and race all description selectors; an empty-description
+        # placeholder ends the wait early. When several match, the one that won most often before
+        # is preferred. A wait cut short by the adaptive timeout gets one more try with the full
+        # budget; only a throttle page makes the rate limiter back off, and a page load that timed
+        # out raises.
+        selectors = selector_stats.ordered("description", self.DESCRIPTION_SELECTORS)
+        with rate_limiters.for_url(full_url).request() as ticket:
+            with metrics.timer("navigation", page="issue"):
+                driver.get(full_url)
+            result = self.waiter.wait_for_any(driver, selectors, self.EMPTY_DESCRIPTION_SELECTORS,
+                                              name="description", max_timeout=self.DESCRIPTION_TIMEOUT)
+            if result.outcome == "timeout" and looks_throttled(driver.title):
+                ticket.throttled()
+            elif result.outcome == "timeout" and result.timeout < self.DESCRIPTION_TIMEOUT:
+                result = self.waiter.wait_for_any(driver, selectors, self.EMPTY_DESCRIPTION_SELECTORS,
+                                                  name="description", max_timeout=self.DESCRIPTION_TIMEOUT,
+                                                  adaptive=False)
+        if result.outcome == "match":
+            selector_stats.record("description", result.selector, selectors)
+
+        details = JiraExtractors.extract_issue_details(driver)
+        description_text = "No description available"
+        if result.outcome == "match":
+            # The whole description body when its container was found, else the first paragraph
+            description_text = details['description'] or result.element.text.strip() or description_text
+            log.debug("    Found description in %.2fs: %.100s...", result.seconds, description_text)
+        elif result.outcome == "empty":
+            log.debug("    Issue has no description (confirmed in %.2fs)", result.seconds)
+        else:
+            # Neither a description nor the empty-state marker: the page never finished rendering,
+            # so the issue counts as failed and is fetched again on the next run
+            log.debug("    No description found with any selector")
+            description_text = JiraExtractors.FETCH_ERROR
+        details['description'] = description_text
+        log.debug("    %d comments, %d links, %d attachments",
+                  len(details['comments']), len(details['links']), len(details['attachments']))
+
+        return details, result.outcome, driver.page_source if with_raw else None
+
+    def _load_and_cache(self, issue, driver=None):
+        """Load an issue's details in the browser and store them in the response cache.
+
+        A description wait that timed out is a failed fetch, so that result is
+        returned but not cached.
+        """
+        with_raw = self.cache is not None and settings.CACHE_RAW
+        details, outcome, html = self._load_issue_details(issue['url'], driver, with_raw=with_raw)
+        if outcome != "timeout":
+            self._store_details(issue, details, html, "html")
+        return details
+
+    def _cached_details(self, issue):
+        """Details stored for this exact version of the issue, or None."""
+        if self.cache is None or issue.get('updated', "N/A") == "N/A":
+            return None
+        entry = self.cache.get(issue['key'], issue['updated'])
+        return entry.get("details") if entry else None
+
+    def _store_details(self, issue, details, raw=None, raw_type=None):
+        """Cache freshly fetched details (when the issue's version is known)."""
+        if self.cache is None or issue.get('updated', "N/A") == "N/A":
+            return
+        self.cache.put(issue['key'], issue['updated'], details,
+                       raw if settings.CACHE_RAW else None, raw_type)
@@ -0,0 +1,96 @@
+"""Local state store for incremental Jira syncs."""
+
+import os
+import sqlite3
+from datetime import datetime
+
+from scraper.jira_extractors import JiraExtractors
+
+
+class JiraStateStore:
+    """Remembers each issue's `updated` timestamp and a watermark per JQL query.
+
+    The watermark lets the next run narrow its query to recently updated
+    issues, and the per-issue timestamps tell which of those actually moved.
+    """
+
+    WATERMARK_FORMAT = "%Y/%m/%d %H:%M"  # JQL date literal format
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                key TEXT PRIMARY KEY,
+                updated TEXT NOT NULL,
+                synced_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS watermarks (
+                jql TEXT PRIMARY KEY,
+                updated TEXT NOT NULL
+            );
+        """)
+
+    def watermark(self, jql):
+        """Return the newest `updated` time seen by the last complete sync of jql, or None."""
+        row = self.conn.execute("SELECT updated FROM watermarks WHERE jql = ?", (jql,)).fetchone()
+        return datetime.strptime(row[0], self.WATERMARK_FORMAT) if row else None
+
+    def set_watermark(self, jql, updated):
+        """Store the watermark for jql after a sync has finished."""
+        self.conn.execute(
+            "INSERT INTO watermarks (jql, updated) VALUES (?, ?) "
+            "ON CONFLICT(jql) DO UPDATE SET updated = excluded.updated",
+            (jql, updated.strftime(self.WATERMARK_FORMAT)),
+        )
+        self.conn.commit()
+
+    def has_changed(self, issue):
+        """True when the issue is new or its `updated` value differs from the stored one."""
+        if issue.get('updated', "N/A") == "N/A":
+            return True
+        row = self.conn.execute("SELECT updated FROM issues WHERE key = ?", (issue['key'],)).fetchone()
+        return row is None or row[0] != issue['updated']
+
+    def record(self, issue):
+        """Remember that the issue has been synced at its current `updated` value."""
+        if issue.get('updated', "N/A") == "N/A":
+            return
+        self.conn.execute(
+            "INSERT INTO issues (key, updated, synced_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET updated = excluded.updated, synced_at = excluded.synced_at",
+            (issue['key'], issue['updated'], datetime.now().isoformat(timespec="seconds")),
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def latest_update(issues, current=None):
+        """Return the newest parsed `updated` time among issues, starting from current."""
+        latest = current
+        for issue in issues:
+            updated = JiraExtractors.parse_date(issue.get('updated'))
+            if updated and (latest is None or updated > latest):
+                latest = updated
+        return latest
+
+    @staticmethod
+    def watermark_before(failed, watermark):
+        """Move watermark back so that a query narrowed to it lists every failed issue again.
+
+        Returns None when a failed issue has no usable `updated` time, as no
+        watermark can then be trusted to include it.
+        """
+        for issue in failed:
+            updated = JiraExtractors.parse_date(issue.get('updated'))
+            if updated is None:
+                return None
+            if watermark is None or updated < watermark:
+                watermark = updated
+        return watermark
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
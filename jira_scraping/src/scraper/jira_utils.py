@@ -1,39 +1,54 @@
 """Jira utility functions."""
 
+import re
 from selenium.webdriver.common.by import By
+from scraper.instrumentation import log, metrics
+from scraper.selector_stats import selector_stats
 
 
 class JiraUtils:
     """Utility functions for Jira scraping."""
+
+    ROW_SELECTORS = [
+        "[data-testid='issue-list.ui.list-item']",  # Most specific
+        "tr[data-testid*='issue']",  # Table rows
+        "div[data-testid*='issue']",  # Div containers
+        ".issuerow",  # Classic Jira class
+        "tr.issuerow",  # Table row with class
+        "a[href*='/browse/']"  # Fallback: just find all issue links
+    ]
     
     @staticmethod
+    @metrics.timed("row_discovery")
     def find_issue_rows(driver):
-        """Try multiple selectors to find issue rows on the page."""
-        selectors_to_try = [
-            "[data-testid='issue-list.ui.list-item']",  # Most specific
-            "tr[data-testid*='issue']",  # Table rows
-            "div[data-testid*='issue']",  # Div containers
-            ".issuerow",  # Classic Jira class
-            "tr.issuerow",  # Table row with class
-            "a[href*='/browse/']"  # Fallback: just find all issue links
-        ]
+        """Try multiple selectors, most precise first, to find issue rows on the page.
 
-        for selector in selectors_to_try:
+        The order is fixed rather than learned: the broad fallbacks match on
+        almost every page, so once promoted they would always win and the
+        precise row selectors would never be tried again.
+        """
+        selectors = JiraUtils.ROW_SELECTORS
+        for position, selector in enumerate(selectors):
             try:
                 potential_rows = driver.find_elements(By.CSS_SELECTOR, selector)
                 if potential_rows:
-                    print(f"Found {len(potential_rows)} elements with selector: {selector}")
+                    if position:
+                        metrics.count("selector_fallbacks", field="rows")
+                    selector_stats.record("rows", selector, selectors[:position + 1])
+                    log.debug("Found %d elements with selector: %s", len(potential_rows), selector)
                     return potential_rows
             except Exception as e:
-                print(f"Selector {selector} failed: {e}")
+                metrics.count("selector_misses", field="rows")
+                log.debug("Selector %s failed: %s", selector, e)
                 continue
-        
+
+        selector_stats.record("rows", None, selectors)
         return []
     
     @staticmethod
     def fallback_extraction(driver):
         """Fallback method to extract basic issue information when row structure is not found."""
-        print("No issue rows found with any selector. Trying direct link extraction...")
+        log.warning("No issue rows found with any selector. Trying direct link extraction...")
         issues = []
         
         issue_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/browse/']")
@@ -54,20 +69,68 @@ class JiraUtils:
                         "description": "Description not available"
                     })
             except Exception as e:
-                print(f"Error extracting link: {e}")
+                log.debug("Error extracting link: %s", e)
                 continue
         
-        print(f"Found {len(issues)} issues using fallback method")
+        log.info(f"Found {len(issues)} issues using fallback method")
         return issues
     
+    @staticmethod
+    def default_jql(board_url):
+        """Build the issue list query, scoped to the project named in the board URL."""
+        match = re.search(r"/projects/([^/]+)", board_url or "")
+        if match:
+            return JiraUtils.project_jql(match.group(1))
+        return "ORDER BY created DESC"
+
+    @staticmethod
+    def project_jql(project_key):
+        """JQL listing every issue of one project, newest first."""
+        return f'project = "{project_key}" ORDER BY created DESC'
+
+    @staticmethod
+    def narrow_jql(jql, updated_since):
+        """Restrict jql to issues updated at or after updated_since, keeping its ORDER BY."""
+        match = re.search(r"\border\s+by\b", jql, re.IGNORECASE)
+        where, order = (jql[:match.start()], jql[match.start():]) if match else (jql, "")
+        condition = f'updated >= "{updated_since:%Y/%m/%d %H:%M}"'
+        where = where.strip()
+        where = f"({where}) AND {condition}" if where else condition
+        return f"{where} {order}".strip()
+
+    @staticmethod
+    def apply_cookies(driver, cookies, url):
+        """Load cookies taken from another session into driver.
+
+        The driver is first pointed at url so the cookies land on the right
+        domain; cookies belonging to other domains are skipped.
+        """
+        driver.get(url)
+        added = 0
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items()
+                      if k in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")}
+            try:
+                driver.add_cookie(cookie)
+                added += 1
+            except Exception:
+                continue
+        remember = getattr(driver, "remember_cookies", None)
+        if remember is not None:
+            remember()  # a ManagedDriver signs its replacement browsers in with these
+        return added
+
     @staticmethod
     def handle_scraping_error(driver, error):
         """Handle errors that occur during scraping."""
-        print(f"Error during scraping: {error}")
-        print(f"Current URL: {driver.current_url}")
-        screenshot_path = "scrape_error.png"
-        driver.save_screenshot(screenshot_path)
-        print(f"Screenshot saved as {screenshot_path}")
+        log.error(f"Error during scraping: {error}")
+        try:
+            log.error(f"Current URL: {driver.current_url}")
+            screenshot_path = "scrape_error.png"
+            driver.save_screenshot(screenshot_path)
+            log.error(f"Screenshot saved as {screenshot_path}")
+        except Exception as e:
+            log.error(f"Browser not answering, no screenshot: {type(e).__name__}")
         return []
     
     @staticmethod
@@ -75,9 +138,18 @@ class JiraUtils:
         """Print formatted list of issues."""
         print("\n=== Jira Issues ===")
         for issue in issues:
-            print(f"{issue['key']} | {issue['summary']}")
-            print(f"  Reporter: {issue['reporter']} | Priority: {issue['priority']} | Status: {issue['status']}")
-            print(f"  Created: {issue['created']} | Updated: {issue['updated']}")
-            print(f"  Description: {issue.get('description', 'N/A')[:200]}...")  # Show first 200 chars
-            print(f"  URL: {issue['url']}")
-            print("  " + "-"*50)
+            JiraUtils.print_issue(issue)
+
+    @staticmethod
+    def print_issue(issue):
+        """Print a single formatted issue."""
+        print(f"{issue['key']} | {issue['summary']}")
+        print(f"  Reporter: {issue['reporter']} | Priority: {issue['priority']} | Status: {issue['status']}")
+        print(f"  Created: {issue['created']} | Updated: {issue['updated']}")
+        print(f"  Description: {issue.get('description', 'N/A')[:200]}...")  # Show first 200 chars
+        if 'comments' in issue:
+            print(f"  Labels: {', '.join(issue['labels']) or '-'} | Components: {', '.join(issue['components']) or '-'}")
+            print(f"  Comments: {len(issue['comments'])} | Links: {len(issue['links'])} "
+                  f"| Attachments: {len(issue['attachments'])}")
+        print(f"  URL: {issue['url']}")
+        print("  " + "-"*50)
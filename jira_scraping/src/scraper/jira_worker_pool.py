@@ -0,0 +1,113 @@
+"""Pool of logged-in browser sessions for fetching issue descriptions."""
+
+import queue
+import threading
+
+from config import settings
+from scraper.jira_extractors import JiraExtractors
+from scraper.instrumentation import log, metrics
+from scraper.jira_utils import JiraUtils
+
+
+class JiraWorkerPool:
+    """Fetches issue descriptions concurrently on extra WebDriver sessions.
+
+    Each worker owns one browser created with the scraper's ``_init_driver``
+    and is signed in by copying the scraper's cookies, so the login flow
+    runs only once per scrape. When the scraper runs on a BrowserPool the
+    pool's worker browsers are borrowed instead and stay open on close().
+    """
+
+    def __init__(self, scraper, workers=settings.DESCRIPTION_WORKERS, retries=settings.DESCRIPTION_RETRIES):
+        self.scraper = scraper
+        self.workers = max(1, workers)
+        self.retries = max(0, retries)
+        self.drivers = []
+
+    def start(self):
+        """Launch the worker browsers and share the scraper's login with them."""
+        if self.scraper.pool is not None:
+            self.drivers = self.scraper.pool.acquire_workers(self.workers)
+            return
+        cookies = self.scraper.driver.get_cookies()
+        for i in range(self.workers):
+            driver = self.scraper._init_driver(self.scraper.headless, profile_name=f"worker-{i+1}")
+            added = JiraUtils.apply_cookies(driver, cookies, self.scraper.base_url)
+            log.info(f"Worker {i+1}/{self.workers} ready ({added} cookies shared)")
+            self.drivers.append(driver)
+
+    def fetch_descriptions(self, issues):
+        """Fill in the description and detail fields of every issue, fetching in parallel."""
+        for _ in self.iter_descriptions(issues):
+            pass
+        return issues
+
+    def iter_descriptions(self, issues):
+        """Fetch descriptions in parallel, yielding each issue as soon as it is done."""
+        if not self.drivers:
+            self.start()
+
+        tasks = queue.Queue()
+        done = queue.Queue()
+        for position, issue in enumerate(issues):
+            tasks.put((position, issue))
+
+        total = len(issues)
+        threads = [
+            threading.Thread(target=self._work, args=(driver, tasks, done, total), daemon=True)
+            for driver in self.drivers
+        ]
+        for thread in threads:
+            thread.start()
+        for _ in range(total):
+            yield self._next_done(done, threads)
+        for thread in threads:
+            thread.join()
+
+    @staticmethod
+    def _next_done(done, threads, poll=1.0):
+        """The next finished issue; raises instead of waiting forever once every worker thread is gone."""
+        while True:
+            try:
+                return done.get(timeout=poll)
+            except queue.Empty:
+                if not any(thread.is_alive() for thread in threads) and done.empty():
+                    raise RuntimeError("Every description worker stopped before the page was done")
+
+    def _work(self, driver, tasks, done, total):
+        """Worker loop: take issues from the queue until it is empty; every issue taken is put on done."""
+        while True:
+            try:
+                position, issue = tasks.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                log.debug("Fetching description for %d/%d: %s", position + 1, total, issue['key'])
+                issue.update(self._fetch_with_retry(driver, issue))
+            except Exception as e:
+                metrics.count("description_errors", source="worker")
+                log.error("ERROR in description worker for %s: %s - %s", issue.get('key'), type(e).__name__, e)
+                issue.update(JiraExtractors.empty_details(JiraExtractors.FETCH_ERROR))
+            finally:
+                done.put(issue)
+
+    def _fetch_with_retry(self, driver, issue):
+        """Fetch one issue's details, retrying on the same worker after a failure."""
+        for attempt in range(1, self.retries + 2):
+            try:
+                return self.scraper._load_and_cache(issue, driver)
+            except Exception as e:
+                metrics.count("description_errors", source="worker")
+                log.warning("ERROR fetching description for %s (attempt %d/%d): %s - %s",
+                            issue['key'], attempt, self.retries + 1, type(e).__name__, e)
+        return JiraExtractors.empty_details(JiraExtractors.FETCH_ERROR)
+
+    def close(self):
+        """Close all worker browsers (borrowed pool browsers are left to the pool)."""
+        if self.scraper.pool is None:
+            for driver in self.drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    continue
+        self.drivers = []
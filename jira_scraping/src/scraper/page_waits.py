@@ -0,0 +1,140 @@
+"""Adaptive page readiness waits shared by the scrapers."""
+
+import threading
+import time
+from collections import deque, namedtuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from scraper.instrumentation import metrics
+
+
+WaitResult = namedtuple("WaitResult", "outcome selector element seconds timeout")
+WaitTiming = namedtuple("WaitTiming", "name outcome seconds timeout")
+
+
+class PageWaiter:
+    """Races candidate selectors and sizes timeouts from observed page latency.
+
+    Every wait has a name (e.g. "description"); the waiter keeps a moving
+    average of how long each named wait takes to succeed and derives the next
+    timeout from it, so slow instances get patience and fast ones fail fast.
+    One waiter can be shared by several browser sessions.
+    """
+
+    # Returns ['match', selector, element] for the first selector with text,
+    # ['empty', selector, null] when a known empty-state marker is present,
+    # or null when the page is not ready yet.
+    RACE_SCRIPT = """
+        const selectors = arguments[0], emptySelectors = arguments[1];
+        for (const selector of selectors) {
+            let elements = [];
+            try { elements = document.querySelectorAll(selector); } catch (e) { continue; }
+            for (const el of elements) {
+                if ((el.innerText || el.textContent || '').trim()) return ['match', selector, el];
+            }
+        }
+        for (const selector of emptySelectors) {
+            try { if (document.querySelector(selector)) return ['empty', selector, null]; } catch (e) {}
+        }
+        return null;
+    """
+
+    def __init__(self, min_timeout=2.0, max_timeout=15.0, latency_factor=4.0,
+                 poll_frequency=0.1, max_backoff=30.0, history=500):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.latency_factor = latency_factor
+        self.poll_frequency = poll_frequency
+        self.max_backoff = max_backoff
+        self.latency = {}  # wait name -> moving average of successful wait time
+        self.timings = deque(maxlen=history)
+        self.lock = threading.Lock()
+
+    def timeout(self, name, max_timeout=None):
+        """Timeout for the next wait called name, based on its observed latency."""
+        ceiling = max_timeout or self.max_timeout
+        latency = self.latency.get(name)
+        if latency is None:
+            return ceiling
+        return min(max(latency * self.latency_factor, self.min_timeout), ceiling)
+
+    def wait_for_any(self, driver, selectors, empty_selectors=(), name="wait", max_timeout=None, adaptive=True):
+        """Wait until any selector matches an element with text, checking all of them each poll.
+
+        Returns a WaitResult whose outcome is 'match', 'empty' (an empty-state
+        marker was found, so there is nothing to wait for) or 'timeout'. With
+        adaptive=False the wait always gets the full max_timeout budget.
+        """
+        timeout = self.timeout(name, max_timeout) if adaptive else max_timeout or self.max_timeout
+        start = time.monotonic()
+        try:
+            found = WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(
+                lambda d: d.execute_script(self.RACE_SCRIPT, list(selectors), list(empty_selectors))
+            )
+            outcome, selector, element = found
+        except TimeoutException:
+            outcome, selector, element = "timeout", None, None
+        seconds = time.monotonic() - start
+        self._record(name, outcome, seconds, timeout)
+        return WaitResult(outcome, selector, element, seconds, timeout)
+
+    def wait_for_document(self, driver, name="document", max_timeout=None):
+        """Wait until the current document has been parsed."""
+        timeout = self.timeout(name, max_timeout)
+        start = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+            )
+            outcome = "match"
+        except TimeoutException:
+            outcome = "timeout"
+        seconds = time.monotonic() - start
+        self._record(name, outcome, seconds, timeout)
+        return WaitResult(outcome, None, None, seconds, timeout)
+
+    def backoff(self, attempt, name=None):
+        """Delay before retry number attempt, scaled by how slow pages have been."""
+        with self.lock:
+            if name in self.latency:
+                base = self.latency[name]
+            elif self.latency:
+                base = sum(self.latency.values()) / len(self.latency)
+            else:
+                base = 1.0
+        return min(self.max_backoff, max(base, 0.5) * 2 ** (attempt - 1))
+
+    def _record(self, name, outcome, seconds, timeout):
+        """Store a timing and fold successful waits into the latency average."""
+        metrics.observe("wait", seconds, wait=name, outcome=outcome)
+        with self.lock:
+            self.timings.append(WaitTiming(name, outcome, seconds, timeout))
+            previous = self.latency.get(name)
+            if outcome != "timeout":
+                self.latency[name] = seconds if previous is None else 0.8 * previous + 0.2 * seconds
+            elif previous is not None:
+                # Timed out: give the next wait more room so a slowdown is not mistaken for absence
+                self.latency[name] = min(previous * 1.5, self.max_timeout)
+
+    def stats(self):
+        """Summarise recorded waits per name: counts by outcome, mean/p95/max seconds and current timeout."""
+        with self.lock:
+            timings = list(self.timings)
+        summary = {}
+        for name in sorted({t.name for t in timings}):
+            seconds = sorted(t.seconds for t in timings if t.name == name)
+            outcomes = {}
+            for t in timings:
+                if t.name == name:
+                    outcomes[t.outcome] = outcomes.get(t.outcome, 0) + 1
+            summary[name] = {
+                "count": len(seconds),
+                "outcomes": outcomes,
+                "mean": sum(seconds) / len(seconds),
+                "p95": seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))],
+                "max": seconds[-1],
+                "next_timeout": self.timeout(name),
+            }
+        return summary
@@ -0,0 +1,313 @@
+"""Per-host request rate limiting with AIMD concurrency control."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from urllib.parse import urlsplit
+
+from config import settings
+from scraper.instrumentation import log, metrics
+
+THROTTLE_STATUSES = (429, 503)
+THROTTLE_TITLES = ("too many requests", "rate limit")
+
+
+class TokenBucket:
+    """Hands out request slots at rate per second with bursts of up to burst requests.
+
+    reserve() never blocks: it takes a token (the balance may go negative)
+    and returns how long the caller has to wait before using it, so the same
+    bucket serves threads and asyncio tasks. pause() holds every request
+    back until a moment in the future, e.g. a server's Retry-After.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now):
+        """Take one token; returns the seconds to wait before the request may start."""
+        self._refill(now)
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def set_rate(self, rate, now):
+        self._refill(now)
+        self.rate = rate
+
+    def pause(self, seconds, now):
+        self.paused_until = max(self.paused_until, now + seconds)
+
+
+class _Ticket:
+    """One admitted request; the caller reports throttling or failures on it."""
+
+    def __init__(self):
+        self.outcome = "ok"
+        self.retry_after = None
+
+    def throttled(self, retry_after=None):
+        self.outcome = "throttled"
+        self.retry_after = retry_after
+
+    def timed_out(self):
+        self.outcome = "timeout"
+
+    def failed(self):
+        self.outcome = "error"
+
+
+class AdaptiveLimiter:
+    """Rate and concurrency limit for one host, tuned with AIMD.
+
+    Every request first waits for a token, then for a concurrency slot.
+    After a full round of successes (one per slot), with latency within
+    latency_tolerance of its long-run average and under a fifth of recent
+    requests failed, whichever limit made requests wait is raised: the
+    rate by rate_step, concurrency by one (additive increase). A 429/503 or
+    a timeout halves both (multiplicative decrease), at most once per
+    cooldown so one wave of rejections counts once, and Retry-After pauses
+    the host.
+    """
+
+    def __init__(self, host, rate=5.0, burst=5, concurrency=4, max_rate=50.0, max_concurrency=16,
+                 min_rate=0.2, rate_step=1.0, latency_tolerance=2.0, cooldown=2.0):
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = concurrency
+        self.max_rate = max_rate
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.rate_step = rate_step
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.successes = 0
+        self.waited_for_token = False
+        self.waited_for_slot = False
+        self.recent = deque(maxlen=20)  # True for every failed request
+        self.fast_latency = None  # quick moving average of request seconds
+        self.slow_latency = None  # long-run moving average
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+        self._publish()
+
+    @property
+    def rate(self):
+        return self.bucket.rate
+
+    def _reserve_token(self):
+        """Take a token; returns the seconds to wait before using it."""
+        with self.condition:
+            wait = self.bucket.reserve(time.monotonic())
+            if wait > 0:
+                self.waited_for_token = True
+            return wait
+
+    def _take_slot(self):
+        """Take a concurrency slot if one is free."""
+        with self.condition:
+            if self.in_flight >= self.concurrency:
+                self.waited_for_slot = True
+                return False
+            self.in_flight += 1
+            self._publish()
+            return True
+
+    def _acquire(self):
+        wait = self._reserve_token()
+        if wait > 0:
+            time.sleep(wait)
+        with self.condition:  # re-entrant: _take_slot takes it again
+            while not self._take_slot():
+                self.condition.wait(1.0)
+
+    async def _acquire_async(self):
+        wait = self._reserve_token()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        while not self._take_slot():
+            await asyncio.sleep(0.05)
+
+    @contextmanager
+    def request(self):
+        """Admit one request; report throttling on the yielded ticket.
+
+        An exception inside the block counts as a timeout when its type name
+        says so, otherwise as an error, and is re-raised.
+        """
+        self._acquire()
+        ticket, start = _Ticket(), time.monotonic()
+        try:
+            yield ticket
+        except Exception as e:
+            _classify(ticket, e)
+            raise
+        finally:
+            self._release(ticket, time.monotonic() - start)
+
+    @asynccontextmanager
+    async def request_async(self):
+        """request() for asyncio code."""
+        await self._acquire_async()
+        ticket, start = _Ticket(), time.monotonic()
+        try:
+            yield ticket
+        except Exception as e:
+            _classify(ticket, e)
+            raise
+        finally:
+            self._release(ticket, time.monotonic() - start)
+
+    def _release(self, ticket, seconds):
+        with self.condition:
+            self.in_flight -= 1
+            self.recent.append(ticket.outcome != "ok")
+            metrics.count("rate_limit_requests", host=self.host, outcome=ticket.outcome)
+            if ticket.outcome in ("throttled", "timeout"):
+                self._decrease(ticket.outcome, ticket.retry_after)
+            elif ticket.outcome == "ok":
+                self._track_latency(seconds)
+                self.successes += 1
+                if self.successes >= self.concurrency and self._healthy():
+                    self._increase()
+            self._publish()
+            self.condition.notify_all()
+
+    def _track_latency(self, seconds):
+        if self.fast_latency is None:
+            self.fast_latency = self.slow_latency = seconds
+        else:
+            self.fast_latency = 0.7 * self.fast_latency + 0.3 * seconds
+            self.slow_latency = 0.98 * self.slow_latency + 0.02 * seconds
+
+    def _healthy(self):
+        if sum(self.recent) * 5 > len(self.recent):
+            return False
+        return self.fast_latency is None or self.fast_latency <= self.slow_latency * self.latency_tolerance
+
+    def _increase(self):
+        # Only a limit that made requests wait is raised; an unused higher limit proves nothing
+        self.successes = 0
+        if self.waited_for_slot:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+        if self.waited_for_token:
+            self.bucket.set_rate(min(self.max_rate, self.rate + self.rate_step), time.monotonic())
+        self.waited_for_token = self.waited_for_slot = False
+
+    def _decrease(self, reason, retry_after):
+        now = time.monotonic()
+        if retry_after:
+            self.bucket.pause(retry_after, now)
+        self.successes = 0
+        if now - self.last_decrease < self.cooldown:
+            return
+        self.last_decrease = now
+        self.concurrency = max(1, self.concurrency // 2)
+        self.bucket.set_rate(max(self.min_rate, self.rate / 2), now)
+        log.info(f"Rate limit {self.host}: {reason}, backing off to {self.rate:.1f} req/s, "
+                 f"{self.concurrency} at once")
+
+    def _publish(self):
+        metrics.gauge("rate_limit_rps", round(self.rate, 3), host=self.host)
+        metrics.gauge("rate_limit_concurrency", self.concurrency, host=self.host)
+        metrics.gauge("rate_limit_in_flight", self.in_flight, host=self.host)
+
+    def snapshot(self):
+        """Current limits and load of this host."""
+        with self.condition:
+            return {
+                "host": self.host,
+                "rate": self.rate,
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "latency": self.fast_latency,
+                "recent_failures": sum(self.recent),
+            }
+
+
+class _Unlimited:
+    """Stand-in limiter used when RATE_LIMIT is off."""
+
+    max_concurrency = None
+
+    @contextmanager
+    def request(self):
+        yield _Ticket()
+
+    @asynccontextmanager
+    async def request_async(self):
+        yield _Ticket()
+
+    def snapshot(self):
+        return {}
+
+
+class RateLimiters:
+    """One AdaptiveLimiter per host, shared by every fetch path of the process."""
+
+    def __init__(self, enabled=True, **options):
+        self.enabled = enabled
+        self.options = options
+        self.limiters = {}
+        self.lock = threading.Lock()
+
+    def for_url(self, url):
+        """The limiter of url's host."""
+        if not self.enabled:
+            return _UNLIMITED
+        host = urlsplit(url).netloc or url
+        with self.lock:
+            limiter = self.limiters.get(host)
+            if limiter is None:
+                limiter = self.limiters[host] = AdaptiveLimiter(host, **self.options)
+            return limiter
+
+    def snapshot(self):
+        """Current rate, concurrency and load of every host."""
+        with self.lock:
+            limiters = list(self.limiters.values())
+        return [limiter.snapshot() for limiter in limiters]
+
+
+def _classify(ticket, error):
+    if "Timeout" in type(error).__name__:
+        ticket.timed_out()
+    else:
+        ticket.failed()
+
+
+def retry_after_seconds(value):
+    """Seconds from a Retry-After header (only the delta-seconds form), or None."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def looks_throttled(title):
+    """True when a page title is a rate-limit error page."""
+    title = (title or "").lower()
+    return any(marker in title for marker in THROTTLE_TITLES)
+
+
+_UNLIMITED = _Unlimited()
+
+rate_limiters = RateLimiters(
+    settings.RATE_LIMIT,
+    rate=settings.RATE_LIMIT_RPS,
+    burst=settings.RATE_LIMIT_BURST,
+    concurrency=settings.RATE_LIMIT_CONCURRENCY,
+    max_rate=settings.RATE_LIMIT_MAX_RPS,
+    max_concurrency=settings.RATE_LIMIT_MAX_CONCURRENCY,
+)
@@ -0,0 +1,138 @@
+"""On-disk cache of fetched issue details, keyed by issue key and `updated` time."""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+class ResponseCache:
+    """Content-addressed cache of issue details and the raw page or JSON they came from.
+
+    An entry's address is a hash of the issue key and its `updated` value,
+    so an edited issue simply misses the cache. Entries also expire after
+    ttl seconds, and the least recently used ones are evicted once the
+    blobs exceed max_bytes. Safe to share between worker threads.
+    """
+
+    def __init__(self, directory, ttl=24 * 3600, max_bytes=512 * 1024 * 1024):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.expired = self.evictions = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite3"), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                digest TEXT PRIMARY KEY,
+                issue_key TEXT NOT NULL,
+                updated TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at)")
+
+    @staticmethod
+    def digest(issue_key, updated):
+        return hashlib.sha256(f"{issue_key}\0{updated}".encode("utf-8")).hexdigest()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, digest[:2], f"{digest}.json.gz")
+
+    def get(self, issue_key, updated):
+        """Return the cached entry dict (details, raw, raw_type) or None."""
+        digest = self.digest(issue_key, updated)
+        with self.lock:
+            row = self.conn.execute("SELECT stored_at FROM entries WHERE digest = ?", (digest,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if time.time() - row[0] > self.ttl:
+                self.expired += 1
+                self.misses += 1
+                self._delete(digest)
+                return None
+            try:
+                with gzip.open(self._blob_path(digest), "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self.misses += 1
+                self._delete(digest)
+                return None
+            self.conn.execute("UPDATE entries SET accessed_at = ? WHERE digest = ?", (time.time(), digest))
+            self.conn.commit()
+            self.hits += 1
+            return entry
+
+    def put(self, issue_key, updated, details, raw=None, raw_type=None):
+        """Store issue details with its raw source, evicting old entries beyond max_bytes."""
+        digest = self.digest(issue_key, updated)
+        path = self._blob_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = gzip.compress(json.dumps({
+            "key": issue_key,
+            "updated": updated,
+            "details": details,
+            "raw": raw,
+            "raw_type": raw_type,
+        }, ensure_ascii=False).encode("utf-8"))
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (digest, issue_key, updated, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (digest, issue_key, updated, len(data), now, now),
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for digest, size in self.conn.execute("SELECT digest, size FROM entries ORDER BY accessed_at").fetchall():
+            self._delete(digest)
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _delete(self, digest):
+        self.conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
+
+    def stats(self):
+        """Hit/miss counters and current size."""
+        with self.lock:
+            entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self):
+        """Close the index."""
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
@@ -0,0 +1,135 @@
+"""Learned selector order: which fallback selector wins per field and site."""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from config import settings
+
+
+class SelectorStats:
+    """Counts wins per selector and field and puts the best selectors first.
+
+    Every field (summary, status, rows, description...) has a fixed
+    fallback list. Each extraction records which selector matched, and
+    ordered() returns the list sorted by smoothed hit rate, so the usual
+    winner is tried first and the rest only run after a miss. Row discovery
+    is only counted, never reordered, as its fallbacks are broader than the
+    selectors they back up. Counts are
+    kept per site and persisted as JSON. save() merges this process's
+    counts into the file while holding a lock on a companion .lock file, so
+    parallel workers do not overwrite each other.
+    """
+
+    def __init__(self, path, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self.site = "default"
+        self.lock = threading.Lock()
+        self.stats = self._load() if enabled else {}
+        self.delta = {}
+
+    def set_site(self, url):
+        """Scope the counts to the host of url (stats differ between Jira instances)."""
+        self.site = urlsplit(url).netloc or url or "default"
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _score(counts):
+        hits, tries = counts
+        return (hits + 1) / (tries + 2)  # an unseen selector scores 0.5
+
+    def ordered(self, field, candidates, key=None):
+        """candidates sorted best first; ties (and unseen selectors) keep their original order."""
+        if not self.enabled:
+            return candidates
+        with self.lock:
+            field_stats = self.stats.get(self.site, {}).get(field)
+            if not field_stats:
+                return candidates
+            scores = [self._score(field_stats.get(key(c) if key else c, (0, 0))) for c in candidates]
+        order = sorted(range(len(candidates)), key=lambda i: -scores[i])
+        return [candidates[i] for i in order]
+
+    def record(self, field, winner, tried):
+        """Record one extraction: every selector in tried was attempted and winner (or None) matched."""
+        if not self.enabled:
+            return
+        with self.lock:
+            for table in (self.stats, self.delta):
+                field_stats = table.setdefault(self.site, {}).setdefault(field, {})
+                for selector in tried:
+                    hits, tries = field_stats.get(selector, (0, 0))
+                    field_stats[selector] = [hits + (selector == winner), tries + 1]
+
+    def save(self):
+        """Add this process's new counts to the file on disk."""
+        if not self.enabled:
+            return
+        with self.lock:
+            if not self.delta:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Another process may be saving too: read, merge and replace the file as one step
+            with _locked(f"{self.path}.lock"):
+                merged = self._load()
+                for site, fields in self.delta.items():
+                    for field, selectors in fields.items():
+                        target = merged.setdefault(site, {}).setdefault(field, {})
+                        for selector, (hits, tries) in selectors.items():
+                            old_hits, old_tries = target.get(selector, (0, 0))
+                            target[selector] = [old_hits + hits, old_tries + tries]
+                temp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(merged, f, indent=1, sort_keys=True)
+                os.replace(temp_path, self.path)
+            self.stats = merged
+            self.delta = {}
+
+    def report(self):
+        """Hit rate per selector for the current site, best first per field."""
+        with self.lock:
+            fields = json.loads(json.dumps(self.stats.get(self.site, {})))
+        return {
+            field: sorted(((selector, hits / tries if tries else 0.0, tries)
+                           for selector, (hits, tries) in selectors.items()), key=lambda row: -row[1])
+            for field, selectors in fields.items()
+        }
+
+
+@contextmanager
+def _locked(path):
+    """Hold an exclusive lock on path (created if missing) across processes."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+selector_stats = SelectorStats(settings.SELECTOR_STATS, settings.SELECTOR_LEARNING)
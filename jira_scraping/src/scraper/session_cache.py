@@ -0,0 +1,113 @@
+"""Encrypted on-disk cache of an authenticated Atlassian browser session."""
+
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # optional dependency
+    Fernet = None
+    InvalidToken = Exception
+
+from scraper.jira_api import JiraApiClient
+from scraper.instrumentation import log
+from scraper.jira_utils import JiraUtils
+
+
+class SessionCache:
+    """Persists cookies and localStorage after login and restores them on the next run.
+
+    The file is encrypted with a Fernet key (SESSION_CACHE_KEY), so the
+    session tokens are never stored in clear text. A restored session is
+    checked with one REST call before it is trusted.
+    """
+
+    # Evaluates to a plain object with every localStorage item of the current page
+    LOCAL_STORAGE_SCRIPT = (
+        "(() => { const items = {};"
+        " for (let i = 0; i < localStorage.length; i++) {"
+        "   const k = localStorage.key(i); items[k] = localStorage.getItem(k);"
+        " }"
+        " return items; })()"
+    )
+
+    def __init__(self, path, key, base_url):
+        self.path = path
+        self.site_url = "{0.scheme}://{0.netloc}".format(urlsplit(base_url))
+        self.fernet = None
+        if key and Fernet is None:
+            log.warning("[WARN] Session cache disabled: install 'cryptography' to enable it")
+        elif key:
+            self.fernet = Fernet(key.encode() if isinstance(key, str) else key)
+
+    @property
+    def enabled(self):
+        """True when a key is configured and encryption is available."""
+        return self.fernet is not None
+
+    def save(self, driver):
+        """Encrypt and store the driver's cookies and localStorage for the Jira site."""
+        if not self.enabled:
+            return
+        if urlsplit(driver.current_url).netloc != urlsplit(self.site_url).netloc:
+            driver.get(self.site_url)
+        self.store(driver.get_cookies(), driver.execute_script("return " + self.LOCAL_STORAGE_SCRIPT))
+
+    def store(self, cookies, local_storage):
+        """Encrypt and store WebDriver-style cookies and a localStorage dict."""
+        if not self.enabled:
+            return
+        session = {"saved_at": time.time(), "cookies": cookies, "local_storage": local_storage}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        token = self.fernet.encrypt(json.dumps(session).encode("utf-8"))
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        log.info(f"[INFO] Session saved to {self.path}")
+
+    def load(self):
+        """Return the decrypted session dict, or None when missing or unreadable."""
+        if not self.enabled or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(self.fernet.decrypt(f.read()))
+        except (InvalidToken, ValueError, OSError) as e:
+            log.warning(f"[WARN] Ignoring unreadable session cache: {type(e).__name__}")
+            return None
+
+    def is_valid(self, session):
+        """Check the cached cookies with a single cheap authenticated request."""
+        client = JiraApiClient(self.site_url, session["cookies"], pool_size=1, timeout=10)
+        try:
+            client.get_json("/rest/api/3/myself")
+            return True
+        except Exception as e:
+            log.info(f"[INFO] Cached session rejected: {type(e).__name__} - {e}")
+            return False
+        finally:
+            client.close()
+
+    def restore(self, driver):
+        """Load a still-valid cached session into driver; True when no login is needed."""
+        session = self.load()
+        if not session or not self.is_valid(session):
+            return False
+
+        JiraUtils.apply_cookies(driver, session["cookies"], self.site_url)
+        driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);",
+            session.get("local_storage") or {},
+        )
+        age = (time.time() - session.get("saved_at", time.time())) / 60
+        log.info(f"[INFO] Restored cached session ({age:.0f} minutes old)")
+        return True
+
+    def clear(self):
+        """Forget the cached session."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,252 @@
+"""Shared work queue and worker loop for sharded multi-project crawls."""
+
+import glob
+import json
+import os
+import shutil
+import socket
+import sqlite3
+import time
+from datetime import datetime
+
+from config import settings
+from scraper.instrumentation import export_metrics, log
+from scraper.jira_scraper import JiraScraper
+from scraper.sinks import DETAIL_COLUMNS, ISSUE_COLUMNS, JsonlSink, SqliteSink
+
+
+class ShardQueue:
+    """A SQLite-backed queue of JQL shards that several processes or hosts can drain.
+
+    Workers claim one pending shard at a time inside an immediate
+    transaction, so a shard is never handed out twice. Each claim is a new
+    attempt; a worker passes its attempt number back with progress, finish
+    and fail, and once the shard was handed to someone else those calls
+    change nothing. Put the file on storage every worker can reach to spread
+    shards over several machines.
+    """
+
+    def __init__(self, path, timeout=30):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS shards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                jql TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                issues INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                started_at REAL,
+                heartbeat_at REAL,
+                finished_at REAL
+            )
+        """)
+
+    def add(self, name, jql):
+        """Queue a shard unless the same JQL is already queued."""
+        self.conn.execute("INSERT OR IGNORE INTO shards (name, jql) VALUES (?, ?)", (name, jql))
+
+    def reset(self):
+        """Forget every shard that is not running, so a new run starts from an empty queue."""
+        return self.conn.execute("DELETE FROM shards WHERE status != 'running'").rowcount
+
+    def claim(self, worker):
+        """Atomically take the next pending shard; returns (id, name, jql, attempt) or None."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT id, name, jql, attempts + 1 FROM shards WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row:
+                now = time.time()
+                self.conn.execute(
+                    "UPDATE shards SET status = 'running', worker = ?, attempts = attempts + 1, "
+                    "issues = 0, error = NULL, started_at = ?, heartbeat_at = ? WHERE id = ?",
+                    (worker, now, now, row[0]),
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return row
+
+    def progress(self, shard_id, issues, attempt=None):
+        """Record how many issues a running shard has produced; False once the attempt lost the shard."""
+        return self._update_running(shard_id, attempt, "issues = ?, heartbeat_at = ?", (issues, time.time()))
+
+    def finish(self, shard_id, issues, attempt=None):
+        """Mark a shard done."""
+        return self._update_running(shard_id, attempt, "status = 'done', issues = ?, finished_at = ?",
+                                    (issues, time.time()))
+
+    def fail(self, shard_id, error, max_attempts=3, attempt=None):
+        """Mark a shard failed, putting it back in the queue while it has attempts left."""
+        return self._update_running(
+            shard_id, attempt,
+            "status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, error = ?, finished_at = ?",
+            (max_attempts, str(error)[:500], time.time()),
+        )
+
+    def _update_running(self, shard_id, attempt, assignments, values):
+        """Update a shard that is still running as the given attempt (any attempt when None)."""
+        cursor = self.conn.execute(
+            f"UPDATE shards SET {assignments} WHERE id = ? AND status = 'running' "
+            "AND (? IS NULL OR attempts = ?)",
+            (*values, shard_id, attempt, attempt),
+        )
+        return cursor.rowcount == 1
+
+    def requeue_stale(self, max_silence):
+        """Put back running shards whose worker has not reported for max_silence seconds.
+
+        A silent worker may still be alive: its next progress() call tells it
+        to stop, and until then it writes to its own attempt's file.
+        """
+        cursor = self.conn.execute(
+            "UPDATE shards SET status = 'pending', error = 'worker went silent' "
+            "WHERE status = 'running' AND heartbeat_at < ?",
+            (time.time() - max_silence,),
+        )
+        return cursor.rowcount
+
+    def requeue_worker(self, worker, max_attempts=3):
+        """Put back the running shards of a worker that died, like fail() does."""
+        cursor = self.conn.execute(
+            "UPDATE shards SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+            "error = 'worker died', finished_at = ? WHERE status = 'running' AND worker = ?",
+            (max_attempts, time.time(), worker),
+        )
+        return cursor.rowcount
+
+    def pending(self):
+        """Number of shards waiting for a worker."""
+        return self.conn.execute("SELECT COUNT(*) FROM shards WHERE status = 'pending'").fetchone()[0]
+
+    def shards(self):
+        """All shards as dicts, in queue order."""
+        cursor = self.conn.execute(
+            "SELECT id, name, jql, status, worker, attempts, issues, error, started_at, finished_at "
+            "FROM shards ORDER BY id"
+        )
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def remaining(self):
+        """Number of shards that are pending or running."""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM shards WHERE status IN ('pending', 'running')"
+        ).fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+
+def shard_output_path(output_dir, shard_id, attempt):
+    """Where a worker writes the issues of one attempt at a shard."""
+    return os.path.join(output_dir, "shards", f"shard-{shard_id:05d}-{attempt}.jsonl")
+
+
+def rotate_shard_outputs(output_dir):
+    """Move the shard files of the previous run to shards.previous, replacing older ones."""
+    current = os.path.join(output_dir, "shards")
+    if not os.path.isdir(current):
+        return
+    previous = os.path.join(output_dir, "shards.previous")
+    shutil.rmtree(previous, ignore_errors=True)
+    os.replace(current, previous)
+
+
+def run_shard_worker(queue_path, output_dir, worker_name=None):
+    """Worker process: claim shards until the queue is empty, scraping each with its own JiraScraper."""
+    worker = worker_name or f"{socket.gethostname()}-{os.getpid()}"
+    # Chrome locks its profile directory, so every worker gets its own
+    if settings.BROWSER_PROFILE_DIR:
+        settings.BROWSER_PROFILE_DIR = os.path.join(settings.BROWSER_PROFILE_DIR, worker)
+
+    queue = ShardQueue(queue_path)
+    scraper = None
+    try:
+        while True:
+            shard = queue.claim(worker)
+            if shard is None:
+                return
+            shard_id, name, jql, attempt = shard
+            log.info(f"[{worker}] {datetime.now():%H:%M:%S} starting shard {name}: {jql}")
+            count, lost = 0, False
+            try:
+                if scraper is None:
+                    scraper = JiraScraper()
+                with JsonlSink(shard_output_path(output_dir, shard_id, attempt)) as sink:
+                    for issue in scraper.iter_issues(jql, flush=sink.flush):
+                        sink.write(issue)
+                        count += 1
+                        if count % 10 == 0 and not queue.progress(shard_id, count, attempt):
+                            lost = True
+                            break
+                error = scraper.last_error
+            except Exception as e:
+                error = e
+
+            if lost:
+                log.warning(f"[{worker}] shard {name} was handed to another worker; stopping this attempt")
+                continue
+            if error is not None:
+                queue.fail(shard_id, error, attempt=attempt)
+                # Start the next shard with a fresh browser
+                if scraper is not None:
+                    scraper.close()
+                    scraper = None
+            else:
+                queue.finish(shard_id, count, attempt)
+            log.info(f"[{worker}] shard {name} ended with {count} issues")
+    finally:
+        if scraper is not None:
+            scraper.close()
+        queue.close()
+        export_metrics(os.path.join(output_dir, "metrics", f"{worker}-{os.path.basename(settings.METRICS_FILE)}"))
+
+
+def merge_shard_outputs(output_dir):
+    """Merge every shard file into one SQLite table and one JSONL file, one row per issue key.
+
+    Both are rebuilt from the shard files each time. When the same issue came
+    from several shards or attempts the most recently updated copy wins.
+    Returns the number of distinct issues.
+    """
+    merged_db = os.path.join(output_dir, "merged.sqlite3")
+    if os.path.exists(merged_db):
+        os.remove(merged_db)
+    with SqliteSink(merged_db, flush_every=500) as sink:
+        for path in sorted(glob.glob(os.path.join(output_dir, "shards", "shard-*.jsonl"))):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        sink.write(json.loads(line))
+                    except ValueError:
+                        continue  # torn last line of a crashed worker
+
+    conn = sqlite3.connect(merged_db)
+    columns = ISSUE_COLUMNS + DETAIL_COLUMNS
+    count = 0
+    try:
+        with open(os.path.join(output_dir, "merged.jsonl"), "w", encoding="utf-8") as out:
+            for row in conn.execute(f"SELECT {', '.join(columns)} FROM issues ORDER BY key"):
+                issue = dict(zip(columns, row))
+                for name in DETAIL_COLUMNS:
+                    if issue[name] is None:
+                        del issue[name]
+                    else:
+                        issue[name] = json.loads(issue[name])
+                out.write(json.dumps(issue, ensure_ascii=False) + "\n")
+                count += 1
+    finally:
+        conn.close()
+    return count
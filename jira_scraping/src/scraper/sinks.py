@@ -0,0 +1,232 @@
+"""Streaming output sinks for scraped issues."""
+
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from config import settings
+from scraper.jira_extractors import JiraExtractors
+from scraper.jira_utils import JiraUtils
+
+ISSUE_COLUMNS = ["key", "url", "summary", "reporter", "priority", "status", "created", "updated", "description"]
+# List-valued fields read from the issue page; tabular sinks store them as JSON text
+DETAIL_COLUMNS = JiraExtractors.DETAIL_FIELDS
+
+
+class IssueSink(ABC):
+    """Receives issues one at a time and writes them out in batches.
+
+    A batch is flushed once flush_every issues are buffered or flush_interval
+    seconds have passed since the last flush, so memory stays bounded and a
+    crash loses at most one batch.
+    """
+
+    def __init__(self, flush_every=100, flush_interval=5.0):
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.written = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, issue):
+        """Buffer one issue, flushing when the batch is full or old enough."""
+        self.buffer.append(issue)
+        if len(self.buffer) >= self.flush_every or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write out everything buffered so far."""
+        if self.buffer:
+            self._write_batch(self.buffer)
+            self.written += len(self.buffer)
+            self.buffer = []
+        self.last_flush = time.monotonic()
+
+    @abstractmethod
+    def _write_batch(self, issues):
+        """Persist a batch of issues."""
+        pass
+
+    def close(self):
+        """Flush remaining issues and release the output."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConsoleSink(IssueSink):
+    """Prints issues as they arrive, in the format of JiraUtils.print_issues."""
+
+    def __init__(self):
+        super().__init__(flush_every=1)
+        print("\n=== Jira Issues ===")
+
+    def _write_batch(self, issues):
+        for issue in issues:
+            JiraUtils.print_issue(issue)
+
+
+class JsonlSink(IssueSink):
+    """Appends one JSON object per line."""
+
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        _ensure_parent(path)
+        self.file = open(path, "a", encoding="utf-8")
+
+    def _write_batch(self, issues):
+        self.file.writelines(json.dumps(issue, ensure_ascii=False) + "\n" for issue in issues)
+        self.file.flush()
+
+    def close(self):
+        super().close()
+        self.file.close()
+
+
+class ParquetSink(IssueSink):
+    """Writes each batch as a Parquet part file in a dataset directory.
+
+    created/updated are stored as timestamps and the detail fields as JSON
+    text. Every part file is complete
+    on its own, so a crash never leaves an unreadable file behind.
+    Needs the optional pyarrow package.
+    """
+
+    def __init__(self, directory, **kwargs):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("ParquetSink needs the 'pyarrow' package") from e
+        super().__init__(**kwargs)
+        self.pa, self.pq = pa, pq
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.prefix = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.parts = 0
+        self.schema = pa.schema(
+            [(name, pa.timestamp("s") if name in ("created", "updated") else pa.string())
+             for name in ISSUE_COLUMNS + DETAIL_COLUMNS]
+        )
+
+    def _write_batch(self, issues):
+        columns = {name: [] for name in ISSUE_COLUMNS + DETAIL_COLUMNS}
+        for issue in issues:
+            for name in ISSUE_COLUMNS:
+                value = issue.get(name)
+                if name in ("created", "updated"):
+                    value = JiraExtractors.parse_date(value)
+                columns[name].append(value)
+            for name in DETAIL_COLUMNS:
+                columns[name].append(_json_or_none(issue.get(name)))
+        table = self.pa.Table.from_pydict(columns, schema=self.schema)
+        self.parts += 1
+        path = os.path.join(self.directory, f"issues-{self.prefix}-{self.parts:05d}.parquet")
+        self.pq.write_table(table, path)
+
+
+class SqliteSink(IssueSink):
+    """Upserts issues into a SQLite table keyed on the issue key.
+
+    An existing row is only replaced by a copy that is at least as recently updated.
+    """
+
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        _ensure_parent(path)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS issues (
+                key TEXT PRIMARY KEY,
+                url TEXT, summary TEXT, reporter TEXT, priority TEXT, status TEXT,
+                created TEXT, updated TEXT, created_ts INTEGER, updated_ts INTEGER,
+                description TEXT, scraped_at TEXT
+            )
+        """)
+        # Databases written before the detail fields existed get the new columns
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(issues)")}
+        for name in DETAIL_COLUMNS:
+            if name not in existing:
+                self.conn.execute(f"ALTER TABLE issues ADD COLUMN {name} TEXT")
+
+    def _write_batch(self, issues):
+        scraped_at = datetime.now().isoformat(timespec="seconds")
+        rows = []
+        for issue in issues:
+            rows.append((
+                *(issue.get(name) for name in ISSUE_COLUMNS[:-1]),
+                JiraExtractors.parse_epoch(issue.get("created")),
+                JiraExtractors.parse_epoch(issue.get("updated")),
+                issue.get("description"),
+                scraped_at,
+                *(_json_or_none(issue.get(name)) for name in DETAIL_COLUMNS),
+            ))
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO issues (key, url, summary, reporter, priority, status, created, updated,
+                                    created_ts, updated_ts, description, scraped_at,
+                                    comments, labels, components, links, attachments)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    url = excluded.url, summary = excluded.summary, reporter = excluded.reporter,
+                    priority = excluded.priority, status = excluded.status,
+                    created = excluded.created, updated = excluded.updated,
+                    created_ts = excluded.created_ts, updated_ts = excluded.updated_ts,
+                    description = excluded.description, scraped_at = excluded.scraped_at,
+                    comments = excluded.comments, labels = excluded.labels, components = excluded.components,
+                    links = excluded.links, attachments = excluded.attachments
+                WHERE issues.updated_ts IS NULL OR excluded.updated_ts IS NULL
+                    OR excluded.updated_ts >= issues.updated_ts
+            """, rows)
+
+    def close(self):
+        super().close()
+        self.conn.close()
+
+
+def build_sinks(spec, output_dir, flush_every=100, flush_interval=5.0):
+    """Create sinks from a comma separated spec such as "console,jsonl,sqlite:out/issues.db".
+
+    Each entry is a sink name with an optional ":path"; without a path the
+    sink writes to a default file in output_dir.
+    """
+    defaults = {
+        "jsonl": os.path.join(output_dir, "issues.jsonl"),
+        "parquet": os.path.join(output_dir, "issues.parquet"),
+        "sqlite": os.path.join(output_dir, "issues.sqlite3"),
+        "chunks": os.path.join(output_dir, "chunks.jsonl"),
+    }
+    classes = {"jsonl": JsonlSink, "parquet": ParquetSink, "sqlite": SqliteSink}
+    sinks = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, path = entry.partition(":")
+        name = name.lower()
+        if name == "console":
+            sinks.append(ConsoleSink())
+        elif name == "chunks":
+            from scraper.chunking import ChunkSink  # chunking builds on this module
+            sinks.append(ChunkSink(path or defaults[name], settings.CHUNK_WORKERS, settings.CHUNK_MAX_TOKENS,
+                                   settings.CHUNK_OVERLAP, settings.CHUNK_DEDUP_THRESHOLD, settings.CHUNK_ENCODING,
+                                   flush_every=flush_every, flush_interval=flush_interval))
+        elif name in classes:
+            sinks.append(classes[name](path or defaults[name], flush_every=flush_every, flush_interval=flush_interval))
+        else:
+            raise ValueError(f"Unknown output sink: {name}")
+    return sinks
+
+
+def _ensure_parent(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _json_or_none(value):
+    return None if value is None else json.dumps(value, ensure_ascii=False)
@@ -0,0 +1,32 @@
+"""Shared fixtures: import paths, the local Jira fixture server and a REST client for it."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "src"), os.path.join(ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from fixture_server import JiraFixtureServer  # noqa: E402
+from scraper.jira_api import JiraApiClient  # noqa: E402
+from scraper.rate_limit import rate_limiters  # noqa: E402
+
+ISSUE_COUNT = 120
+
+
+@pytest.fixture(scope="session")
+def jira_server():
+    with JiraFixtureServer(issue_count=ISSUE_COUNT) as server:
+        yield server
+
+
+@pytest.fixture
+def api(jira_server, monkeypatch):
+    # The shared limiter would pace the tests like a real crawl
+    monkeypatch.setattr(rate_limiters, "enabled", False)
+    client = JiraApiClient(jira_server.base_url, cookies=[{"name": "session", "value": "test"}], pool_size=2)
+    yield client
+    client.close()
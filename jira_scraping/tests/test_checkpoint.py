@@ -0,0 +1,48 @@
+import os
+import time
+
+from scraper.checkpoint import CrawlCheckpoint
+
+ISSUES = [{"key": f"A-{n}"} for n in range(1, 5)]
+
+
+def test_a_resumed_crawl_sees_what_is_pending_and_where_listing_stopped(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path), "project = A")
+    checkpoint.begin('(project = A) AND updated >= "2025/03/04 05:06"')
+    checkpoint.record_page(ISSUES[:2], 2)
+    checkpoint.record_page(ISSUES[2:], 4)
+    checkpoint.record_completed(ISSUES[:3])
+    checkpoint.close()
+
+    resumed = CrawlCheckpoint(str(tmp_path), "project = A")
+
+    assert resumed.exists and not resumed.finished
+    assert resumed.query == '(project = A) AND updated >= "2025/03/04 05:06"'
+    assert resumed.discovered() == (ISSUES, 4)
+    assert resumed.pending() == ISSUES[3:]
+
+
+def test_finish_keeps_the_checkpoint_and_begin_starts_over(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path), "project = A")
+    checkpoint.begin("project = A")
+    checkpoint.record_page(ISSUES, None)
+
+    checkpoint.finish()
+    assert checkpoint.finished and checkpoint.pending() == ISSUES
+
+    checkpoint.begin("project = A")
+    assert not checkpoint.exists and not checkpoint.finished
+
+
+def test_prune_removes_only_untouched_checkpoints(tmp_path):
+    old, fresh = CrawlCheckpoint(str(tmp_path), "project = A"), CrawlCheckpoint(str(tmp_path), "project = B")
+    for checkpoint in (old, fresh):
+        checkpoint.begin(checkpoint.jql)
+        checkpoint.record_page(ISSUES, 4)
+    long_ago = time.time() - 3600
+    for path in (old.directory, old.crawl_path, old.pages_path):
+        os.utime(path, (long_ago, long_ago))
+
+    assert CrawlCheckpoint.prune(str(tmp_path), 600) == 1
+    assert not old.exists and fresh.exists
+    assert CrawlCheckpoint.prune(str(tmp_path), 0) == 0
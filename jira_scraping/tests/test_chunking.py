@@ -0,0 +1,52 @@
+from scraper.chunking import NearDuplicateIndex, minhash_signature, split_text
+
+TEXT = ("The description renders after the page loads, so the scraper waits for the first "
+        "paragraph before it reads the comments, the labels and the attachments of the issue.")
+
+
+def test_near_duplicate_is_reported_against_the_first_key():
+    index = NearDuplicateIndex(threshold=0.8)
+
+    assert index.add("A-1", minhash_signature(TEXT)) is None
+    assert index.add("A-2", minhash_signature(TEXT + " Thanks!")) == "A-1"
+    assert index.add("A-3", minhash_signature(TEXT)) == "A-1"
+
+
+def test_unrelated_texts_are_not_duplicates():
+    index = NearDuplicateIndex(threshold=0.8)
+    other = "Login fails with a timeout when the verification step shows a second button on the page today."
+
+    index.add("A-1", minhash_signature(TEXT))
+
+    assert index.add("A-2", minhash_signature(other)) is None
+
+
+def test_a_key_is_never_its_own_duplicate():
+    index = NearDuplicateIndex(threshold=0.8)
+    signature = minhash_signature(TEXT)
+
+    assert index.add("A-1", signature) is None
+    assert index.add("A-1", signature) is None
+    assert index.add("A-2", signature) == "A-1"
+
+
+def test_a_repeated_key_replaces_its_old_signature():
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("A-1", minhash_signature(TEXT))
+
+    index.add("A-1", minhash_signature("A completely rewritten description about exporting "
+                                       "reports as spreadsheets every Monday morning for finance."))
+
+    assert index.add("A-2", minhash_signature(TEXT)) is None
+
+
+def test_short_texts_get_no_signature():
+    assert minhash_signature("N/A") is None
+
+
+def test_split_text_overlaps_windows():
+    words = " ".join(f"w{i}" for i in range(10))
+
+    assert split_text(words, max_tokens=4, overlap=1) == [
+        ("w0 w1 w2 w3", 4), ("w3 w4 w5 w6", 4), ("w6 w7 w8 w9", 4),
+    ]
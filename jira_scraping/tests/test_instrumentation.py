@@ -0,0 +1,22 @@
+from scraper.instrumentation import Metrics
+
+
+def test_prometheus_export_gives_every_family_one_header():
+    metrics = Metrics()
+    metrics.count("webdriver_commands", command="get")
+    metrics.observe("wait", 0.5, wait="description", outcome="match")
+    metrics.observe("wait", 1.5, wait="issue list", outcome="timeout")
+
+    lines = metrics.to_prometheus().splitlines()
+
+    assert [line for line in lines if line.startswith("# TYPE")] == [
+        "# TYPE jira_scraper_webdriver_commands_total counter",
+        "# TYPE jira_scraper_wait_seconds summary",
+        "# TYPE jira_scraper_wait_seconds_max gauge",
+    ]
+    max_header = lines.index("# TYPE jira_scraper_wait_seconds_max gauge")
+    assert all("_seconds_max" not in line for line in lines[:max_header] if not line.startswith("#"))
+    assert lines[max_header + 1:] == [
+        'jira_scraper_wait_seconds_max{outcome="match",wait="description"} 0.500000',
+        'jira_scraper_wait_seconds_max{outcome="timeout",wait="issue list"} 1.500000',
+    ]
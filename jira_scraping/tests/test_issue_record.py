@@ -0,0 +1,26 @@
+from scraper.issue_record import IssueBatch, IssueRecord
+
+
+def issue(number, **fields):
+    return dict({"key": f"ABC-{number}", "url": f"/browse/ABC-{number}", "summary": "N/A", "reporter": "N/A",
+                 "priority": "High", "status": "Open", "created": "N/A", "updated": "N/A"}, **fields)
+
+
+def test_records_sort_by_key_number_and_hash_by_key():
+    records = [IssueRecord.from_dict(issue(n)) for n in (10, 9, 100)]
+
+    assert [r.key for r in sorted(records)] == ["ABC-9", "ABC-10", "ABC-100"]
+    assert {IssueRecord.from_dict(issue(9)), records[1]} == {records[1]}
+
+
+def test_a_batch_keeps_more_distinct_values_than_fit_in_16_bits():
+    batch = IssueBatch(issue(n, reporter=f"user {n}") for n in range(70000))
+
+    assert batch.value("reporter", 69999) == "user 69999"
+    assert len(batch.filter(reporter="user 65536")) == 1
+
+
+def test_round_trip_through_a_batch():
+    original = issue(1, updated="Mar 2, 2025, 1:00 PM", description="Text", labels=["a"])
+
+    assert IssueBatch([original])[0].to_dict() == dict(original, summary="N/A", created="N/A")
@@ -0,0 +1,122 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from conftest import ISSUE_COUNT
+from fixture_server import FixtureIssue
+from scraper.jira_api import JiraApiClient, JiraApiError
+
+
+def test_search_returns_one_page_and_the_total(api):
+    issues, total = api.search("project = BENCH", 0, 50)
+
+    assert total == ISSUE_COUNT
+    assert [issue["key"] for issue in issues] == [f"BENCH-{n}" for n in range(120, 70, -1)]
+
+
+def test_search_pages_through_every_issue(api):
+    keys, start_at = [], 0
+    while True:
+        issues, total = api.search("project = BENCH", start_at, 50)
+        if not issues:
+            break
+        keys.extend(issue["key"] for issue in issues)
+        start_at += len(issues)
+
+    assert len(keys) == len(set(keys)) == total
+
+
+def test_search_maps_fields_like_the_row_extractors(api, jira_server):
+    issue = api.search("project = BENCH", 0, 1)[0][0]
+    expected = FixtureIssue(ISSUE_COUNT)
+
+    assert issue == {
+        "key": expected.key,
+        "url": f"{jira_server.base_url}/browse/{expected.key}",
+        "summary": expected.summary,
+        "reporter": expected.reporter,
+        "priority": expected.priority,
+        "status": expected.status,
+        "created": FixtureIssue.display_date(expected.created),
+        "updated": FixtureIssue.display_date(expected.updated),
+    }
+
+
+def test_fetch_details_reads_every_detail_field(api, jira_server):
+    expected = FixtureIssue(20)  # has comments, labels, a link and an attachment
+
+    details = api.fetch_details(expected.key)
+
+    assert details["description"].split("\n")[:len(expected.paragraphs)] == [p.strip() for p in expected.paragraphs]
+    assert [(c["author"], c["body"]) for c in details["comments"]] == [(a, b) for a, _, b in expected.comments]
+    assert details["labels"] == expected.labels
+    assert details["components"] == expected.components
+    assert details["links"] == [{"relation": "blocks", "key": "BENCH-19",
+                                 "url": f"{jira_server.base_url}/browse/BENCH-19"}]
+    assert [a["name"] for a in details["attachments"]] == expected.attachments
+
+
+def test_fetch_details_keeps_code_blocks(api):
+    expected = FixtureIssue(7)
+
+    assert api.fetch_details(expected.key)["description"].endswith(expected.code)
+
+
+def test_fetch_details_with_raw_returns_the_json_text(api):
+    details, raw = api.fetch_details("BENCH-3", with_raw=True)
+
+    assert '"key": "BENCH-3"' in raw
+    assert details == api.to_details(json.loads(raw))
+
+
+def test_fetch_details_of_a_missing_issue_raises(api):
+    with pytest.raises(JiraApiError) as error:
+        api.fetch_details("BENCH-9999")
+
+    assert error.value.status == 404
+
+
+def test_to_issue_fills_missing_fields_with_na():
+    client = JiraApiClient("https://example.atlassian.net/jira/software/projects/ABC")
+
+    issue = client.to_issue({"key": "ABC-1", "fields": {"summary": None, "reporter": None}})
+
+    assert issue["url"] == "https://example.atlassian.net/browse/ABC-1"
+    assert [issue[name] for name in ("summary", "reporter", "priority", "status", "created", "updated")] == ["N/A"] * 6
+
+
+def test_adf_to_text_flattens_blocks_and_inline_nodes():
+    doc = {"type": "doc", "content": [
+        {"type": "heading", "content": [{"type": "text", "text": "Title"}]},
+        {"type": "paragraph", "content": [
+            {"type": "text", "text": "Hello "},
+            {"type": "mention", "attrs": {"text": "@Ada"}},
+            {"type": "hardBreak"},
+            {"type": "text", "text": "next line"},
+        ]},
+        {"type": "bulletList", "content": [
+            {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "one"}]}]},
+            {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "two"}]}]},
+        ]},
+        {"type": "paragraph", "content": []},
+    ]}
+
+    assert JiraApiClient.adf_to_text(doc) == "Title\nHello @Ada\nnext line\none\ntwo"
+
+
+def test_adf_to_text_accepts_empty_and_plain_values():
+    assert JiraApiClient.adf_to_text(None) == ""
+    assert JiraApiClient.adf_to_text("plain text") == "plain text"
+
+
+def test_format_date_matches_the_issue_list():
+    assert JiraApiClient.format_date("2025-10-03T16:15:00.000+0000") == "Oct 3, 2025, 4:15 PM"
+    assert JiraApiClient.format_date("2025-01-01T00:05:00.000+0200") == "Jan 1, 2025, 12:05 AM"
+    assert JiraApiClient.format_date(FixtureIssue.api_date(datetime(2025, 2, 9, 9, 0).astimezone())) == \
+        "Feb 9, 2025, 9:00 AM"
+
+
+def test_format_date_passes_other_values_through():
+    assert JiraApiClient.format_date(None) == "N/A"
+    assert JiraApiClient.format_date("yesterday") == "yesterday"
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from scraper.jira_state import JiraStateStore
+from scraper.jira_utils import JiraUtils
+
+SINCE = datetime(2025, 3, 4, 5, 6)
+
+
+def test_narrow_jql_keeps_the_order_by_clause():
+    assert JiraUtils.narrow_jql('project = "ABC" ORDER BY created DESC', SINCE) == \
+        '(project = "ABC") AND updated >= "2025/03/04 05:06" ORDER BY created DESC'
+
+
+def test_narrow_jql_of_an_order_only_query():
+    assert JiraUtils.narrow_jql("order by updated", SINCE) == 'updated >= "2025/03/04 05:06" order by updated'
+
+
+def test_narrow_jql_without_order_by():
+    assert JiraUtils.narrow_jql("assignee = currentUser() OR reporter = currentUser()", SINCE) == \
+        '(assignee = currentUser() OR reporter = currentUser()) AND updated >= "2025/03/04 05:06"'
+
+
+def test_watermark_before_without_failures_keeps_the_watermark():
+    assert JiraStateStore.watermark_before([], SINCE) == SINCE
+
+
+def test_watermark_before_moves_back_to_the_oldest_failure():
+    failed = [{"updated": "Mar 2, 2025, 1:00 PM"}, {"updated": "Mar 3, 2025, 9:30 AM"}]
+
+    assert JiraStateStore.watermark_before(failed, SINCE) == datetime(2025, 3, 2, 13, 0)
+
+
+def test_watermark_before_ignores_failures_newer_than_the_watermark():
+    assert JiraStateStore.watermark_before([{"updated": "Mar 9, 2025, 1:00 PM"}], SINCE) == SINCE
+
+
+def test_watermark_before_gives_up_when_a_failure_has_no_date():
+    assert JiraStateStore.watermark_before([{"updated": "N/A"}], SINCE) is None
+
+
+def test_state_store_records_synced_versions(tmp_path):
+    store = JiraStateStore(str(tmp_path / "state.sqlite3"))
+    issue = {"key": "ABC-1", "updated": "Mar 2, 2025, 1:00 PM"}
+    try:
+        assert store.has_changed(issue)
+        store.record(issue)
+        assert not store.has_changed(issue)
+        assert store.has_changed(dict(issue, updated="Mar 3, 2025, 1:00 PM"))
+
+        store.set_watermark("project = ABC", SINCE)
+        assert store.watermark("project = ABC") == SINCE
+        assert store.watermark("project = XYZ") is None
+    finally:
+        store.close()
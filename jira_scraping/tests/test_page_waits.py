@@ -0,0 +1,32 @@
+from scraper.page_waits import PageWaiter
+
+
+class SlowPage:
+    """Stands in for a driver whose description renders after a delay."""
+
+    def __init__(self, ready_after):
+        self.calls = 0
+        self.ready_after = ready_after
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return ["match", "p", None] if self.calls > self.ready_after else None
+
+
+def test_timeout_follows_the_observed_latency():
+    waiter = PageWaiter(min_timeout=2.0, max_timeout=15.0, latency_factor=4.0)
+    waiter.latency["description"] = 0.1
+
+    assert waiter.timeout("description") == 2.0
+    assert waiter.timeout("issue list") == 15.0
+
+
+def test_a_fixed_wait_gets_the_full_budget():
+    waiter = PageWaiter(min_timeout=0.01, poll_frequency=0.01)
+    waiter.latency["issue list"] = 0.001
+
+    adaptive = waiter.wait_for_any(SlowPage(ready_after=1000), ["p"], name="issue list", max_timeout=1)
+    fixed = waiter.wait_for_any(SlowPage(ready_after=5), ["p"], name="issue list", max_timeout=1, adaptive=False)
+
+    assert (adaptive.outcome, fixed.outcome) == ("timeout", "match")
+    assert fixed.timeout == 1
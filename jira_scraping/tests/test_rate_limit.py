@@ -0,0 +1,118 @@
+import pytest
+
+from scraper.rate_limit import AdaptiveLimiter, RateLimiters, TokenBucket, looks_throttled, retry_after_seconds
+
+
+def test_token_bucket_allows_a_burst_then_paces_at_the_rate():
+    bucket = TokenBucket(rate=2.0, burst=3)
+    now = bucket.updated
+
+    assert [bucket.reserve(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve(now) == pytest.approx(0.5)
+    assert bucket.reserve(now) == pytest.approx(1.0)
+
+
+def test_token_bucket_refills_up_to_the_burst():
+    bucket = TokenBucket(rate=1.0, burst=2)
+    now = bucket.updated
+    bucket.reserve(now)
+    bucket.reserve(now)
+
+    assert bucket.reserve(now + 100) == 0.0
+    assert bucket.reserve(now + 100) == 0.0
+    assert bucket.reserve(now + 100) == pytest.approx(1.0)
+
+
+def test_token_bucket_pause_holds_requests_back():
+    bucket = TokenBucket(rate=10.0, burst=10)
+    now = bucket.updated
+    bucket.pause(30, now)
+
+    assert bucket.reserve(now) == pytest.approx(30)
+
+
+def test_throttled_request_halves_rate_and_concurrency():
+    limiter = AdaptiveLimiter("jira.test", rate=8.0, concurrency=4)
+
+    with limiter.request() as ticket:
+        ticket.throttled()
+
+    assert (limiter.rate, limiter.concurrency, limiter.in_flight) == (4.0, 2, 0)
+
+
+def test_a_wave_of_rejections_within_the_cooldown_counts_once():
+    limiter = AdaptiveLimiter("jira.test", rate=8.0, concurrency=4, cooldown=60)
+
+    for _ in range(3):
+        with limiter.request() as ticket:
+            ticket.throttled()
+
+    assert (limiter.rate, limiter.concurrency) == (4.0, 2)
+
+
+def test_decrease_never_goes_below_the_floor():
+    limiter = AdaptiveLimiter("jira.test", rate=0.3, concurrency=1, min_rate=0.2, cooldown=0)
+
+    for _ in range(3):
+        with limiter.request() as ticket:
+            ticket.throttled()
+
+    assert (limiter.rate, limiter.concurrency) == (0.2, 1)
+
+
+def test_timeout_exceptions_count_as_timeouts_and_propagate():
+    limiter = AdaptiveLimiter("jira.test", rate=8.0, concurrency=4)
+
+    class ReadTimeoutError(Exception):
+        pass
+
+    with pytest.raises(ReadTimeoutError):
+        with limiter.request():
+            raise ReadTimeoutError()
+
+    assert (limiter.rate, limiter.in_flight) == (4.0, 0)
+
+
+def test_other_errors_do_not_back_off():
+    limiter = AdaptiveLimiter("jira.test", rate=8.0, concurrency=4)
+
+    with pytest.raises(ValueError):
+        with limiter.request():
+            raise ValueError()
+
+    assert (limiter.rate, limiter.concurrency) == (8.0, 4)
+    assert limiter.snapshot()["recent_failures"] == 1
+
+
+def test_only_the_limit_that_made_requests_wait_is_raised():
+    limiter = AdaptiveLimiter("jira.test", rate=5.0, burst=1, concurrency=1, latency_tolerance=1e9)
+
+    for _ in range(2):  # the second request waits for a token, never for a slot
+        with limiter.request():
+            pass
+
+    assert limiter.rate == 6.0
+    assert limiter.concurrency == 1
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds("12") == 12.0
+    assert retry_after_seconds("-3") == 0.0
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") is None
+    assert retry_after_seconds(None) is None
+
+
+def test_looks_throttled():
+    assert looks_throttled("429 Too Many Requests")
+    assert not looks_throttled("[ABC-1] Rate the limit of widgets")
+    assert not looks_throttled(None)
+
+
+def test_rate_limiters_share_one_limiter_per_host():
+    limiters = RateLimiters(rate=1.0)
+
+    first = limiters.for_url("https://a.atlassian.net/browse/A-1")
+
+    assert limiters.for_url("https://a.atlassian.net/rest/api/3/search") is first
+    assert limiters.for_url("https://b.atlassian.net/") is not first
+    assert RateLimiters(enabled=False).for_url("https://a.atlassian.net").snapshot() == {}
@@ -0,0 +1,31 @@
+import json
+import multiprocessing
+
+from scraper.selector_stats import SelectorStats
+
+
+def _save_wins(path, rounds):
+    for _ in range(rounds):
+        stats = SelectorStats(path)
+        stats.record("description", "p.first", ["p.first", "p.second"])
+        stats.save()
+
+
+def test_ordered_puts_the_usual_winner_first(tmp_path):
+    stats = SelectorStats(str(tmp_path / "stats.json"))
+    for _ in range(3):
+        stats.record("description", "p.second", ["p.first", "p.second"])
+
+    assert stats.ordered("description", ["p.first", "p.second", "p.third"]) == ["p.second", "p.third", "p.first"]
+
+
+def test_concurrent_saves_from_several_processes_lose_no_counts(tmp_path):
+    path = str(tmp_path / "stats.json")
+    workers = [multiprocessing.Process(target=_save_wins, args=(path, 20)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["default"]["description"] == {"p.first": [80, 80], "p.second": [0, 80]}
@@ -0,0 +1,124 @@
+import json
+import os
+import time
+
+import pytest
+
+from scraper.sharding import ShardQueue, merge_shard_outputs, rotate_shard_outputs, shard_output_path
+
+
+@pytest.fixture
+def queue(tmp_path):
+    shards = ShardQueue(str(tmp_path / "shards.sqlite3"))
+    yield shards
+    shards.close()
+
+
+def test_claim_hands_out_shards_in_order_once(queue):
+    queue.add("A", "project = A")
+    queue.add("B", "project = B")
+    queue.add("A again", "project = A")  # same JQL: ignored
+
+    assert queue.claim("w1")[1:] == ("A", "project = A", 1)
+    assert queue.claim("w2")[1:] == ("B", "project = B", 1)
+    assert queue.claim("w3") is None
+    assert queue.remaining() == 2
+
+
+def test_claim_is_atomic_across_connections(queue):
+    other = ShardQueue(queue.path)
+    try:
+        queue.add("A", "project = A")
+
+        claims = [queue.claim("w1"), other.claim("w2")]
+
+        assert sum(claim is not None for claim in claims) == 1
+    finally:
+        other.close()
+
+
+def test_finished_and_failed_shards(queue):
+    queue.add("A", "project = A")
+    queue.add("B", "project = B")
+    a, b = queue.claim("w1"), queue.claim("w1")
+
+    queue.finish(a[0], 10)
+    queue.fail(b[0], "boom", max_attempts=1)
+
+    assert [(s["status"], s["issues"], s["error"]) for s in queue.shards()] == [("done", 10, None), ("failed", 0, "boom")]
+    assert queue.remaining() == 0
+
+
+def test_failed_shard_is_retried_while_it_has_attempts(queue):
+    queue.add("A", "project = A")
+    queue.fail(queue.claim("w1")[0], "boom", max_attempts=2)
+
+    assert queue.claim("w2")[1:] == ("A", "project = A", 2)
+
+
+def test_requeue_stale_only_puts_back_silent_shards(queue):
+    queue.add("A", "project = A")
+    queue.add("B", "project = B")
+    a, b = queue.claim("w1"), queue.claim("w2")
+    queue.conn.execute("UPDATE shards SET heartbeat_at = ? WHERE id = ?", (time.time() - 600, a[0]))
+
+    assert queue.requeue_stale(300) == 1
+    assert [s["status"] for s in queue.shards()] == ["pending", "running"]
+    assert queue.claim("w3")[0] == a[0]
+
+
+def test_an_attempt_that_lost_its_shard_changes_nothing(queue):
+    queue.add("A", "project = A")
+    first = queue.claim("w1")
+    queue.requeue_stale(-1)  # w1 went silent but is still alive
+    second = queue.claim("w2")
+
+    assert not queue.progress(first[0], 10, first[3])
+    assert not queue.finish(first[0], 10, first[3])
+    assert queue.progress(second[0], 5, second[3])
+    assert [(s["status"], s["worker"], s["issues"]) for s in queue.shards()] == [("running", "w2", 5)]
+    assert shard_output_path("out", first[0], first[3]) != shard_output_path("out", second[0], second[3])
+
+
+def test_requeue_worker_puts_back_the_shards_of_a_dead_worker(queue):
+    queue.add("A", "project = A")
+    queue.add("B", "project = B")
+    queue.claim("w1")
+    queue.claim("w2")
+
+    assert queue.requeue_worker("w1") == 1
+    assert [s["status"] for s in queue.shards()] == ["pending", "running"]
+    assert queue.pending() == 1
+
+
+def test_reset_forgets_the_previous_run_but_not_running_shards(queue):
+    for key in "ABC":
+        queue.add(key, f"project = {key}")
+    a, b = queue.claim("w1"), queue.claim("w1")
+    queue.finish(a[0], 3, a[3])
+
+    assert queue.reset() == 2
+    queue.add("A", "project = A")
+    assert [(s["name"], s["status"]) for s in queue.shards()] == [("B", "running"), ("A", "pending")]
+
+
+def test_merge_rebuilds_from_the_current_shard_files_only(tmp_path):
+    output = str(tmp_path)
+
+    def write_shard(shard_id, attempt, *issues):
+        path = shard_output_path(output, shard_id, attempt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(issue) + "\n" for issue in issues)
+
+    old = {"key": "OLD-1", "updated": "Mar 2, 2025, 1:00 PM"}
+    write_shard(1, 1, old)
+    assert merge_shard_outputs(output) == 1
+
+    rotate_shard_outputs(output)
+    write_shard(2, 1, {"key": "A-1", "summary": "first", "updated": "Mar 2, 2025, 1:00 PM"})
+    write_shard(2, 2, {"key": "A-1", "summary": "second", "updated": "Mar 3, 2025, 1:00 PM"})
+
+    assert merge_shard_outputs(output) == 1
+    with open(os.path.join(output, "merged.jsonl"), encoding="utf-8") as f:
+        assert [(issue["key"], issue["summary"]) for issue in map(json.loads, f)] == [("A-1", "second")]